@@ -9,6 +9,9 @@ from scs_tools.commands.init import init
 from scs_tools.commands.add import add
 from scs_tools.commands.bundle import bundle
 from scs_tools.commands.validate import validate
+from scs_tools.commands.compile import compile_context
+from scs_tools.commands.status import status
+from scs_tools.commands.context_for import context_for
 
 
 @click.group()
@@ -37,6 +40,7 @@ def cli():
         3. Edit SCDs in context/project/    → (manual editing)
         4. Validate before versioning       → scs validate / scs bundle validate
         5. Create immutable version         → scs bundle version
+        6. Refresh AI assistant context     → scs compile
 
     For detailed help on any command, use: scs [command] --help
     Documentation: https://github.com/SCS-Labs/scs-cli
@@ -50,6 +54,9 @@ cli.add_command(init)
 cli.add_command(add)
 cli.add_command(bundle)
 cli.add_command(validate)
+cli.add_command(compile_context)
+cli.add_command(status)
+cli.add_command(context_for)
 
 
 if __name__ == "__main__":
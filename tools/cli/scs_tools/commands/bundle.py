@@ -6,9 +6,32 @@ from pathlib import Path
 import yaml
 import click
 import hashlib
+import json
+import os
+import re
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from scs_validator.discovery import is_version_artifact
+from scs_validator.utils import ValidationError
+from scs_tools.utils.bundle_graph import (
+    find_project_root,
+    index_scd_files,
+    load_bundle_graph,
+    load_document,
+)
+from scs_tools.utils.canonical import canonical_digest
 from scs_tools.utils.files import get_template_path
+from scs_tools.utils.merkle import (
+    HASH_ALGORITHM,
+    DigestCache,
+    compute_merkle_tree,
+    hash_leaves,
+    verify_merkle,
+)
+from scs_tools.utils.object_store import ObjectStore
+from scs_tools.utils.version_diff import diff_versions
 from scs_tools.utils.project_types import SOFTWARE_DEVELOPMENT_CONCERNS, PROJECT_TYPES
 
 
@@ -88,6 +111,9 @@ def list(available):
     if domains_dir.exists():
         click.echo("Domain bundles:\n")
         for bundle_file in sorted(domains_dir.glob("*.yaml")):
+            # Skip the snapshots and manifests written by `scs bundle version`
+            if is_version_artifact(bundle_file):
+                continue
             with open(bundle_file, 'r') as f:
                 data = yaml.safe_load(f)
                 bundle_id = data.get('id', 'unknown')
@@ -215,9 +241,16 @@ def validate():
 @click.option(
     "--bundle",
     "-b",
-    type=click.Path(exists=True),
-    default="bundles/project-bundle.yaml",
-    help="Path to bundle file to version",
+    "bundles",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to bundle file to version (repeatable; default: bundles/project-bundle.yaml)",
+)
+@click.option(
+    "--all",
+    "all_bundles",
+    is_flag=True,
+    help="Version every bundle under bundles/ (project, meta, standards, domains, concerns)",
 )
 @click.option(
     "--version",
@@ -250,14 +283,24 @@ def validate():
     is_flag=True,
     help="Overwrite existing versioned bundle if it exists",
 )
-def version(bundle, version_number, approved_by, notes, no_git, no_validate, force):
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="With several bundles, number of bundles versioned in parallel",
+)
+def version(
+    bundles, all_bundles, version_number, approved_by, notes, no_git, no_validate, force, jobs
+):
     """
     Create a versioned, immutable snapshot of a validated bundle
 
     This command automates Phase 3 (Version) of the SCS workflow by:
     1. Validating the bundle (unless --no-validate)
     2. Creating a versioned snapshot with approval metadata
-    3. Generating SHA-256 checksum
+    3. Generating SHA-256 checksum and a Merkle digest over the bundle,
+       its imported bundles and every SCD they reference
     4. Creating a version manifest
     5. Creating git commit and tag (unless --no-git)
 
@@ -274,13 +317,29 @@ def version(bundle, version_number, approved_by, notes, no_git, no_validate, for
 
         # Skip git operations (manual git workflow)
         scs bundle version --version 1.0.0 --no-git
+
+        # Version every bundle in one run: one validation of the shared
+        # graph, one commit, one tag per bundle plus v1.0.0
+        scs bundle version --all --version 1.0.0
+
+        # Version a chosen set of bundles
+        scs bundle version -b bundles/concerns/security.yaml -b bundles/concerns/architecture.yaml --version 1.2.0
     """
     click.echo("=== SCS Bundle Versioning ===\n")
 
-    bundle_path = Path(bundle)
-    if not bundle_path.exists():
-        click.echo(f"Error: Bundle file not found: {bundle}", err=True)
-        raise click.Abort()
+    if all_bundles:
+        bundle_paths = _discover_bundles(Path("bundles"))
+        if not bundle_paths:
+            click.echo("Error: No bundles found under bundles/", err=True)
+            raise click.Abort()
+    else:
+        bundle_paths = [Path(b) for b in dict.fromkeys(bundles or ["bundles/project-bundle.yaml"])]
+
+    for bundle_path in bundle_paths:
+        if not bundle_path.exists():
+            click.echo(f"Error: Bundle file not found: {bundle_path}", err=True)
+            raise click.Abort()
+    bundle_path = bundle_paths[0]
 
     # Validate version number format (basic semantic versioning check)
     version_parts = version_number.split(".")
@@ -316,6 +375,12 @@ def version(bundle, version_number, approved_by, notes, no_git, no_validate, for
 
     click.echo()
 
+    if len(bundle_paths) > 1:
+        _version_batch(
+            bundle_paths, version_number, approved_by, notes, no_git, no_validate, force, jobs
+        )
+        return
+
     # Step 1: Validate bundle (unless skipped)
     if not no_validate:
         click.echo("Step 1/5: Validating bundle...")
@@ -345,7 +410,23 @@ def version(bundle, version_number, approved_by, notes, no_git, no_validate, for
     # Step 3: Generate checksum
     click.echo("Step 3/5: Generating SHA-256 checksum...")
     checksum, file_size = _generate_checksum(versioned_bundle_path)
-    click.echo(f"  ✓ SHA-256: {checksum}\n")
+    canonical_checksum = _canonical_checksum(versioned_bundle_path)
+    click.echo(f"  ✓ SHA-256: {checksum}")
+    merkle = _generate_merkle_digests(versioned_bundle_path)
+    click.echo(
+        f"  ✓ Merkle root: {merkle['root']} "
+        f"({len(merkle['bundles'])} bundles, {len(merkle['scds'])} SCDs)"
+    )
+    if merkle.get("unresolved"):
+        click.echo(
+            f"  Warning: {len(merkle['unresolved'])} reference(s) could not be resolved "
+            "or parsed and are not pinned: " + ", ".join(merkle["unresolved"])
+        )
+    store = ObjectStore.for_project(versioned_bundle_path)
+    if store is not None:
+        written, present = _store_objects(store, versioned_bundle_path.parent, merkle)
+        click.echo(f"  ✓ Stored {written} new object(s) in {store.root} ({present} unchanged)")
+    click.echo()
 
     # Step 4: Create version manifest
     click.echo("Step 4/5: Creating version manifest...")
@@ -358,6 +439,8 @@ def version(bundle, version_number, approved_by, notes, no_git, no_validate, for
         checksum,
         file_size,
         validation_result if not no_validate else None,
+        merkle,
+        canonical_checksum,
     )
     click.echo(f"  ✓ Created: {manifest_path}\n")
 
@@ -394,6 +477,604 @@ def version(bundle, version_number, approved_by, notes, no_git, no_validate, for
     click.echo()
 
 
+@bundle.command()
+@click.argument("manifest")
+@click.option(
+    "--bundle",
+    "-b",
+    type=click.Path(dir_okay=False),
+    default="bundles/project-bundle.yaml",
+    help="Bundle whose version is verified (locates the manifest)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of hashing threads (default: based on CPU count)",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="List every checked file, not only mismatches",
+)
+def verify(manifest, bundle, jobs, verbose):
+    """
+    Verify a versioned bundle against its version manifest
+
+    MANIFEST is a version (1.0.0 or v1.0.0) of the bundle or the path to a
+    version manifest. Re-hashes the versioned bundle file and, if the manifest has a Merkle
+    section, every imported bundle and referenced SCD, then recomputes the
+    Merkle root. Exits with status 1 if anything differs.
+
+    Digests of unchanged files (same inode, mtime and size) are reused from
+    .scs/digest-cache.json, so verifying an unchanged tree again is instant.
+
+    \b
+    Examples:
+        # Verify a release in CI
+        scs bundle verify v1.0.0
+
+        # Show every file that was checked
+        scs bundle verify bundles/project-bundle-VERSION-1.0.0-MANIFEST.yaml --verbose
+    """
+    manifest_path = _find_manifest(manifest, Path(bundle))
+    with open(manifest_path, "r") as f:
+        manifest_data = yaml.safe_load(f) or {}
+
+    bundle_info = manifest_data.get("bundle") or {}
+    if "file" not in bundle_info or "sha256" not in bundle_info:
+        click.echo(f"Error: Not a version manifest: {manifest_path}", err=True)
+        raise click.Abort()
+
+    base_dir = manifest_path.parent
+    bundle_file = base_dir / bundle_info["file"]
+    failures = 0
+
+    # The snapshot is pinned byte for byte; a reformatted snapshot still
+    # passes if its canonical form is unchanged
+    if not bundle_file.exists():
+        click.echo(f"✗ {bundle_info['file']} (missing)")
+        failures += 1
+    else:
+        checksum, _ = _generate_checksum(bundle_file)
+        if checksum == bundle_info["sha256"]:
+            if verbose:
+                click.echo(f"✓ {bundle_info['file']}")
+        elif bundle_info.get("canonical_sha256") == _canonical_checksum(bundle_file):
+            click.echo(f"✓ {bundle_info['file']} (reformatted, content unchanged)")
+        else:
+            click.echo(f"✗ {bundle_info['file']} (modified: SHA-256 {checksum})")
+            failures += 1
+
+    merkle = manifest_data.get("merkle")
+    checked = 1
+    if merkle and bundle_file.exists():
+        cache = DigestCache.for_project(manifest_path)
+        checks, root = verify_merkle(merkle, base_dir, bundle_file, cache, jobs)
+        cache.save()
+        checked += len(checks)
+
+        for check in checks:
+            if check.status != "ok":
+                click.echo(f"✗ {check.file} ({check.status}: {check.id})")
+                failures += 1
+            elif verbose:
+                click.echo(f"✓ {check.file}")
+
+        if root is not None and root != merkle.get("root"):
+            click.echo(f"✗ Merkle root mismatch: expected {merkle.get('root')}, got {root}")
+            failures += 1
+    elif not merkle:
+        click.echo("Note: manifest has no Merkle section; only the bundle file was checked")
+
+    click.echo()
+    if failures:
+        click.echo(f"✗ Verification failed: {failures} mismatch(es) in {checked} file(s)")
+        sys.exit(1)
+    click.echo(f"✓ Verified {checked} file(s) against {manifest_path.name}")
+
+
+@bundle.command()
+@click.argument("manifest")
+@click.option(
+    "--bundle",
+    "-b",
+    type=click.Path(dir_okay=False),
+    default="bundles/project-bundle.yaml",
+    help="Bundle whose version is checked out (locates the manifest)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False),
+    help="Directory to materialize the version into "
+    "(default: .scs/checkouts/v<version> in the project)",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Write into the output directory even if it is not empty",
+)
+def checkout(manifest, bundle, output, force):
+    """
+    Materialize a versioned bundle and its SCDs from the object store
+
+    MANIFEST is a version (1.0.0 or v1.0.0) of the bundle or the path to a
+    version manifest. Every bundle and SCD pinned by the manifest's Merkle section is written
+    from .scs/objects/ into the output directory, keeping the project
+    layout. Files are written in canonical form (JSON, which is valid YAML),
+    so their digests match the manifest exactly. The default output lives
+    under .scs/, which SCD discovery skips, so a checkout never shows up as
+    duplicate IDs when validating the project.
+
+    \b
+    Examples:
+        # Recreate release 1.0.0 under .scs/checkouts/v1.0.0/
+        scs bundle checkout v1.0.0
+
+        # Choose the output directory
+        scs bundle checkout bundles/project-bundle-VERSION-1.0.0-MANIFEST.yaml -o /tmp/release-1.0.0
+    """
+    manifest_path = _find_manifest(manifest, Path(bundle))
+    with open(manifest_path, "r") as f:
+        manifest_data = yaml.safe_load(f) or {}
+
+    merkle = manifest_data.get("merkle")
+    if not merkle:
+        click.echo(
+            f"Error: {manifest_path} has no Merkle section; "
+            "only versions created with object pinning can be checked out",
+            err=True,
+        )
+        raise click.Abort()
+
+    store = ObjectStore.for_project(manifest_path)
+    if store is None:
+        click.echo(
+            f"Error: {manifest_path} is not inside an SCS project, so there is no "
+            "object store to check it out from",
+            err=True,
+        )
+        raise click.Abort()
+
+    version_label = manifest_data.get("version", "unknown")
+    if output:
+        output_dir = Path(output)
+    else:
+        output_dir = store.root.parent / "checkouts" / f"v{version_label}"
+    if output_dir.exists() and any(output_dir.iterdir()) and not force:
+        click.echo(f"Error: Output directory is not empty: {output_dir}", err=True)
+        click.echo("Use --force to write into it anyway", err=True)
+        raise click.Abort()
+
+    entries = {
+        entry["file"]: entry["digest"]
+        for group in ("bundles", "scds")
+        for entry in (merkle.get(group) or {}).values()
+    }
+    missing = store.missing(entries.values())
+    if missing:
+        click.echo(
+            f"Error: {len(missing)} object(s) are not in {store.root}; "
+            "was this version created in another checkout?",
+            err=True,
+        )
+        raise click.Abort()
+
+    # Recorded paths are relative to the manifest and may climb out of its
+    # directory (../context/...); re-root them at the highest directory used
+    depth = max((Path(f).parts.count("..") for f in entries), default=0)
+    manifest_dir = manifest_path.resolve().parent
+    layout_root = manifest_dir.parents[depth - 1] if depth else manifest_dir
+
+    def destination(relative_to_manifest):
+        absolute = os.path.normpath(manifest_dir / relative_to_manifest)
+        return output_dir / os.path.relpath(absolute, layout_root)
+
+    store.materialize({destination(f): digest for f, digest in entries.items()})
+    manifest_copy = destination(manifest_path.name)
+    manifest_copy.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_copy, "w") as f:
+        yaml.dump(manifest_data, f, default_flow_style=False, sort_keys=False)
+
+    click.echo(f"✓ Materialized {len(entries)} file(s) into {output_dir}")
+    click.echo(f"  Manifest: {manifest_copy}")
+
+
+@bundle.command()
+@click.argument("old")
+@click.argument("new")
+@click.option(
+    "--bundle",
+    "-b",
+    type=click.Path(dir_okay=False),
+    default="bundles/project-bundle.yaml",
+    help="Bundle whose versions are compared (locates the manifests)",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_format",
+    type=click.Choice(["text", "json"], case_sensitive=False),
+    default="text",
+    help="Output format (default: text)",
+)
+def diff(old, new, bundle, output_format):
+    """
+    Show what changed between two versions of a bundle
+
+    OLD and NEW are versions (1.0.0 or v1.0.0) of the bundle, or paths to
+    version manifests. Lists added, removed and modified SCDs and bundles,
+    added and removed relationship edges, and every changed content path.
+
+    Documents whose pinned digests are equal are skipped without being
+    read. Changed ones are loaded from .scs/objects/ (or from disk if the
+    file still matches) and compared subtree by subtree, skipping
+    identical subtrees by their hash.
+
+    \b
+    Examples:
+        # What changed in 1.1.0?
+        scs bundle diff v1.0.0 v1.1.0
+
+        # Machine-readable change list
+        scs bundle diff v1.0.0 v1.1.0 --output json
+
+        # Compare against a manifest directly
+        scs bundle diff bundles/project-bundle-VERSION-1.0.0-MANIFEST.yaml v1.1.0
+    """
+    manifests = []
+    for ref in (old, new):
+        manifest_path = _find_manifest(ref, Path(bundle))
+        try:
+            manifest_data = load_document(manifest_path)
+        except ValidationError as e:
+            click.echo(f"Error: {e}", err=True)
+            raise click.Abort()
+        if not manifest_data.get("merkle"):
+            click.echo(
+                f"Error: {manifest_path} has no Merkle section; "
+                "only versions created with SCD pinning can be compared",
+                err=True,
+            )
+            raise click.Abort()
+        manifests.append((manifest_data, manifest_path.parent))
+
+    (old_manifest, old_dir), (new_manifest, new_dir) = manifests
+    result = diff_versions(old_manifest, new_manifest, old_dir, new_dir)
+
+    if output_format == "json":
+        click.echo(json.dumps(_diff_to_dict(result), indent=2, default=str))
+    else:
+        _print_diff(result)
+
+
+def _manifest_filename(bundle_path, version_number):
+    """Name of the manifest for one version of a bundle (written next to its snapshot)."""
+    return f"{Path(bundle_path).stem}-VERSION-{version_number}-MANIFEST.yaml"
+
+
+def _find_manifest(ref, bundle_path):
+    """Locate the version manifest for a version number or manifest path."""
+    if Path(ref).is_file():
+        return Path(ref)
+    version_number = ref[1:] if ref.startswith("v") else ref
+    for candidate in (
+        bundle_path.parent / _manifest_filename(bundle_path, version_number),
+        # Name used by single-bundle versioning before batch mode
+        bundle_path.parent / f"VERSION-{version_number}-MANIFEST.yaml",
+    ):
+        if candidate.is_file():
+            return candidate
+    click.echo(
+        f"Error: No manifest for version {version_number} of {bundle_path} "
+        f"(looked for {candidate.name} in {bundle_path.parent})",
+        err=True,
+    )
+    raise click.Abort()
+
+
+def _diff_to_dict(result):
+    """Convert a VersionDiff into plain data for JSON output."""
+
+    def documents(added, removed, modified):
+        return {
+            "added": added,
+            "removed": removed,
+            "modified": [
+                {
+                    "id": change.id,
+                    "old_file": change.old_file,
+                    "new_file": change.new_file,
+                    "changes": None
+                    if change.changes is None
+                    else [c._asdict() for c in change.changes],
+                }
+                for change in modified
+            ],
+        }
+
+    def edges(edge_list):
+        return [
+            {"source": source, "type": rel_type, "target": target}
+            for source, rel_type, target in edge_list
+        ]
+
+    return {
+        "old_version": result.old_version,
+        "new_version": result.new_version,
+        "scds": documents(result.scds_added, result.scds_removed, result.scds_modified),
+        "bundles": documents(
+            result.bundles_added, result.bundles_removed, result.bundles_modified
+        ),
+        "relationships": {
+            "added": edges(result.relationships_added),
+            "removed": edges(result.relationships_removed),
+        },
+        "unchanged": result.unchanged,
+    }
+
+
+def _format_value(value, limit=60):
+    """Render a changed value on one line."""
+    text = json.dumps(value, ensure_ascii=False, default=str)
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def _print_diff(result):
+    """Print a VersionDiff as text."""
+    click.echo(f"Comparing v{result.old_version} → v{result.new_version}\n")
+
+    def print_documents(label, added, removed, modified):
+        for doc_id in added:
+            click.echo(f"+ {label} {doc_id}")
+        for doc_id in removed:
+            click.echo(f"- {label} {doc_id}")
+        for change in modified:
+            click.echo(f"~ {label} {change.id} ({change.new_file})")
+            if change.changes is None:
+                click.echo("    (content of one version is not available to compare)")
+                continue
+            for c in change.changes:
+                if c.change == "added":
+                    click.echo(f"    + {c.path}: {_format_value(c.new)}")
+                elif c.change == "removed":
+                    click.echo(f"    - {c.path}: {_format_value(c.old)}")
+                else:
+                    click.echo(
+                        f"    ~ {c.path}: {_format_value(c.old)} → {_format_value(c.new)}"
+                    )
+
+    print_documents("SCD", result.scds_added, result.scds_removed, result.scds_modified)
+    for source, rel_type, target in result.relationships_added:
+        click.echo(f"+ relationship {source} --{rel_type}--> {target}")
+    for source, rel_type, target in result.relationships_removed:
+        click.echo(f"- relationship {source} --{rel_type}--> {target}")
+    print_documents(
+        "bundle", result.bundles_added, result.bundles_removed, result.bundles_modified
+    )
+
+    if result.is_empty():
+        click.echo("No changes")
+    click.echo(f"\n{result.unchanged} unchanged document(s)")
+
+
+def _discover_bundles(bundles_dir):
+    """Find every bundle file under bundles/ (top level, domains/ and concerns/)."""
+    found = []
+    for directory in (bundles_dir, bundles_dir / "domains", bundles_dir / "concerns"):
+        if directory.is_dir():
+            found.extend(
+                path
+                for path in sorted(directory.glob("*.yaml"))
+                if not is_version_artifact(path)
+            )
+    return found
+
+
+def _version_batch(
+    bundle_paths, version_number, approved_by, notes, no_git, no_validate, force, jobs
+):
+    """Version several bundles of one project in a single run.
+
+    The bundle graphs share one SCD index, one parse of every bundle file and
+    one digest cache. Only bundles that no other bundle in the batch imports
+    are validated, since validating them covers everything they import.
+    Snapshots, checksums, Merkle digests and manifests are produced in
+    parallel, then everything is committed once.
+    """
+    click.echo(f"Versioning {len(bundle_paths)} bundles as {version_number}\n")
+
+    # Refuse before writing anything if a snapshot already exists
+    if not force:
+        existing = [
+            path for path in bundle_paths
+            if (path.parent / f"{path.stem}-v{version_number}.yaml").exists()
+        ]
+        if existing:
+            for path in existing:
+                click.echo(
+                    f"Error: Versioned bundle already exists: "
+                    f"{path.parent / f'{path.stem}-v{version_number}.yaml'}",
+                    err=True,
+                )
+            click.echo("Use --force to overwrite", err=True)
+            raise click.Abort()
+
+    scd_files = index_scd_files(find_project_root(bundle_paths[0]))
+    documents = {}
+    graphs = {path: load_bundle_graph(path, scd_files, documents) for path in bundle_paths}
+
+    # Step 1: Validate the shared graph once, from its roots
+    validation_result = None
+    if not no_validate:
+        imported = {
+            node.path.resolve()
+            for path, graph in graphs.items()
+            for node in graph.bundles.values()
+            if node.path.resolve() != path.resolve()
+        }
+        roots = [path for path in bundle_paths if path.resolve() not in imported]
+        click.echo(
+            f"Step 1/5: Validating {len(roots)} root bundle(s) "
+            f"covering all {len(bundle_paths)}..."
+        )
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            results = [*executor.map(_validate_bundle, roots)]
+        validation_result = {
+            "passed": all(r["passed"] for r in results),
+            "errors": sum(r["errors"] for r in results),
+            "warnings": sum(r["warnings"] for r in results),
+        }
+        if not validation_result["passed"]:
+            for root, result in zip(roots, results):
+                if not result["passed"]:
+                    click.echo(f"  ✗ {root}: {result['errors']} error(s)", err=True)
+            click.echo("Fix validation errors before versioning.", err=True)
+            click.echo("Or use --no-validate to skip (not recommended).", err=True)
+            raise click.Abort()
+        click.echo(
+            f"  ✓ Validation passed "
+            f"({validation_result['errors']} errors, {validation_result['warnings']} warnings)\n"
+        )
+    else:
+        click.echo("Step 1/5: Skipping validation (--no-validate)\n")
+
+    # Steps 2-4: Snapshot, digests and manifest for every bundle in parallel
+    click.echo("Steps 2-4/5: Creating snapshots, digests and manifests...")
+    cache = DigestCache.for_project(bundle_paths[0])
+    hash_leaves(
+        {p for graph in graphs.values() for p in graph.scd_files.values()}, cache, jobs
+    )
+    store = ObjectStore.for_project(bundle_paths[0])
+
+    def version_one(path):
+        versioned_path = _create_versioned_bundle(
+            path, version_number, approved_by, notes, True
+        )
+        checksum, file_size = _generate_checksum(versioned_path)
+        merkle = _generate_merkle_digests(versioned_path, scd_files, cache, documents)
+        manifest_path = _create_version_manifest(
+            path,
+            versioned_path,
+            version_number,
+            approved_by,
+            notes,
+            checksum,
+            file_size,
+            validation_result,
+            merkle,
+            _canonical_checksum(versioned_path),
+        )
+        if store is not None:
+            _store_objects(store, versioned_path.parent, merkle)
+        return versioned_path, manifest_path, checksum, merkle
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        versioned = [*executor.map(version_one, bundle_paths)]
+    cache.save()
+
+    for versioned_path, manifest_path, checksum, merkle in versioned:
+        click.echo(f"  ✓ {versioned_path} (Merkle root {merkle['root'][:12]})")
+    click.echo()
+
+    # Step 5: One commit and one set of tags for the whole batch
+    tags = []
+    if not no_git:
+        click.echo("Step 5/5: Creating git commit and tags...")
+        tags = _create_git_batch(versioned, version_number, validation_result)
+        click.echo(f"  ✓ Committed and tagged: {', '.join(tags)}\n")
+    else:
+        click.echo("Step 5/5: Skipping git operations (--no-git)\n")
+
+    click.echo("=" * 60)
+    click.echo(f"✓ Versioned {len(versioned)} bundles as {version_number}")
+    click.echo("=" * 60)
+    if tags:
+        click.echo(f"Push with: git push origin main && git push origin {' '.join(tags)}")
+    click.echo()
+
+
+def _create_git_batch(versioned, version_number, validation_result):
+    """Commit a batch of versioned bundles once and tag it.
+
+    Creates an annotated release tag v<version> and a lightweight
+    <bundle>-v<version> tag per bundle. Returns the tag names.
+    """
+    try:
+        subprocess.run(["git", "rev-parse", "--git-dir"], check=True, capture_output=True)
+
+        files = [str(p) for versioned_path, manifest_path, _, _ in versioned
+                 for p in (versioned_path, manifest_path)]
+        subprocess.run(["git", "add", "--", *files], check=True)
+
+        lines = [
+            f"Release v{version_number} - Phase 3 (Version) Complete",
+            "",
+            f"Created immutable versioned snapshots of {len(versioned)} validated SCD bundles.",
+        ]
+        if validation_result:
+            lines += [
+                "",
+                "Phase 2 (Validate) Results:",
+                f"- {validation_result.get('errors', 0)} validation errors",
+                f"- {validation_result.get('warnings', 0)} warnings",
+            ]
+        lines += ["", "Deliverables (versioned bundle: SHA-256 checksum):"]
+        lines += [
+            f"- {versioned_path.name}: {checksum}"
+            for versioned_path, _, checksum, _ in versioned
+        ]
+        subprocess.run(
+            ["git", "commit", "-m", "\n".join(lines) + "\n"],
+            check=True,
+            capture_output=True,
+        )
+
+        release_tag = f"v{version_number}"
+        subprocess.run(
+            ["git", "tag", "-a", release_tag, "-m", f"SCD Bundles v{version_number}"],
+            check=True,
+        )
+
+        # All per-bundle tags in a single ref transaction
+        bundle_tags = [
+            f"{versioned_path.name[: -len(f'-v{version_number}.yaml')]}-v{version_number}"
+            for versioned_path, _, _, _ in versioned
+        ]
+        subprocess.run(
+            ["git", "update-ref", "--stdin"],
+            input="".join(f"create refs/tags/{tag} HEAD\n" for tag in bundle_tags),
+            text=True,
+            check=True,
+        )
+        return [release_tag, *bundle_tags]
+
+    except subprocess.CalledProcessError as e:
+        click.echo(f"  Warning: Git operation failed: {e}", err=True)
+        click.echo("  Files were created but not committed to git", err=True)
+        raise click.Abort()
+
+
+def _store_objects(store, base_dir, merkle):
+    """Store every file pinned by a Merkle section in an object store."""
+    entries = [
+        (base_dir / entry["file"], entry["digest"])
+        for group in ("bundles", "scds")
+        for entry in (merkle.get(group) or {}).values()
+    ]
+    try:
+        return store.put_all(entries)
+    except ValueError as e:
+        click.echo(f"Error: {e}; re-run the command", err=True)
+        raise click.Abort()
+    except (OSError, ValidationError) as e:
+        click.echo(f"Error: could not store a pinned file in {store.root}: {e}", err=True)
+        raise click.Abort()
+
+
 def _validate_bundle(bundle_path):
     """Run validation on the bundle and return results."""
     try:
@@ -495,10 +1176,10 @@ def _create_versioned_bundle(bundle_path, version_number, approved_by, notes, fo
 
 def _generate_checksum(file_path):
     """Generate SHA-256 checksum of file."""
-    sha256_hash = hashlib.sha256()
+    # file_digest reads into one reusable buffer, so memory stays flat
+    # regardless of file size
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+        sha256_hash = hashlib.file_digest(f, "sha256")
 
     checksum = sha256_hash.hexdigest()
     file_size = file_path.stat().st_size
@@ -506,6 +1187,58 @@ def _generate_checksum(file_path):
     return checksum, file_size
 
 
+def _generate_merkle_digests(versioned_bundle_path, scd_files=None, cache=None, documents=None):
+    """Compute the Merkle digests of a versioned bundle's resolved graph.
+
+    Returns the manifest's ``merkle`` section. File paths are relative to the
+    manifest's directory (the versioned bundle's directory). A shared SCD
+    index, digest cache and parsed-bundle cache may be passed in when
+    versioning several bundles; otherwise they are created here.
+    """
+    graph = load_bundle_graph(versioned_bundle_path, scd_files, documents)
+    own_cache = cache is None
+    if own_cache:
+        cache = DigestCache.for_project(versioned_bundle_path)
+    tree = compute_merkle_tree(graph, cache)
+    if own_cache:
+        cache.save()
+
+    base_dir = versioned_bundle_path.resolve().parent
+
+    def relative(path):
+        return Path(os.path.relpath(path.resolve(), base_dir)).as_posix()
+
+    section = {
+        "algorithm": HASH_ALGORITHM,
+        "root": tree.root,
+        "bundles": {
+            bundle_id: {
+                "file": relative(graph.bundles[bundle_id].path),
+                "digest": tree.bundle_digests[bundle_id],
+                "tree": tree_digest,
+            }
+            for bundle_id, tree_digest in tree.bundle_trees.items()
+        },
+        "scds": {
+            scd_id: {"file": relative(graph.scd_files[scd_id]), "digest": digest}
+            for scd_id, digest in tree.scd_digests.items()
+        },
+    }
+    # SCDs that can't be parsed aren't pinned, like references that can't be found
+    unresolved = sorted({*graph.unresolved, *tree.unreadable})
+    if unresolved:
+        section["unresolved"] = unresolved
+    return section
+
+
+def _canonical_checksum(file_path):
+    """SHA-256 of a document's canonical form, or None if it can't be parsed."""
+    try:
+        return canonical_digest(load_document(file_path))
+    except ValidationError:
+        return None
+
+
 def _create_version_manifest(
     original_bundle_path,
     versioned_bundle_path,
@@ -515,6 +1248,8 @@ def _create_version_manifest(
     checksum,
     file_size,
     validation_result,
+    merkle=None,
+    canonical_checksum=None,
 ):
     """Create version manifest file."""
     # Load bundle to get metadata
@@ -559,6 +1294,13 @@ def _create_version_manifest(
         },
     }
 
+    if canonical_checksum:
+        # Survives reformatting of the snapshot (see utils/canonical.py)
+        manifest["bundle"]["canonical_sha256"] = canonical_checksum
+
+    if merkle:
+        manifest["merkle"] = merkle
+
     if validation_result:
         manifest["validation"] = {
             "validator_version": "0.1.0",
@@ -600,8 +1342,9 @@ def _create_version_manifest(
     }
 
     # Write manifest
-    manifest_filename = f"VERSION-{version_number}-MANIFEST.yaml"
-    manifest_path = versioned_bundle_path.parent / manifest_filename
+    manifest_path = versioned_bundle_path.parent / _manifest_filename(
+        original_bundle_path, version_number
+    )
 
     with open(manifest_path, "w") as f:
         yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
@@ -0,0 +1,154 @@
+"""
+Compile command - render concern bundles into AI assistant context files
+"""
+
+from pathlib import Path
+import click
+from scs_tools.utils.compiler import TARGETS, Compiler
+
+
+@click.command(name="compile")
+@click.option(
+    "--target",
+    "-t",
+    "targets",
+    type=click.Choice(TARGETS + ("all",)),
+    multiple=True,
+    default=["claude"],
+    help="Output format: claude (.claude/rules/ + CLAUDE.md), agents (AGENTS.md) or all "
+    "(repeatable, default: claude)",
+)
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Concern bundle directory (default: .scs/concerns, bundles/concerns or concerns)",
+)
+@click.option(
+    "--scd-root",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Directory the bundles' SCD files are looked up in (default: by layout)",
+)
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Re-render every output, even if its sources are unchanged",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parsing/rendering threads (default: based on CPU count)",
+)
+@click.option(
+    "--budget",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Token budget of the always-loaded SCDs of each target (default: no limit)",
+)
+@click.option(
+    "--focus",
+    multiple=True,
+    metavar="SCD_ID",
+    help="SCD being worked on: packed first, with what it depends on (repeatable)",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="List unchanged outputs too",
+)
+def compile_context(targets, source, scd_root, force, jobs, budget, focus, verbose):
+    """
+    Compile concern bundles into native AI assistant context files
+
+    Each concern bundle with SCDs becomes .claude/rules/<concern>.md. SCDs
+    with applies_to.paths get their own rules file with paths: frontmatter,
+    and CLAUDE.md gets a managed section linking the rules. The agents
+    target writes a managed section of AGENTS.md instead.
+
+    Outputs are incremental: .scs/compile-manifest.json records the digests
+    of the sources of every output, and only outputs whose sources changed
+    are rendered again. Files are written atomically. Rules files without
+    the <!-- scs-team:managed --> marker, and anything outside the
+    <!-- scs-team:start/end --> markers, are never touched.
+
+    With --budget, the SCDs that are always loaded (all but path-specific
+    rules for claude, all of them for agents) are packed to fit about that
+    many tokens (estimated at 4 characters per token). --focus SCDs and
+    what they depend on come first, then critical ones, then the rest by
+    priority, concern priority and number of dependents per token.
+
+    \b
+    Examples:
+        scs compile                        # .claude/rules/ and CLAUDE.md
+        scs compile --target all           # Also AGENTS.md
+        scs compile --source bundles/concerns --scd-root context
+        scs compile --force                # Re-render everything
+        scs compile --budget 8000 --focus scd:project:auth-flow
+    """
+    if "all" in targets:
+        targets = TARGETS
+    compiler = Compiler(
+        Path("."),
+        Path(source) if source else None,
+        Path(scd_root) if scd_root else None,
+        targets,
+        jobs,
+        budget,
+        focus,
+    )
+    try:
+        result = compiler.compile(force=force)
+    except FileNotFoundError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort()
+
+    for path in result.written:
+        click.echo(f"✓ {path}")
+    if verbose:
+        for path in result.unchanged:
+            click.echo(f"  {path} (unchanged)")
+    for path in result.removed:
+        click.echo(f"- {path} (removed, no longer produced)")
+    for path in result.skipped:
+        click.echo(f"⚠ {path} (not managed by scs, left untouched)")
+    for scd_file in result.invalid:
+        click.echo(f"⚠ {scd_file} could not be parsed and was left out", err=True)
+    for scd_id in result.unresolved:
+        click.echo(f"⚠ {scd_id} is listed by a bundle but no file declares it", err=True)
+    candidates = {i for packed in result.packing.values() for i in packed.selected + packed.omitted}
+    if focus and budget is None:
+        click.echo("⚠ --focus has no effect without --budget", err=True)
+    elif budget is not None:
+        for scd_id in focus:
+            if scd_id not in candidates:
+                click.echo(f"⚠ --focus {scd_id} is not an SCD of any compiled concern", err=True)
+                continue
+            for target, packed in result.packing.items():
+                if scd_id in packed.omitted:
+                    click.echo(
+                        f"⚠ --focus {scd_id} does not fit the {budget}-token budget "
+                        f"for {target} and was left out",
+                        err=True,
+                    )
+
+    for target, packed in result.packing.items():
+        click.echo(
+            f"Packed {len(packed.selected)} of {len(packed.selected) + len(packed.omitted)} "
+            f"SCD(s) for {target}: ~{packed.tokens} of {packed.budget} tokens"
+        )
+        if verbose:
+            for scd_id in packed.omitted:
+                click.echo(f"  {scd_id} (left out)")
+
+    click.echo()
+    if result.written or result.removed:
+        click.echo(
+            f"✓ Compiled {len(result.written)} output(s), "
+            f"{len(result.unchanged)} up to date"
+        )
+    else:
+        click.echo(f"✓ All {len(result.unchanged)} output(s) up to date")
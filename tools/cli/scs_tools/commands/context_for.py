@@ -0,0 +1,101 @@
+"""
+Context-for command - list the SCDs that apply to source files
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+import click
+from scs_tools.utils.compiler import Compiler
+from scs_tools.utils.path_index import PathIndex, load_project_index
+
+
+def _lookup(index: PathIndex, path: str, include_general: bool) -> dict:
+    """Match one path (relative to the working directory, or absolute)"""
+    relative = Path(os.path.relpath(os.path.abspath(path))).as_posix()
+    targets = index.match(relative, include_general)
+    return {
+        "path": relative,
+        "scds": [t for t in targets if t.startswith("scd:")],
+        "rules": [t for t in targets if not t.startswith("scd:")],
+    }
+
+
+@click.command(name="context-for")
+@click.argument("paths", nargs=-1, required=True)
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Concern bundle directory (default: .scs/concerns, bundles/concerns or concerns)",
+)
+@click.option(
+    "--scd-root",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Directory the bundles' SCD files are looked up in (default: by layout)",
+)
+@click.option(
+    "--all",
+    "include_general",
+    is_flag=True,
+    help="Also list the SCDs that apply to every file",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format (default: text)",
+)
+def context_for(paths, source, scd_root, include_general, output_format):
+    """
+    List the SCDs whose applies_to.paths globs match source files
+
+    All globs of the project's SCDs, and of hand-written .claude/rules/
+    files with paths: frontmatter, are compiled into one index, so each
+    lookup only tries the globs that can match. Paths are relative to the
+    project root (the current directory) or absolute.
+
+    Pass - to read paths from stdin, one per line: the index is built once
+    and one JSON object is written (and flushed) per path, so an editor can
+    keep the process running and query it as files are opened.
+
+    \b
+    Examples:
+        scs context-for src/patient_portal/auth.py
+        scs context-for --all src/api/routes.py          # Include global SCDs
+        scs context-for --output json src/a.py src/b.py
+        git diff --name-only | scs context-for -          # One JSON line per path
+    """
+    compiler = Compiler(
+        Path("."),
+        Path(source) if source else None,
+        Path(scd_root) if scd_root else None,
+    )
+    index = load_project_index(compiler)
+
+    if paths == ("-",):
+        for line in sys.stdin:
+            path = line.strip()
+            if path:
+                click.echo(json.dumps(_lookup(index, path, include_general)))
+                sys.stdout.flush()
+        return
+
+    results = [_lookup(index, path, include_general) for path in paths]
+    if output_format == "json":
+        # Always a list, however many paths were given
+        click.echo(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        matches = result["scds"] + result["rules"]
+        if len(results) > 1:
+            click.echo(f"{result['path']}:")
+        for target in matches:
+            click.echo(f"  {target}" if len(results) > 1 else target)
+        if not matches:
+            click.echo(f"No SCDs apply to {result['path']}", err=True)
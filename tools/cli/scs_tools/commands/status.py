@@ -0,0 +1,138 @@
+"""
+Status command - concern coverage and compiled output sync
+"""
+
+import json
+import sys
+from pathlib import Path
+import click
+from scs_tools.utils.compiler import Compiler
+
+# Text labels of output states
+_STATE_LABELS = {
+    "in-sync": "In sync",
+    "omitted": "Omitted by budget",
+    "edited": "Edited by hand",
+    "out-of-sync": "Out of sync",
+    "missing": "Missing",
+    "not-compiled": "Not compiled",
+    "not-managed": "Not managed",
+}
+
+_COVERAGE_SYMBOLS = {"covered": "✓", "partial": "◐", "missing": "✗"}
+
+
+@click.command()
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Concern bundle directory (default: .scs/concerns, bundles/concerns or concerns)",
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_format",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format (default: text)",
+)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Exit with status 1 if any compiled output is not in sync",
+)
+@click.option(
+    "--verbose",
+    is_flag=True,
+    help="List changed source files and missing expected SCDs",
+)
+def status(source, output_format, check, verbose):
+    """
+    Show concern coverage and whether compiled outputs are in sync
+
+    Coverage is reported for the 11 software development concerns (and any
+    other concern bundles): covered if the concern bundle lists every SCD
+    its template expects, partial if it lists some SCDs, missing otherwise.
+
+    Sync is checked against the source digests recorded by scs compile.
+    Only recorded source files are looked at, and only those whose inode,
+    mtime or size changed are hashed, so this is fast even on large projects.
+
+    \b
+    Examples:
+        scs status                  # Coverage and compile sync
+        scs status --verbose        # Also list what changed
+        scs status --check          # Fail in CI if outputs are stale
+        scs status --output json    # Machine-readable
+    """
+    compiler = Compiler(Path("."), Path(source) if source else None)
+    concerns, outputs = compiler.status()
+    stale = [output for output in outputs if output.state != "in-sync"]
+    # A concern packed out by the budget is only stale once its sources change
+    uncompiled = [c for c in concerns if c.state in ("not-compiled", "out-of-sync")]
+
+    if output_format == "json":
+        click.echo(
+            json.dumps(
+                {
+                    "concerns": [c._asdict() for c in concerns],
+                    "outputs": [o._asdict() for o in outputs],
+                },
+                indent=2,
+            )
+        )
+    else:
+        _print_status(concerns, outputs, verbose)
+        if stale or uncompiled:
+            click.echo()
+            click.echo(
+                f"Run '{_compile_command(compiler)}' to bring the compiled outputs up to date."
+            )
+
+    if check and (stale or uncompiled):
+        sys.exit(1)
+
+
+def _compile_command(compiler):
+    """The scs compile command line that keeps the recorded budget and focus"""
+    packing = compiler.recorded_packing()
+    if not packing:
+        return "scs compile"
+    budget, focus = packing
+    return " ".join(["scs compile", f"--budget {budget}", *(f"--focus {f}" for f in focus)])
+
+
+def _print_status(concerns, outputs, verbose):
+    counts = {key: sum(c.coverage == key for c in concerns) for key in _COVERAGE_SYMBOLS}
+    click.echo(
+        f"Coverage: {counts['covered']}/{len(concerns)} concerns covered, "
+        f"{counts['partial']} partial, {counts['missing']} missing\n"
+    )
+    width = max(len(c.name) for c in concerns)
+    for concern in concerns:
+        symbol = _COVERAGE_SYMBOLS[concern.coverage]
+        if concern.bundle is None:
+            detail = "no bundle"
+        else:
+            detail = f"{len(concern.scds)} SCD(s)"
+            if concern.state:
+                detail = f"{detail:<11} {_STATE_LABELS[concern.state]}"
+        click.echo(f"  {symbol} {concern.name:<{width}}  {detail}")
+        if verbose and concern.bundle is not None and concern.missing:
+            click.echo(f"      expected: {', '.join(concern.missing)}")
+
+    click.echo("\nCompiled outputs:\n")
+    if not outputs:
+        click.echo("  (none - run 'scs compile')")
+        return
+    width = max(len(o.path) for o in outputs)
+    for output in outputs:
+        symbol = "✓" if output.state == "in-sync" else "✗"
+        label = _STATE_LABELS[output.state]
+        if output.changed:
+            label += f" ({len(output.changed)} source(s) changed)"
+        click.echo(f"  {symbol} {output.path:<{width}}  {label}")
+        if verbose:
+            for file in output.changed:
+                click.echo(f"      {file}")
@@ -7,11 +7,13 @@ from pathlib import Path
 import click
 
 try:
-    from scs_validator.cli import main as validator_main
+    from scs_validator.commands.validate import validate as validator_main
     VALIDATOR_AVAILABLE = True
 except ImportError:
     VALIDATOR_AVAILABLE = False
 
+PARSE_LIMIT_OPTIONS = ("max_file_size", "max_alias_expansion", "max_depth", "parse_timeout")
+
 
 @click.command()
 @click.argument("files", nargs=-1, type=click.Path(exists=True), required=False)
@@ -21,6 +23,52 @@ except ImportError:
     type=click.Path(exists=True),
     help="Validate an SCD bundle file",
 )
+@click.option(
+    "--dir",
+    "-d",
+    "directory",
+    type=click.Path(exists=True, file_okay=False),
+    help="Discover and validate SCD files in this directory",
+)
+@click.option(
+    "--stream",
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+    help="Validate every SCD in a multi-document YAML or NDJSON stream ('-' for stdin)",
+)
+@click.option(
+    "--stream-format",
+    type=click.Choice(["auto", "yaml", "ndjson"], case_sensitive=False),
+    default="auto",
+    help="Format of --stream (default: auto, by suffix or first character)",
+)
+@click.option(
+    "--recursive",
+    "-r",
+    is_flag=True,
+    help="With --dir, descend into subdirectories",
+)
+@click.option(
+    "--include",
+    multiple=True,
+    help="With --dir, only validate files matching this glob (repeatable)",
+)
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="With --dir, skip files or directories matching this glob (repeatable)",
+)
+@click.option(
+    "--no-ignore",
+    is_flag=True,
+    help="Do not honour .gitignore/.scsignore files (--dir and bundle SCD lookup)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes for file validation (default: 1)",
+)
 @click.option(
     "--schema-dir",
     "-s",
@@ -55,21 +103,125 @@ except ImportError:
     is_flag=True,
     help="Skip Level 6 completeness validation",
 )
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Run full schema validation only for SCDs that fail a structural pre-check",
+)
+@click.option(
+    "--thorough",
+    is_flag=True,
+    help="Always run full schema validation (overrides --fast)",
+)
+@click.option(
+    "--scd-root",
+    "scd_roots",
+    multiple=True,
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory to search for a bundle's SCD files (repeatable; default: project root)",
+)
+@click.option(
+    "--standards-dir",
+    "standards_dirs",
+    multiple=True,
+    type=click.Path(exists=True, file_okay=False),
+    help="External standards directory to include in the workspace SCD index (repeatable)",
+)
+@click.option(
+    "--follow-imports",
+    is_flag=True,
+    help="For project bundles, also validate the SCDs of transitively imported bundles "
+    "(concern and standards bundles)",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Like --follow-imports, but load standards SCDs only when a relationship "
+    "targets them",
+)
+@click.option(
+    "--skip-content",
+    is_flag=True,
+    help="Structural checks only: don't load SCD content and skip Level 2 schema validation",
+)
+@click.option(
+    "--max-file-size",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Reject files larger than this many MiB (default: 64; 0 = no limit)",
+)
+@click.option(
+    "--max-alias-expansion",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Reject YAML whose aliases expand to more nodes than this "
+    "(default: 100000; 0 = no limit)",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Reject documents nested deeper than this (default: 256; 0 = no limit)",
+)
+@click.option(
+    "--parse-timeout",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Seconds one file may take to parse (default: no limit)",
+)
 @click.option(
     "--completeness-rules",
     type=click.Path(exists=True),
     help="Path to custom completeness rules file",
 )
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True),
+    help="Report only findings not present in this baseline (implies --new-only)",
+)
+@click.option(
+    "--new-only",
+    is_flag=True,
+    help="Report only findings that are new since the last --new-only run, "
+    "and record this run's findings",
+)
+@click.option(
+    "--save-last-run",
+    is_flag=True,
+    help="Record this run's findings for a later --new-only run without filtering",
+)
 def validate(
     files,
     bundle,
+    directory,
+    stream,
+    stream_format,
+    recursive,
+    include,
+    exclude,
+    no_ignore,
+    jobs,
     schema_dir,
     output,
     strict,
     no_color,
     verbose,
     skip_completeness,
+    fast,
+    thorough,
+    scd_roots,
+    standards_dirs,
+    follow_imports,
+    lazy,
+    skip_content,
+    max_file_size,
+    max_alias_expansion,
+    max_depth,
+    parse_timeout,
     completeness_rules,
+    baseline,
+    new_only,
+    save_last_run,
 ):
     """
     Validate SCS documents and bundles
@@ -82,9 +234,12 @@ def validate(
     Examples:
         scs validate context/project/system-context.yaml  # Validate single SCD
         scs validate context/project/*.yaml               # Validate all SCDs
+        scs validate --dir context/ --recursive --jobs 4  # Discover SCDs in a tree
+        generate-scds | scs validate --stream -           # Validate a piped stream
         scs validate --bundle bundles/project-bundle.yaml # Validate bundle
         scs validate --bundle bundles/project-bundle.yaml --strict  # Fail on warnings
         scs validate --bundle bundles/project-bundle.yaml --output json  # JSON output
+        scs validate --bundle bundles/project-bundle.yaml --new-only  # New findings only
 
     See also: scs bundle validate (shortcut for project bundle validation)
     """
@@ -96,6 +251,12 @@ def validate(
         )
         sys.exit(1)
 
-    # Pass through to the scs-validator CLI
+    # Pass through to the scs-validator CLI; parse limits left unset take
+    # the validator's defaults
     ctx = click.get_current_context()
-    ctx.forward(validator_main)
+    params = {
+        name: value
+        for name, value in ctx.params.items()
+        if not (name in PARSE_LIMIT_OPTIONS and value is None)
+    }
+    ctx.invoke(validator_main, **params)
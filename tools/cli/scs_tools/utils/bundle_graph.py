@@ -0,0 +1,163 @@
+"""Resolve a bundle into the graph of bundle and SCD files it depends on"""
+
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Set
+
+import yaml
+from scs_validator.parser import Parser
+from scs_validator.scd_index import SCDIndex
+
+# Documents are loaded under the validator's default parse limits
+_PARSER = Parser()
+
+# Fastest available safe YAML loader, for YAML text that isn't a document file
+# (rules frontmatter, rendered templates)
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class BundleNode(NamedTuple):
+    """A bundle file and the references it declares"""
+
+    id: str
+    path: Path
+    imports: List[str]
+    scds: List[str]
+
+
+class BundleGraph(NamedTuple):
+    """A bundle with every bundle and SCD file it resolves to"""
+
+    root: str
+    project_root: Path
+    bundles: Dict[str, BundleNode]
+    scd_files: Dict[str, Path]
+    unresolved: List[str]
+
+
+def load_document(file_path: Path) -> Dict[str, Any]:
+    """Parse a YAML or JSON document under the validator's parse limits
+
+    Raises:
+        ValidationError: If the file can't be read or parsed, isn't a mapping,
+            or exceeds the parse limits
+    """
+    return _PARSER.load_scd(Path(file_path))
+
+
+def find_project_root(bundle_path: Path) -> Path:
+    """Get the project root for a bundle (the parent of bundles/)
+
+    Bundles may sit in bundles/ itself or in bundles/domains/ and
+    bundles/concerns/; a bundle outside bundles/ is its own project root.
+    """
+    bundle_dir = bundle_path.resolve().parent
+    return next(
+        (d.parent for d in (bundle_dir, bundle_dir.parent) if d.name == "bundles"),
+        bundle_dir,
+    )
+
+
+def bundle_key(ref: str) -> str:
+    """Strip the version from a bundle reference (bundle:name:1.0.0 -> bundle:name)"""
+    return ":".join(ref.split(":")[:2])
+
+
+def index_scd_files(root: Path) -> Dict[str, Path]:
+    """Map every SCD ID under a directory to the file declaring it (first wins)
+
+    Uses the validator's SCD index, so files are discovered the way ``scs
+    validate`` discovers them (ignore files, version artifacts skipped).
+    """
+    return SCDIndex.build([root]).paths
+
+
+def find_imported_bundle(ref: str, search_dirs: List[Path]):
+    """Locate the file of an imported bundle, or None if it can't be found"""
+    name = ref.split(":")[1]
+    for directory in search_dirs:
+        for candidate in (
+            directory / "domains" / f"{name}.yaml",
+            directory / "concerns" / f"{name}.yaml",
+            directory / f"{name}.yaml",
+            directory / f"{name}-bundle.yaml",
+        ):
+            if candidate.exists():
+                return candidate
+    return None
+
+
+def load_bundle_graph(
+    bundle_path: Path,
+    scd_files: Dict[str, Path] | None = None,
+    documents: Dict[Path, Any] | None = None,
+) -> BundleGraph:
+    """Resolve a bundle, everything it imports, and every SCD they list
+
+    Imported bundles are looked up next to the root bundle (in domains/,
+    concerns/, as <name>.yaml or <name>-bundle.yaml) and next to the bundle
+    importing them. SCDs are found by the ID they declare anywhere under the
+    project root.
+
+    Args:
+        bundle_path: Root bundle file
+        scd_files: Optional prebuilt SCD ID -> file index (e.g. shared by
+            several bundles of one project)
+        documents: Optional cache of parsed bundle files by resolved path,
+            filled in as bundles are read (share it to parse common imports
+            once)
+
+    Returns:
+        BundleGraph; references that could not be found are listed in
+        ``unresolved``
+    """
+    bundle_path = Path(bundle_path)
+    project_root = find_project_root(bundle_path)
+    if scd_files is None:
+        scd_files = index_scd_files(project_root)
+
+    bundles: Dict[str, BundleNode] = {}
+    unresolved: List[str] = []
+    resolved_scds: Dict[str, Path] = {}
+    seen: Set[Path] = set()
+
+    root_id = None
+    pending = [bundle_path]
+    while pending:
+        path = pending.pop(0)
+        resolved_path = path.resolve()
+        if resolved_path in seen:
+            continue
+        seen.add(resolved_path)
+
+        if documents is None:
+            data = load_document(path)
+        else:
+            if resolved_path not in documents:
+                documents[resolved_path] = load_document(path)
+            data = documents[resolved_path]
+        node_id = bundle_key(str(data.get("id", path.stem)))
+        imports = [ref for ref in data.get("imports") or [] if isinstance(ref, str)]
+        scds = [ref for ref in data.get("scds") or [] if isinstance(ref, str)]
+        node = BundleNode(node_id, path, [bundle_key(ref) for ref in imports], scds)
+        bundles.setdefault(node_id, node)
+        if root_id is None:
+            root_id = node_id
+
+        for scd_ref in scds:
+            scd_file = scd_files.get(scd_ref)
+            if scd_file is None:
+                unresolved.append(scd_ref)
+            else:
+                resolved_scds[scd_ref] = scd_file
+
+        search_dirs = [bundle_path.parent, path.parent]
+        for ref in imports:
+            imported = find_imported_bundle(ref, search_dirs)
+            if imported is None:
+                unresolved.append(bundle_key(ref))
+            else:
+                pending.append(imported)
+
+    return BundleGraph(
+        root_id, project_root, bundles, resolved_scds, sorted(set(unresolved))
+    )
@@ -0,0 +1,126 @@
+"""Canonical serialization of parsed SCDs and bundles for deterministic hashing
+
+Two documents that parse to the same data have the same canonical form, no
+matter how they are formatted: key order, quoting, flow vs block style,
+comments and Unicode normalization don't matter. The canonical form is
+compact JSON with:
+
+- object keys sorted (after conversion to NFC strings)
+- strings in Unicode NFC
+- timestamps as ISO 8601 UTC (``2025-01-01T00:00:00Z``), dates as ``YYYY-MM-DD``
+- non-finite floats as the strings ``"NaN"``, ``"Infinity"``, ``"-Infinity"``
+- binary values as base64 strings, sets as sorted lists
+"""
+
+import base64
+import hashlib
+import json
+import math
+import unicodedata
+from datetime import date, datetime, timezone
+from typing import Any
+
+
+def format_timestamp(value: datetime) -> str:
+    """Format a datetime as ISO 8601 UTC (naive datetimes are taken as UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    text = value.strftime("%Y-%m-%dT%H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}".rstrip("0")
+    return text + "Z"
+
+
+def _default(value: Any) -> Any:
+    """Encode the non-JSON types YAML can produce"""
+    if isinstance(value, datetime):
+        return format_timestamp(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (set, frozenset)):
+        return sorted(_normalize(item) for item in value)
+    raise TypeError(f"Cannot canonicalize {type(value).__name__}")
+
+
+def _normalize_key(key: Any) -> str:
+    """Convert a mapping key to the string JSON would use, in NFC"""
+    if isinstance(key, str):
+        return unicodedata.normalize("NFC", key)
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(_normalize(key))
+    return unicodedata.normalize("NFC", str(_default(key)))
+
+
+def _normalize(value: Any) -> Any:
+    """Rewrite data into plain JSON types with every rule applied"""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, dict):
+        return {_normalize_key(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return "NaN" if math.isnan(value) else ("Infinity" if value > 0 else "-Infinity")
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return _normalize(_default(value))
+
+
+# JSONEncoder uses the C encoder (_json.c_make_encoder) when indent is None
+_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=False,
+    allow_nan=False,
+    default=_default,
+)
+
+
+def _has_non_str_keys(data: Any) -> bool:
+    """Check whether any mapping in the data has a key that isn't a str
+
+    The C encoder sorts such keys by their own value (2 before 10) before
+    turning them into strings, so they must be normalized first.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if not all(type(key) is str for key in value):
+                return True
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def canonical_json(data: Any) -> str:
+    """Serialize parsed document data to its canonical JSON text
+
+    Typical documents (string keys, NFC text, finite numbers) are encoded in
+    one pass by the C JSON encoder, after a scan of their containers for
+    non-string keys. Only documents that need rewriting (non-string keys,
+    non-finite floats, non-NFC text) take a Python pass over the data first.
+    """
+    if _has_non_str_keys(data):
+        return _ENCODER.encode(_normalize(data))
+    try:
+        text = _ENCODER.encode(data)
+    except (TypeError, ValueError):
+        return _ENCODER.encode(_normalize(data))
+    if not text.isascii() and not unicodedata.is_normalized("NFC", text):
+        # Keys must be normalized before sorting, so redo it properly
+        return _ENCODER.encode(_normalize(data))
+    return text
+
+
+def canonical_bytes(data: Any) -> bytes:
+    """Canonical form of parsed document data, UTF-8 encoded"""
+    return canonical_json(data).encode("utf-8")
+
+
+def canonical_digest(data: Any) -> str:
+    """SHA-256 hex digest of the canonical form of parsed document data"""
+    return hashlib.sha256(canonical_bytes(data)).hexdigest()
@@ -0,0 +1,924 @@
+"""Compile concern bundles and their SCDs into native AI assistant context files
+
+Each concern bundle becomes a rules file in ``.claude/rules/``, SCDs that
+only apply to some paths (``applies_to.paths``) get their own rules file
+with ``paths:`` frontmatter, and a managed section in ``CLAUDE.md`` links
+them. The ``agents`` target writes everything into a managed section of
+``AGENTS.md``.
+
+Every output records the digests of the bundle and SCD files it was
+compiled from in ``.scs/compile-manifest.json``. A later run only renders
+the outputs whose sources (or whose own managed content) changed.
+
+With a token budget, the SCDs that are always loaded (everything but
+path-specific rules for ``claude``, everything for ``agents``) are packed
+to fit it (see ``scs_tools.utils.packer``); token estimates are kept in the
+manifest by SCD digest.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Set
+
+import yaml
+from scs_validator.discovery import is_version_artifact
+from scs_validator.utils import ValidationError
+
+from scs_tools.utils.bundle_graph import (
+    YAML_LOADER,
+    index_scd_files,
+    load_bundle_graph,
+    load_document,
+)
+from scs_tools.utils.files import get_template_path, render_template, write_file_atomic
+from scs_tools.utils.merkle import DIGEST_CACHE_FILE, DigestCache, hash_leaves
+from scs_tools.utils.packer import (
+    DEFAULT_PRIORITY,
+    PackItem,
+    PackResult,
+    dependencies_of,
+    estimate_tokens,
+    pack,
+    priority_of,
+    priority_weight,
+)
+from scs_tools.utils.project_types import SOFTWARE_DEVELOPMENT_CONCERNS, get_project_type_config
+
+# Compiled outputs and the source digests they were compiled from
+COMPILE_MANIFEST_FILE = Path(".scs") / "compile-manifest.json"
+
+# Bumped whenever outputs are rendered differently (forces a full recompile)
+_MANIFEST_FORMAT = 3
+
+# Ownership markers shared with the scs-team plugin
+MANAGED_MARKER = "<!-- scs-team:managed -->"
+SECTION_START = "<!-- scs-team:start -->"
+SECTION_END = "<!-- scs-team:end -->"
+
+# (concern bundles directory, directory whose SCDs they list), first existing wins
+SOURCE_LAYOUTS = (
+    (Path(".scs") / "concerns", Path(".scs") / "scds"),
+    (Path("bundles") / "concerns", Path(".")),
+    (Path("concerns"), Path(".")),
+)
+
+TARGETS = ("claude", "agents")
+RULES_DIR = Path(".claude") / "rules"
+CLAUDE_FILE = Path("CLAUDE.md")
+AGENTS_FILE = Path("AGENTS.md")
+
+# applies_to.paths globs that match every file
+_GLOBAL_GLOBS = {"**", "**/*", "/**", "/**/*"}
+
+# A managed rules file has its marker within this many leading characters
+_MARKER_WINDOW = 1024
+
+# SCDs left out by the packer that are listed by ID in the outputs
+_OMITTED_LISTED = 10
+
+
+class Source(NamedTuple):
+    """A bundle or SCD file an output is compiled from"""
+
+    id: str
+    file: str  # relative to the project root
+    digest: str
+
+
+class Concern(NamedTuple):
+    """A concern bundle with the SCDs it resolves to, in listing order"""
+
+    name: str
+    title: str
+    description: str
+    bundle: Source
+    scds: List[Source]
+    priority: str = DEFAULT_PRIORITY
+
+
+class Output(NamedTuple):
+    """One compiled file (``rules``) or managed section (``index``, ``agents``)"""
+
+    path: str
+    target: str
+    kind: str
+    sources: List[Source]
+    concerns: List[Concern]
+
+
+class CompileResult(NamedTuple):
+    """What a compile run did, by output path"""
+
+    written: List[str]
+    unchanged: List[str]
+    removed: List[str]
+    skipped: List[str]  # existing files without the managed marker, left alone
+    unresolved: List[str]  # SCD references no file declares
+    invalid: List[str]  # SCD files that could not be parsed
+    packing: Dict[str, PackResult]  # by target, empty without a token budget
+
+
+class OutputStatus(NamedTuple):
+    """Sync state of one compiled output"""
+
+    path: str
+    target: str
+    state: str  # one of OUTPUT_STATES
+    changed: List[str]  # source files changed or gone since the output was compiled
+
+
+class ConcernStatus(NamedTuple):
+    """Coverage of one concern and the sync state of its compiled rules"""
+
+    name: str
+    bundle: str | None  # bundle file, None if the concern has no bundle
+    scds: List[str]  # SCD IDs the bundle lists
+    missing: List[str]  # SCD names the concern template lists but the bundle doesn't
+    coverage: str  # "covered", "partial" or "missing"
+    state: str | None  # worst state of its rules files, None if it has no SCDs
+
+
+# Output states, from best to worst ("omitted": every SCD of a concern was packed out by
+# the token budget, so it has no rules file)
+OUTPUT_STATES = (
+    "in-sync", "omitted", "edited", "out-of-sync", "missing", "not-compiled", "not-managed"
+)
+
+
+def find_sources(root: Path) -> tuple[Path, Path] | None:
+    """Find the concern bundle and SCD directories of a project (relative to root)"""
+    for concerns_dir, scd_dir in SOURCE_LAYOUTS:
+        if (root / concerns_dir).is_dir():
+            return concerns_dir, scd_dir
+    return None
+
+
+def applies_to_paths(data: Any) -> List[str]:
+    """Get an SCD's ``applies_to.paths`` globs (empty if it applies everywhere)"""
+    applies_to = data.get("applies_to") if isinstance(data, dict) else None
+    paths = applies_to.get("paths") if isinstance(applies_to, dict) else None
+    globs = [str(p) for p in paths if p] if isinstance(paths, list) else []
+    return [] if any(glob in _GLOBAL_GLOBS for glob in globs) else globs
+
+
+def _relative(path: Path, root: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return Path(os.path.relpath(path, root)).as_posix()
+
+
+def _label(key: Any) -> str:
+    text = str(key).replace("_", " ").replace("-", " ").strip()
+    return text[:1].upper() + text[1:]
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else str(value).strip()
+
+
+def render_value(value: Any, indent: int = 0) -> List[str]:
+    """Render SCD content as nested Markdown bullets (keys become bold labels)"""
+    if isinstance(value, dict):
+        lines = []
+        for key, item in value.items():
+            lines.extend(_render_entry(f"**{_label(key)}:**", item, indent))
+        return lines
+    if isinstance(value, (list, tuple)):
+        return [line for item in value for line in _render_entry("", item, indent)]
+    return _render_entry("", value, indent)
+
+
+def _render_entry(label: str, value: Any, indent: int) -> List[str]:
+    pad = "  " * indent
+    if isinstance(value, dict) and value and not label:
+        # A mapping inside a list: its first field is the bullet, the rest nest under it
+        (key, first), *rest = value.items()
+        return _render_entry(f"**{_label(key)}:**", first, indent) + render_value(
+            dict(rest), indent + 1
+        )
+    if isinstance(value, (dict, list, tuple)):
+        if not label:
+            return render_value(value, indent)
+        return [f"{pad}- {label}"] + render_value(value, indent + 1)
+    first, *more = _scalar(value).splitlines() or [""]
+    lines = [f"{pad}- " + " ".join(part for part in (label, first) if part)]
+    lines.extend(f"{pad}  {line}".rstrip() for line in more)
+    return lines
+
+
+def render_scd(scd_id: str, data: Any, level: int = 2) -> List[str]:
+    """Render one SCD as a Markdown section: title, description, summary, content"""
+    data = data if isinstance(data, dict) else {}
+    lines = [f"{'#' * level} {data.get('title') or scd_id}", ""]
+    description = _scalar(data.get("description"))
+    if description:
+        lines += [description, ""]
+    content = data.get("content")
+    if isinstance(content, dict):
+        summary = content.get("summary")
+        if isinstance(summary, str) and summary.strip():
+            lines += [summary.strip(), ""]
+        content = {key: value for key, value in content.items() if key != "summary"}
+    if isinstance(content, str):
+        lines += [content.strip(), ""]
+    elif content:
+        lines += render_value(content) + [""]
+    return lines
+
+
+def _omitted_note(result: PackResult, budget: str) -> List[str]:
+    """Say which SCDs the packer left out, listing the first few"""
+    if not result.omitted:
+        return []
+    ids = ", ".join(f"`{scd_id}`" for scd_id in result.omitted[:_OMITTED_LISTED])
+    more = len(result.omitted) - _OMITTED_LISTED
+    if more > 0:
+        ids += f" and {more} more"
+    return ["", f"*{len(result.omitted)} SCD(s) left out to fit {budget}: {ids}.*"]
+
+
+def _attribution(sources: List[Source], what: str) -> str:
+    ids = ", ".join(f"`{source.id}`" for source in sources)
+    return f"*Compiled by `scs compile` from {ids}. Edit the sources, not this {what}.*"
+
+
+def extract_section(text: str | None) -> str | None:
+    """Get the managed section of a shared file (markers included), if present"""
+    if text is None:
+        return None
+    start = text.find(SECTION_START)
+    end = text.find(SECTION_END, start)
+    if start == -1 or end == -1:
+        return None
+    return text[start:end + len(SECTION_END)]
+
+
+def splice_section(text: str | None, section: str) -> str:
+    """Replace (or append) the managed section, leaving the rest of the file alone"""
+    if not text or not text.strip():
+        return section + "\n"
+    current = extract_section(text)
+    if current is not None:
+        return text.replace(current, section, 1)
+    return text.rstrip("\n") + "\n\n" + section + "\n"
+
+
+def is_managed(text: str) -> bool:
+    """Check whether a rules file is owned by the compiler"""
+    return MANAGED_MARKER in text[:_MARKER_WINDOW]
+
+
+class Compiler:
+    """Plans, renders and writes the compiled outputs of one project
+
+    Args:
+        root: Project root (outputs and the manifest are written under it)
+        concerns_dir: Concern bundle directory (default: found from SOURCE_LAYOUTS)
+        scd_root: Directory the listed SCDs are looked up in
+        targets: Output targets to compile (see TARGETS)
+        jobs: Number of parsing/rendering threads
+        budget: Token budget of the always-loaded SCDs of each target (None: no limit)
+        focus: SCD IDs being worked on, packed first with what they depend on
+    """
+
+    def __init__(
+        self,
+        root: Path = Path("."),
+        concerns_dir: Path | None = None,
+        scd_root: Path | None = None,
+        targets: Iterable[str] = ("claude",),
+        jobs: int | None = None,
+        budget: int | None = None,
+        focus: Iterable[str] = (),
+    ):
+        self.root = Path(root)
+        layout = find_sources(self.root)
+        if concerns_dir is None:
+            concerns_dir = (layout or SOURCE_LAYOUTS[0])[0]
+        if scd_root is None:
+            scd_root = layout[1] if layout and layout[0] == concerns_dir else Path(".")
+        self.concerns_dir = self.root / concerns_dir
+        self.scd_root = self.root / scd_root
+        self.targets = [t for t in TARGETS if t in set(targets)]
+        self.jobs = jobs
+        self.budget = budget
+        self.focus = [*dict.fromkeys(focus)]
+        self.manifest_file = self.root / COMPILE_MANIFEST_FILE
+        self.manifest = self._load_manifest()
+        self.parsed: Dict[str, Any] = {}
+        self.facts: Dict[str, Dict] = {}
+        self.paths: Dict[str, List[str]] = {}
+        self.packing: Dict[str, PackResult] = {}
+        self.outputs: List[Output] = []
+        self.skipped: Set[str] = set()
+        self.unresolved: List[str] = []
+        self.invalid: List[str] = []
+
+    def _load_manifest(self) -> Dict:
+        self._manifest_text = None
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                self._manifest_text = f.read()
+            data = json.loads(self._manifest_text)
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict):
+            return {"format": _MANIFEST_FORMAT, "documents": {}, "outputs": {}}
+        if data.get("format") != _MANIFEST_FORMAT:
+            # Keep which outputs are managed, so ones no longer produced are still removed
+            outputs = data.get("outputs")
+            return {
+                "format": _MANIFEST_FORMAT,
+                "documents": {},
+                "outputs": {
+                    path: {"target": entry.get("target"), "kind": entry.get("kind")}
+                    for path, entry in (outputs if isinstance(outputs, dict) else {}).items()
+                    if isinstance(entry, dict)
+                },
+            }
+        data.setdefault("documents", {})
+        data.setdefault("outputs", {})
+        return data
+
+    def _parse_all(self, files: Iterable[str]) -> None:
+        """Parse source files not parsed yet, on the thread pool"""
+        pending = [f for f in dict.fromkeys(files) if f not in self.parsed]
+        if not pending:
+            return
+
+        def parse(file):
+            try:
+                return load_document(self.root / file)
+            except ValidationError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            self.parsed.update(zip(pending, executor.map(parse, pending)))
+
+    def load_concerns(self, cache: DigestCache | None = None) -> List[Concern]:
+        """Resolve every concern bundle and hash it and its SCDs
+
+        Only the bundles are parsed; SCD files unchanged since they were last
+        hashed (by the digest cache) are not read at all.
+
+        Raises:
+            FileNotFoundError: If the concern bundle directory doesn't exist
+        """
+        if not self.concerns_dir.is_dir():
+            raise FileNotFoundError(
+                "No concern bundles found (looked in "
+                + ", ".join(str(c) for c, _ in SOURCE_LAYOUTS)
+                + ")"
+            )
+        bundle_files = [
+            path
+            for path in sorted(self.concerns_dir.glob("*.yaml"))
+            if not is_version_artifact(path)
+        ]
+        scd_files = index_scd_files(self.scd_root)
+        documents: Dict[Path, Any] = {}
+        graphs = [load_bundle_graph(path, scd_files, documents) for path in bundle_files]
+
+        paths = bundle_files + [p for graph in graphs for p in graph.scd_files.values()]
+        leaves = hash_leaves(paths, cache, self.jobs)
+
+        concerns = []
+        for path, graph in zip(bundle_files, graphs):
+            self.unresolved.extend(r for r in graph.unresolved if r.startswith("scd:"))
+            data = documents.get(path.resolve()) or {}
+            bundle = Source(graph.root, _relative(path, self.root), leaves.get(path, ""))
+            scds = []
+            seen = set()
+            for node in graph.bundles.values():
+                for scd_id in node.scds:
+                    scd_path = graph.scd_files.get(scd_id)
+                    if scd_path is None or scd_id in seen:
+                        continue
+                    seen.add(scd_id)
+                    file = _relative(scd_path, self.root)
+                    if scd_path not in leaves:
+                        self.invalid.append(file)
+                        continue
+                    scds.append(Source(scd_id, file, leaves[scd_path]))
+            concerns.append(
+                Concern(
+                    path.stem,
+                    str(data.get("title") or _label(path.stem)),
+                    str(data.get("description") or "").strip(),
+                    bundle,
+                    scds,
+                    priority_of(data),
+                )
+            )
+        self.unresolved = sorted(set(self.unresolved))
+        self.invalid = sorted(set(self.invalid))
+        return concerns
+
+    def scd_facts(self, concerns: List[Concern]) -> Dict[str, Dict]:
+        """Get what planning needs to know about every SCD, by file
+
+        That is its ``applies_to.paths``, estimated tokens, priority and the
+        SCDs it depends on. Recorded facts are reused for files whose digest
+        is unchanged; only new or changed SCDs are parsed.
+        """
+        recorded = self.manifest["documents"]
+        scds = {s.file: s for c in concerns for s in c.scds}
+        changed = [
+            file for file, s in scds.items()
+            if (recorded.get(file) or {}).get("digest") != s.digest
+        ]
+        self._parse_all(changed)
+        for file in changed:
+            data = self.parsed.get(file)
+            recorded[file] = {
+                "digest": scds[file].digest,
+                "paths": applies_to_paths(data),
+                "tokens": estimate_tokens("\n".join(render_scd(scds[file].id, data))),
+                "priority": priority_of(data),
+                "depends_on": dependencies_of(data),
+            }
+        for file in [f for f in recorded if f not in scds]:
+            del recorded[file]
+        return {file: recorded[file] for file in scds}
+
+    def pack(self, concerns: List[Concern], general_only: bool = False) -> PackResult:
+        """Choose the SCDs of some concerns that fit the token budget
+
+        An SCD listed by several concerns gets the weight of the highest
+        priority one.
+
+        Args:
+            concerns: Planned concerns (see scd_facts)
+            general_only: Leave out path-specific SCDs (they aren't always loaded)
+
+        Returns:
+            PackResult
+        """
+        items: Dict[str, PackItem] = {}
+        for concern in concerns:
+            weight = priority_weight(concern.priority)
+            for scd in concern.scds:
+                facts = self.facts[scd.file]
+                if general_only and facts["paths"]:
+                    continue
+                if scd.id in items:
+                    if weight > items[scd.id].weight:
+                        items[scd.id] = items[scd.id]._replace(weight=weight)
+                    continue
+                items[scd.id] = PackItem(
+                    scd.id, facts["tokens"], facts["priority"], weight, tuple(facts["depends_on"])
+                )
+        return pack(items.values(), self.budget, self.focus)
+
+    def _packed(self, concerns: List[Concern], target: str) -> List[Concern]:
+        """Pack a target's SCDs; concerns keep the packed SCDs in packing order"""
+        if self.budget is None:
+            return concerns
+        result = self.packing[target] = self.pack(concerns, general_only=target == "claude")
+        rank = {scd_id: i for i, scd_id in enumerate(result.selected)}
+        candidates = {*rank, *result.omitted}
+        packed = []
+        for concern in concerns:
+            # SCDs that weren't candidates (path-specific ones) are kept as they are
+            kept = [s for s in concern.scds if s.id in rank or s.id not in candidates]
+            kept.sort(key=lambda s: rank.get(s.id, -1))
+            packed.append(concern._replace(scds=kept))
+        return packed
+
+    def plan(self, concerns: List[Concern]) -> List[Output]:
+        """Map concern bundles to the outputs of each target"""
+        self.facts = self.scd_facts(concerns)
+        paths = self.paths = {file: facts["paths"] for file, facts in self.facts.items()}
+        outputs: List[Output] = []
+        self.outputs = outputs
+        self.packing = {}
+        all_concerns = concerns
+
+        if "claude" in self.targets:
+            concerns = self._packed(all_concerns, "claude")
+            rules: List[Output] = []
+            taken = {(RULES_DIR / f"{c.name}.md").as_posix() for c in concerns}
+            path_specific: Dict[str, Output] = {}
+            for concern in concerns:
+                general = [s for s in concern.scds if not paths[s.file]]
+                if general:
+                    file = (RULES_DIR / f"{concern.name}.md").as_posix()
+                    sources = [concern.bundle] + general
+                    rules.append(
+                        Output(file, "claude", "rules", sources, [concern._replace(scds=general)])
+                    )
+                for scd in concern.scds:
+                    if not paths[scd.file] or scd.id in path_specific:
+                        continue
+                    name = scd.id.split(":")[-1]
+                    file = (RULES_DIR / f"{name}.md").as_posix()
+                    if file in taken:
+                        file = (RULES_DIR / f"{concern.name}-{name}.md").as_posix()
+                    taken.add(file)
+                    path_specific[scd.id] = Output(
+                        file, "claude", "rules", [scd], [concern._replace(scds=[scd])]
+                    )
+            rules.extend(path_specific.values())
+            outputs.extend(rules)
+            # The index only depends on bundles and on which SCDs are path-specific
+            index_sources = [c.bundle for c in concerns]
+            index_sources.extend(o.sources[0] for o in path_specific.values())
+            outputs.append(
+                Output(CLAUDE_FILE.as_posix(), "claude", "index", index_sources, concerns)
+            )
+
+        if "agents" in self.targets:
+            # Every candidate SCD is a source: packing decisions depend on all of them
+            sources = [c.bundle for c in all_concerns]
+            sources += [s for c in all_concerns for s in c.scds]
+            concerns = self._packed(all_concerns, "agents")
+            outputs.append(Output(AGENTS_FILE.as_posix(), "agents", "agents", sources, concerns))
+        return outputs
+
+    def render(self, output: Output) -> str:
+        """Render the managed text of an output (the file, or the marked section)"""
+        if output.kind == "rules":
+            return self._render_rules(output)
+        if output.kind == "index":
+            return self._render_index(output)
+        return self._render_agents(output)
+
+    def _render_rules(self, output: Output) -> str:
+        concern = output.concerns[0]
+        lines = []
+        if output.sources[0] is not concern.bundle:
+            # A path-specific SCD: Claude Code loads it only for matching files
+            scd = output.sources[0]
+            lines += ["---", "paths:"]
+            lines += [f"  - {json.dumps(glob)}" for glob in self.paths[scd.file]]
+            lines += ["---", MANAGED_MARKER, ""]
+            lines += render_scd(scd.id, self.parsed.get(scd.file), level=1)
+        else:
+            lines += [MANAGED_MARKER, "", f"# {concern.title}", ""]
+            if concern.description:
+                lines += [concern.description, ""]
+            for scd in concern.scds:
+                lines += render_scd(scd.id, self.parsed.get(scd.file))
+        lines += ["---", "", _attribution(output.sources, "file")]
+        return "\n".join(lines) + "\n"
+
+    def _render_index(self, output: Output) -> str:
+        general = {}
+        path_specific = []
+        for rules in self.outputs:
+            if rules.kind != "rules" or rules.path in self.skipped:
+                continue
+            concern = rules.concerns[0]
+            if rules.sources[0] is concern.bundle:
+                general[concern.name] = rules.path
+            else:
+                path_specific.append(rules)
+
+        lines = [SECTION_START, "## Project Context", ""]
+        lines += ["Compiled from the project's SCDs by `scs compile`. Detailed rules:", ""]
+        lines += ["| Concern | Rules |", "|---------|-------|"]
+        for concern in output.concerns:
+            if concern.name in general:
+                file = general[concern.name]
+                lines.append(f"| {concern.title} | [{file}]({file}) |")
+        if path_specific:
+            lines += ["", "Path-specific rules (loaded only for matching files):", ""]
+            for rules in path_specific:
+                globs = ", ".join(f"`{g}`" for g in self.paths[rules.sources[0].file])
+                lines.append(f"- [{rules.path}]({rules.path}): {globs}")
+        if "claude" in self.packing:
+            lines += _omitted_note(self.packing["claude"], f"the {self.budget}-token budget")
+        lines.append(SECTION_END)
+        return "\n".join(lines)
+
+    def _render_agents(self, output: Output) -> str:
+        lines = [SECTION_START, "## Project Context", ""]
+        lines += [_attribution([c.bundle for c in output.concerns], "section"), ""]
+        seen = set()
+        for concern in output.concerns:
+            scds = [scd for scd in concern.scds if scd.id not in seen]
+            if not scds:
+                continue
+            seen.update(scd.id for scd in scds)
+            lines += [f"### {concern.title}", ""]
+            if concern.description:
+                lines += [concern.description, ""]
+            for scd in scds:
+                section = render_scd(scd.id, self.parsed.get(scd.file), level=4)
+                globs = self.paths.get(scd.file)
+                if globs:
+                    applies = ", ".join(f"`{g}`" for g in globs)
+                    section[2:2] = [f"*Applies to: {applies}*", ""]
+                lines += section
+        if "agents" in self.packing:
+            note = _omitted_note(self.packing["agents"], f"the {self.budget}-token budget")
+            lines += note[1:] + note[:1]
+        lines.append(SECTION_END)
+        return "\n".join(lines)
+
+    def _read(self, output: Output) -> str | None:
+        try:
+            with open(self.root / output.path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _is_fresh(self, output: Output, managed: str | None) -> bool:
+        entry = self.manifest["outputs"].get(output.path)
+        return (
+            entry is not None
+            and managed is not None
+            and entry.get("sources") == [[*source] for source in output.sources]
+            and entry.get("packing") == self._packing_key()
+            and entry.get("digest") == _text_digest(managed)
+        )
+
+    def _packing_key(self) -> List | None:
+        """What packing depends on besides the sources (recorded with each output)"""
+        return None if self.budget is None else [self.budget, self.focus]
+
+    def _write(self, output: Output, text: str | None, managed: str | None) -> bool:
+        """Render an output and write it if it differs; returns whether it was written"""
+        rendered = self.render(output)
+        if rendered != managed:
+            content = rendered if output.kind == "rules" else splice_section(text, rendered)
+            write_file_atomic(self.root / output.path, content.encode("utf-8"))
+        self.manifest["outputs"][output.path] = {
+            "target": output.target,
+            "kind": output.kind,
+            "sources": [[*source] for source in output.sources],
+            "packing": self._packing_key(),
+            "digest": _text_digest(rendered),
+        }
+        return rendered != managed
+
+    def compile(self, force: bool = False) -> CompileResult:
+        """Bring every output of the selected targets up to date
+
+        Outputs whose recorded sources and managed content are unchanged are
+        skipped; the others are rendered and written (atomically) in
+        parallel. Rules files without the managed marker are never
+        overwritten, and managed rules files that are no longer produced are
+        removed.
+
+        Args:
+            force: Re-render every output, even if nothing changed
+
+        Returns:
+            CompileResult
+        """
+        cache = DigestCache(self.root / DIGEST_CACHE_FILE)
+        concerns = self.load_concerns(cache)
+        outputs = self.plan(concerns)
+        if "claude" in self.targets:
+            self._record_omitted(concerns, outputs)
+        written: List[str] = []
+        unchanged: List[str] = []
+        skipped: List[str] = []
+        removed: List[str] = []
+
+        stale = []
+        for output in outputs:
+            text = self._read(output)
+            if output.kind == "rules":
+                if text is not None and not is_managed(text):
+                    skipped.append(output.path)
+                    self.skipped.add(output.path)
+                    self.manifest["outputs"].pop(output.path, None)
+                    continue
+                managed = text
+            else:
+                managed = extract_section(text)
+            # The index is rendered from bundles alone, so it is always checked
+            if not force and output.kind != "index" and self._is_fresh(output, managed):
+                unchanged.append(output.path)
+            else:
+                stale.append((output, text, managed))
+
+        self._parse_all(
+            source.file
+            for output, _, _ in stale
+            for source in output.sources
+            if source.id.startswith("scd:")
+        )
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            changed = executor.map(lambda item: self._write(*item), stale)
+            for (output, _, _), was_written in zip(stale, [*changed]):
+                (written if was_written else unchanged).append(output.path)
+
+        planned = {output.path for output in outputs}
+        for path, entry in [*self.manifest["outputs"].items()]:
+            if path in planned or entry.get("target") not in self.targets:
+                continue
+            del self.manifest["outputs"][path]
+            file_path = self.root / path
+            if entry.get("kind") == "rules" and file_path.is_file():
+                with open(file_path, "r", encoding="utf-8") as f:
+                    if not is_managed(f.read(_MARKER_WINDOW)):
+                        continue
+                file_path.unlink()
+                removed.append(path)
+
+        manifest = json.dumps(self.manifest, sort_keys=True, separators=(",", ":"))
+        if manifest != self._manifest_text:
+            write_file_atomic(self.manifest_file, manifest.encode("utf-8"))
+        cache.save()
+        return CompileResult(
+            sorted(written),
+            sorted(unchanged),
+            removed,
+            skipped,
+            self.unresolved,
+            self.invalid,
+            self.packing,
+        )
+
+    def _record_omitted(self, concerns: List[Concern], outputs: List[Output]) -> None:
+        """Record the concerns the budget left without rules, with their sources
+
+        ``scs status`` reports them as omitted rather than not compiled, as
+        long as their sources are unchanged.
+        """
+        produced = {c.name for o in outputs if o.kind == "rules" for c in o.concerns}
+        omitted = {
+            concern.name: {
+                "sources": [[*source] for source in [concern.bundle, *concern.scds]],
+            }
+            for concern in concerns
+            if concern.scds and concern.name not in produced and "claude" in self.packing
+        }
+        if omitted:
+            self.manifest["omitted"] = omitted
+        else:
+            self.manifest.pop("omitted", None)
+
+    def recorded_packing(self) -> List | None:
+        """The [budget, focus] the outputs were last compiled with (None: no budget)"""
+        for entry in self.manifest["outputs"].values():
+            if entry.get("packing"):
+                return entry["packing"]
+        return None
+
+    def _source_digests(self, files: Iterable[str], cache: DigestCache | None) -> Dict[str, str]:
+        """Current leaf digests of source files (files that are gone are left out)
+
+        Files whose inode, mtime and size match the digest cache are not read.
+        """
+        paths = {file: self.root / file for file in dict.fromkeys(files)}
+        leaves = hash_leaves(paths.values(), cache, self.jobs)
+        return {file: leaves[path] for file, path in paths.items() if path in leaves}
+
+    def _output_state(self, path: str, entry: Dict, digests: Dict[str, str]) -> OutputStatus:
+        changed = [
+            file for _, file, digest in entry.get("sources") or []
+            if digests.get(file) != digest
+        ]
+        try:
+            with open(self.root / path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            text = None
+        if entry.get("kind") == "rules":
+            managed = text if text is not None and is_managed(text) else None
+        else:
+            managed = extract_section(text)
+
+        if text is None or (managed is None and entry.get("kind") != "rules"):
+            state = "missing"
+        elif managed is None:
+            state = "not-managed"
+        elif changed or "digest" not in entry:  # no digest: recorded by an older format
+            state = "out-of-sync"
+        elif _text_digest(managed) != entry.get("digest"):
+            state = "edited"
+        else:
+            state = "in-sync"
+        return OutputStatus(path, entry.get("target", ""), state, changed)
+
+    def status(
+        self, cache: DigestCache | None = None
+    ) -> tuple[List[ConcernStatus], List[OutputStatus]]:
+        """Check compiled outputs against their sources and concern coverage
+
+        Only the files recorded in the compile manifest are checked (the
+        tree is not walked), and only those whose inode, mtime or size
+        changed are hashed, so this is fast on large projects.
+
+        Args:
+            cache: Digest cache (default: the project's)
+
+        Returns:
+            (one ConcernStatus per concern: the 11 software development
+            concerns, then any other concern bundles; one OutputStatus per
+            recorded output)
+        """
+        if cache is None:
+            cache = DigestCache(self.root / DIGEST_CACHE_FILE)
+        recorded = self.manifest["outputs"]
+        omitted = self.manifest.get("omitted") or {}
+        digests = self._source_digests(
+            (
+                file
+                for entry in [*recorded.values(), *omitted.values()]
+                for _, file, _ in entry.get("sources") or []
+            ),
+            cache,
+        )
+        outputs = [
+            self._output_state(path, entry, digests) for path, entry in sorted(recorded.items())
+        ]
+        cache.save()
+
+        names = [*SOFTWARE_DEVELOPMENT_CONCERNS]
+        if self.concerns_dir.is_dir():
+            names += sorted(
+                path.stem
+                for path in self.concerns_dir.glob("*.yaml")
+                if path.stem not in names and not is_version_artifact(path)
+            )
+        # Rules files by the IDs of the bundles and SCDs they were compiled from
+        rules_by_id: Dict[str, List[OutputStatus]] = {}
+        for output in outputs:
+            entry = recorded[output.path]
+            if entry.get("kind") == "rules":
+                for source in entry.get("sources") or []:
+                    rules_by_id.setdefault(source[0], []).append(output)
+        try:
+            config = load_document(self.root / ".scs" / "config")
+        except ValidationError:
+            config = None
+        project_type = config.get("project_type") if isinstance(config, dict) else None
+        concerns = [
+            self._concern_status(name, rules_by_id, str(project_type or "standard"))
+            for name in names
+        ]
+        # Concerns packed out by the budget: omitted unless their sources changed since
+        for i, concern in enumerate(concerns):
+            entry = omitted.get(concern.name)
+            if entry is None or concern.state != "not-compiled":
+                continue
+            changed = [
+                file for _, file, digest in entry.get("sources") or []
+                if digests.get(file) != digest
+            ]
+            concerns[i] = concern._replace(state="out-of-sync" if changed else "omitted")
+        return concerns, outputs
+
+    def _concern_status(
+        self, name: str, rules_by_id: Dict[str, List[OutputStatus]], project_type: str
+    ) -> ConcernStatus:
+        expected = _template_scds(name, project_type)
+        bundle_path = self.concerns_dir / f"{name}.yaml"
+        try:
+            data = load_document(bundle_path)
+        except ValidationError:
+            return ConcernStatus(name, None, [], expected, "missing", None)
+
+        data = data if isinstance(data, dict) else {}
+        scds = [ref for ref in data.get("scds") or [] if isinstance(ref, str)]
+        listed = {ref.split(":")[-1] for ref in scds}
+        missing = [scd for scd in expected if scd not in listed]
+        if not scds:
+            coverage = "missing"
+        else:
+            coverage = "partial" if missing else "covered"
+
+        state = None
+        if scds:
+            # Rules files compiled from this bundle or from SCDs it lists
+            ids = [str(data.get("id", "")), *scds]
+            mine = [output for i in ids for output in rules_by_id.get(i, [])]
+            if mine:
+                state = max((o.state for o in mine), key=OUTPUT_STATES.index)
+            elif (self.root / RULES_DIR / f"{name}.md").exists():
+                state = "not-managed"
+            else:
+                state = "not-compiled"
+        bundle_file = _relative(bundle_path, self.root)
+        return ConcernStatus(name, bundle_file, scds, missing, coverage, state)
+
+
+def _template_scds(concern: str, project_type: str) -> List[str]:
+    """SCD names a concern's template lists for a project type (empty if there is no template)"""
+    template = get_template_path() / "bundles" / "concerns" / f"{concern}.yaml"
+    try:
+        with open(template, "r", encoding="utf-8") as f:
+            text = f.read()
+        if "{%" in text:
+            # Some SCDs are only listed for some project types
+            text = render_template(text, {"config": get_project_type_config(project_type)})
+        data = yaml.load(text, Loader=YAML_LOADER)
+    except (OSError, yaml.YAMLError):
+        return []
+    refs = data.get("scds") if isinstance(data, dict) else None
+    return [ref.split(":")[-1] for ref in refs or [] if isinstance(ref, str)]
@@ -1,11 +1,16 @@
 """File and directory utilities"""
 
 import os
+import tempfile
 from pathlib import Path
 from typing import Dict, Any
 import yaml
 from jinja2 import Template
 
+# The process umask (reading it requires setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def create_directory_structure(base_path: Path, project_name: str):
     """Create the SCS 0.3 project directory structure"""
@@ -35,6 +40,26 @@ def write_file(file_path: Path, content: str):
         f.write(content)
 
 
+def write_file_atomic(file_path: Path, content: bytes):
+    """Write a file so readers see either the old or the new content, never a partial file"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = os.stat(file_path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        # mkstemp creates the file 0600; keep the permissions a plain write would give
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
 def copy_template(template_path: Path, dest_path: Path, variables: Dict[str, Any] = None):
     """Copy a template file, optionally rendering it with variables"""
     with open(template_path, 'r', encoding='utf-8') as f:
@@ -0,0 +1,285 @@
+"""Merkle digests over a bundle and every SCD it resolves to"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple
+
+from scs_validator.scd_index import find_workspace_root
+from scs_validator.utils import ValidationError
+
+from scs_tools.utils.bundle_graph import BundleGraph, load_bundle_graph, load_document
+from scs_tools.utils.canonical import canonical_bytes
+
+HASH_ALGORITHM = "sha256"
+
+# Leaf digests of unchanged files are reused from here (relative to the project root)
+DIGEST_CACHE_FILE = Path(".scs") / "digest-cache.json"
+
+# Bumped whenever leaf or tree digests are computed differently
+_CACHE_FORMAT = 3
+
+
+class MerkleTree(NamedTuple):
+    """Digests of a resolved bundle graph"""
+
+    root: str
+    bundle_digests: Dict[str, str]
+    bundle_trees: Dict[str, str]
+    scd_digests: Dict[str, str]
+    unreadable: List[str]  # SCDs whose files could not be read or parsed (not pinned)
+
+
+def leaf_digest_of(data) -> tuple[str, bytes]:
+    """Leaf digest of parsed document data, with the canonical bytes it covers"""
+    content = canonical_bytes(data)
+    return hashlib.sha256(b"leaf\0" + content).hexdigest(), content
+
+
+def leaf_digest(file_path: Path) -> str:
+    """Digest of a document's canonical form (formatting and key order don't matter)"""
+    return leaf_digest_of(load_document(file_path))[0]
+
+
+def tree_digest(leaf: str, children: Dict[str, str | None]) -> str:
+    """Combine a bundle's own digest with its children's (unresolved children hash as empty)"""
+    h = hashlib.sha256(b"node\0" + leaf.encode("ascii"))
+    for key in sorted(children):
+        h.update(b"\0" + key.encode("utf-8") + b"\0" + (children[key] or "").encode("ascii"))
+    return h.hexdigest()
+
+
+class FileCheck(NamedTuple):
+    """Outcome of checking one file against the digest recorded for it"""
+
+    id: str
+    file: str
+    status: str  # "ok", "modified" or "missing"
+    expected: str | None
+    actual: str | None
+
+
+class DigestCache:
+    """Leaf digests remembered by path, inode, mtime and size
+
+    A file whose inode, mtime and size are unchanged since it was last hashed
+    is not read again, so re-hashing (or verifying) a mostly unchanged tree
+    only touches the files (and therefore the subtrees) that changed.
+    """
+
+    def __init__(self, cache_file: Path | None = None):
+        self.cache_file = cache_file
+        self.entries: Dict[str, list] = self._load()
+        self.changed = False
+
+    @classmethod
+    def for_project(cls, path: Path) -> "DigestCache":
+        """Get the digest cache of the SCS project containing a path
+
+        Outside an SCS project the cache lives in memory only.
+        """
+        project_root = find_workspace_root(Path(path))
+        return cls(None if project_root is None else project_root / DIGEST_CACHE_FILE)
+
+    def _load(self) -> Dict[str, list]:
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+            return {}
+        entries = data.get("files")
+        return entries if isinstance(entries, dict) else {}
+
+    def lookup(self, file_path: Path, st: os.stat_result) -> str | None:
+        """Get the cached digest of a file if it hasn't changed since"""
+        entry = self.entries.get(os.path.abspath(file_path))
+        if entry and entry[:3] == [st.st_ino, st.st_mtime_ns, st.st_size]:
+            return entry[3]
+        return None
+
+    def store(self, file_path: Path, st: os.stat_result, digest: str) -> None:
+        """Remember the digest of a file"""
+        self.entries[os.path.abspath(file_path)] = [
+            st.st_ino, st.st_mtime_ns, st.st_size, digest
+        ]
+        self.changed = True
+
+    def save(self) -> None:
+        """Persist the cache if it changed and its directory exists"""
+        if not self.changed or self.cache_file is None:
+            return
+        if not self.cache_file.parent.is_dir():
+            return
+        try:
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump({"format": _CACHE_FORMAT, "files": self.entries}, f)
+        except OSError:
+            pass
+
+
+def hash_leaves(
+    paths: Iterable[Path],
+    cache: DigestCache | None = None,
+    jobs: int | None = None,
+) -> Dict[Path, str]:
+    """Compute leaf digests of many files, reusing cached digests where possible
+
+    Files that need hashing are read, parsed and hashed on a thread pool.
+
+    Args:
+        paths: Files to hash
+        cache: Optional digest cache (updated with new digests)
+        jobs: Number of threads (default: chosen by ThreadPoolExecutor)
+
+    Returns:
+        Mapping of path to leaf digest (files that can't be read or parsed
+        are left out)
+    """
+    digests: Dict[Path, str] = {}
+    stale = []
+    for path in dict.fromkeys(paths):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        cached = cache.lookup(path, st) if cache is not None else None
+        if cached is not None:
+            digests[path] = cached
+        else:
+            stale.append((path, st))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            computed = executor.map(_try_leaf_digest, [path for path, _ in stale])
+            for (path, st), digest in zip(stale, computed):
+                if digest is None:
+                    continue
+                digests[path] = digest
+                if cache is not None:
+                    cache.store(path, st, digest)
+    return digests
+
+
+def _try_leaf_digest(file_path: Path) -> str | None:
+    """leaf_digest, or None if the file can't be read or parsed"""
+    try:
+        return leaf_digest(file_path)
+    except ValidationError:
+        return None
+
+
+def compute_merkle_tree(
+    graph: BundleGraph,
+    cache: DigestCache | None = None,
+    jobs: int | None = None,
+    leaves: Dict[Path, str] | None = None,
+) -> MerkleTree:
+    """Compute the Merkle tree of a resolved bundle graph
+
+    Leaves are the canonical digests of every bundle and SCD file. Each
+    bundle's tree digest combines its own leaf with the tree digests of the
+    bundles it imports and the leaves of the SCDs it lists, so the root
+    digest changes if any file in the graph changes.
+
+    Args:
+        graph: Resolved bundle graph
+        cache: Optional digest cache
+        jobs: Number of hashing threads
+        leaves: Optional leaf digests already computed, by path
+
+    Returns:
+        MerkleTree with the root digest and per-bundle and per-SCD digests;
+        SCD files that can't be parsed hash like unresolved references and
+        are listed in ``unreadable``
+    """
+    leaves = dict(leaves or {})
+    paths = [node.path for node in graph.bundles.values()] + list(graph.scd_files.values())
+    leaves.update(hash_leaves([p for p in paths if p not in leaves], cache, jobs))
+    bundle_digests = {
+        bundle_id: leaves.get(node.path, "") for bundle_id, node in graph.bundles.items()
+    }
+    scd_digests = {
+        scd_id: leaves[path] for scd_id, path in sorted(graph.scd_files.items()) if path in leaves
+    }
+    unreadable = sorted(scd_id for scd_id in graph.scd_files if scd_id not in scd_digests)
+
+    bundle_trees: Dict[str, str] = {}
+
+    def subtree(bundle_id: str, path: tuple) -> str | None:
+        if bundle_id in bundle_trees:
+            return bundle_trees[bundle_id]
+        node = graph.bundles.get(bundle_id)
+        if node is None or bundle_id in path:
+            # Unresolved import, or an import cycle back to an ancestor
+            return None
+        children: Dict[str, str | None] = {
+            scd_id: scd_digests.get(scd_id) for scd_id in node.scds
+        }
+        for imported in node.imports:
+            children[imported] = subtree(imported, path + (bundle_id,))
+        bundle_trees[bundle_id] = tree_digest(bundle_digests[bundle_id], children)
+        return bundle_trees[bundle_id]
+
+    root = subtree(graph.root, ())
+    return MerkleTree(
+        root, bundle_digests, dict(sorted(bundle_trees.items())), scd_digests, unreadable
+    )
+
+
+def verify_merkle(
+    section: Dict,
+    base_dir: Path,
+    root_bundle: Path,
+    cache: DigestCache | None = None,
+    jobs: int | None = None,
+) -> tuple[List[FileCheck], str | None]:
+    """Check every file pinned by a manifest's ``merkle`` section
+
+    Each bundle and SCD file is re-hashed (or its cached digest reused) and
+    compared with its recorded digest. If all of them match, the Merkle root
+    is recomputed from the same files to confirm the graph itself (which
+    bundles import which, which SCDs they list) is unchanged.
+
+    Args:
+        section: The manifest's ``merkle`` section
+        base_dir: Directory the recorded file paths are relative to
+        root_bundle: Versioned bundle file at the root of the graph
+        cache: Optional digest cache
+        jobs: Number of hashing threads
+
+    Returns:
+        (one FileCheck per pinned file, recomputed root or None if any file
+        didn't match)
+    """
+    entries = [
+        (entry_id, entry)
+        for group in ("bundles", "scds")
+        for entry_id, entry in sorted((section.get(group) or {}).items())
+    ]
+    paths = {entry_id: base_dir / entry["file"] for entry_id, entry in entries}
+    leaves = hash_leaves(paths.values(), cache, jobs)
+
+    checks = []
+    for entry_id, entry in entries:
+        path = paths[entry_id]
+        actual = leaves.get(path)
+        if actual is None:
+            status = "missing" if not path.exists() else "modified"
+        else:
+            status = "ok" if actual == entry["digest"] else "modified"
+        checks.append(FileCheck(entry_id, entry["file"], status, entry["digest"], actual))
+
+    if any(check.status != "ok" for check in checks):
+        return checks, None
+
+    scd_files = {
+        scd_id: paths[scd_id] for scd_id in (section.get("scds") or {})
+    }
+    graph = load_bundle_graph(root_bundle, scd_files)
+    return checks, compute_merkle_tree(graph, cache, jobs, leaves).root
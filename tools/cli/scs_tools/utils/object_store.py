@@ -0,0 +1,107 @@
+"""Content-addressed store of canonicalized SCDs and bundles"""
+
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from scs_validator.scd_index import find_workspace_root
+
+from scs_tools.utils.bundle_graph import load_document
+from scs_tools.utils.files import write_file_atomic
+from scs_tools.utils.merkle import leaf_digest_of
+
+# Object store of an SCS project, relative to its root
+OBJECTS_DIR = Path(".scs") / "objects"
+
+
+class ObjectStore:
+    """Stores each document once, under the digest recorded in version manifests
+
+    Objects hold a document's canonical form (compact JSON, which is also
+    valid YAML) and are named by its Merkle leaf digest, laid out as
+    ``objects/ab/cdef...``. Objects are immutable: writing a digest that is
+    already present is a no-op.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    @classmethod
+    def for_project(cls, path: Path) -> "ObjectStore | None":
+        """Get the object store of the SCS project containing a path
+
+        Returns:
+            The store under the project root's .scs/, or None if the path
+            isn't inside an SCS project
+        """
+        project_root = find_workspace_root(Path(path))
+        return None if project_root is None else cls(project_root / OBJECTS_DIR)
+
+    def path_for(self, digest: str) -> Path:
+        """Get the file an object is (or would be) stored in"""
+        return self.root / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        """Check whether an object is stored"""
+        return self.path_for(digest).is_file()
+
+    def put_file(self, file_path: Path, digest: str | None = None) -> Tuple[str, bool]:
+        """Store a document file's canonical form
+
+        Args:
+            file_path: YAML or JSON document
+            digest: Digest already recorded for the file; if that object is
+                present the file is not read at all
+
+        Returns:
+            (digest, whether a new object was written)
+
+        Raises:
+            ValueError: If ``digest`` is given but doesn't match the file
+        """
+        if digest is not None and self.has(digest):
+            return digest, False
+        actual, content = leaf_digest_of(load_document(file_path))
+        if digest is not None and actual != digest:
+            raise ValueError(f"{file_path} changed since it was hashed")
+        if self.has(actual):
+            return actual, False
+        self._write(actual, content)
+        return actual, True
+
+    def _write(self, digest: str, content: bytes) -> None:
+        """Write an object atomically (a partial object is never visible)"""
+        write_file_atomic(self.path_for(digest), content)
+
+    def put_all(self, entries: Iterable[Tuple[Path, str]]) -> Tuple[int, int]:
+        """Store many (file, recorded digest) pairs
+
+        Returns:
+            (objects written, objects already present)
+        """
+        written = present = 0
+        for file_path, digest in entries:
+            _, new = self.put_file(file_path, digest)
+            if new:
+                written += 1
+            else:
+                present += 1
+        return written, present
+
+    def missing(self, digests: Iterable[str]) -> List[str]:
+        """List the digests that have no stored object"""
+        return [digest for digest in digests if not self.has(digest)]
+
+    def materialize(self, files: Dict[Path, str]) -> None:
+        """Write stored objects out to files
+
+        Args:
+            files: Mapping of destination path to object digest
+
+        Raises:
+            FileNotFoundError: If an object is not stored
+        """
+        for destination, digest in files.items():
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            # copyfile uses the kernel's in-place copy where available
+            shutil.copyfile(self.path_for(digest), destination)
@@ -0,0 +1,223 @@
+"""Select and order SCDs to fit a token budget
+
+Each SCD is worth the weight of its ``metadata.priority`` (critical, high,
+normal or low) times the weight of its concern bundle's priority, times
+one plus the number of SCDs that depend on it. The focus SCDs with everything
+they depend on, then critical SCDs, are packed first; the rest are packed
+greedily by value per token. An SCD is only packed together with the SCDs
+it depends on (``depends-on``, ``extends`` and ``refines`` relationships),
+so its cost is that of its whole unpacked closure.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, NamedTuple, Set
+
+# Rough characters per token of English Markdown (no tokenizer needed)
+CHARS_PER_TOKEN = 4
+
+PRIORITY_WEIGHTS = {"critical": 8.0, "high": 4.0, "normal": 2.0, "low": 1.0}
+DEFAULT_PRIORITY = "normal"
+
+# Relationship types whose target an SCD can't be understood without
+DEPENDENCY_TYPES = {"depends-on", "extends", "refines"}
+
+
+class PackItem(NamedTuple):
+    """An SCD that may be packed"""
+
+    id: str
+    tokens: int
+    priority: str = DEFAULT_PRIORITY
+    weight: float = 1.0  # weight of its concern (see priority_weight)
+    depends_on: tuple = ()
+
+
+class PackResult(NamedTuple):
+    """SCDs that fit the budget, dependencies first, then by importance"""
+
+    selected: List[str]
+    omitted: List[str]
+    tokens: int
+    budget: int
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens a model sees for some text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def priority_of(data: Any) -> str:
+    """Get the priority of an SCD or bundle (normal if unset or unknown)
+
+    ``metadata.priority`` is where the SCD format defines it; a top-level
+    ``priority`` is accepted as a fallback.
+    """
+    if not isinstance(data, dict):
+        return DEFAULT_PRIORITY
+    metadata = data.get("metadata")
+    value = metadata.get("priority") if isinstance(metadata, dict) else None
+    value = str(value or data.get("priority") or DEFAULT_PRIORITY).strip().lower()
+    return value if value in PRIORITY_WEIGHTS else DEFAULT_PRIORITY
+
+
+def priority_weight(priority: str) -> float:
+    """Get the weight of a priority relative to normal"""
+    return PRIORITY_WEIGHTS.get(priority, 1.0) / PRIORITY_WEIGHTS[DEFAULT_PRIORITY]
+
+
+def dependencies_of(data: Any) -> List[str]:
+    """Get the SCD IDs an SCD depends on, extends or refines"""
+    relationships = data.get("relationships") if isinstance(data, dict) else None
+    targets = [
+        str(rel.get("target"))
+        for rel in relationships or []
+        if isinstance(rel, dict) and rel.get("type") in DEPENDENCY_TYPES and rel.get("target")
+    ]
+    return [*dict.fromkeys(targets)]
+
+
+def pack(items: Iterable[PackItem], budget: int, focus: Iterable[str] = ()) -> PackResult:
+    """Choose the SCDs to include under a token budget
+
+    Args:
+        items: Candidate SCDs (dependencies on SCDs that aren't candidates
+            are ignored)
+        budget: Maximum total tokens of the selected SCDs
+        focus: SCD IDs being worked on; they and everything they depend on
+            (transitively) are packed before anything else
+
+    Returns:
+        PackResult; ``selected`` lists dependencies before the SCDs needing
+        them, otherwise most valuable first
+    """
+    items = {item.id: item for item in items}
+    deps = {i: [d for d in item.depends_on if d in items and d != i] for i, item in items.items()}
+    dependents: Dict[str, int] = dict.fromkeys(items, 0)
+    for targets in deps.values():
+        for target in targets:
+            dependents[target] += 1
+    value = {
+        i: priority_weight(item.priority) * item.weight * (1 + dependents[i])
+        for i, item in items.items()
+    }
+
+    selected: Set[str] = set()
+    remaining = budget
+
+    def closure(item_id: str) -> List[str] | None:
+        """The item and everything it needs that isn't selected yet
+
+        Returns None as soon as the group is known not to fit, so a deep
+        dependency graph is never walked further than the budget reaches.
+        """
+        found, stack = [], [item_id]
+        seen = {item_id}
+        total = 0
+        while stack:
+            current = stack.pop()
+            total += items[current].tokens
+            if total > remaining:
+                return None
+            found.append(current)
+            for dep in deps[current]:
+                if dep not in seen and dep not in selected:
+                    seen.add(dep)
+                    stack.append(dep)
+        return found
+
+    def take(group: List[str] | None) -> None:
+        nonlocal remaining
+        if group is not None:
+            selected.update(group)
+            remaining -= cost(group)
+
+    def cost(group: List[str]) -> int:
+        return sum(items[i].tokens for i in group)
+
+    def gain(group: List[str]) -> float:
+        return sum(value[i] for i in group)
+
+    # Focus closures, then critical SCDs (most valuable first)
+    pinned = [i for i in dict.fromkeys(focus) if i in items]
+    pinned += sorted(
+        (i for i, item in items.items() if item.priority == "critical"),
+        key=lambda i: (-value[i], i),
+    )
+    for item_id in pinned:
+        if item_id not in selected:
+            take(closure(item_id))
+
+    def fill() -> List[List[str]]:
+        """Greedily take groups by value per token while they fit"""
+        # A group's cost only drops as its dependencies get selected, so
+        # stale heap entries are re-scored when popped. Groups that don't
+        # fit when they come up are dropped.
+        def density(group):
+            return gain(group) / cost(group) if cost(group) else float("inf")
+
+        heap = []
+        for item_id in items:
+            group = closure(item_id) if item_id not in selected else None
+            if group is not None:
+                heap.append((-density(group), item_id))
+        heapq.heapify(heap)
+        taken = []
+        while heap and remaining >= 0:
+            score, item_id = heapq.heappop(heap)
+            if item_id in selected:
+                continue
+            group = closure(item_id)
+            if group is None:
+                continue
+            if -density(group) != score:
+                heapq.heappush(heap, (-density(group), item_id))
+            else:
+                take(group)
+                taken.append(group)
+        return taken
+
+    greedy = fill()
+
+    # Greedy alone can do arbitrarily badly when one large group is worth
+    # more than many small ones; the best single group that fits bounds it
+    # within a factor of two
+    taken = [i for group in greedy for i in group]
+    selected.difference_update(taken)
+    remaining += cost(taken)
+    fitting = (closure(i) for i in items if i not in selected)
+    best = max((g for g in fitting if g is not None), key=gain, default=[])
+    if gain(best) > gain(taken):
+        take(best)
+        fill()
+    else:
+        for group in greedy:
+            take(group)
+
+    order = _dependency_order(selected, deps, value)
+    omitted = [i for i in items if i not in selected]
+    return PackResult(order, omitted, budget - remaining, budget)
+
+
+def _dependency_order(selected: Set[str], deps: Dict[str, List[str]], value: Dict) -> List[str]:
+    """Order selected SCDs dependencies first, most valuable first otherwise"""
+    pending = {i: sum(d in selected for d in deps[i]) for i in selected}
+    needed_by: Dict[str, List[str]] = {}
+    for i in selected:
+        for dep in deps[i]:
+            if dep in selected:
+                needed_by.setdefault(dep, []).append(i)
+
+    ready = [(-value[i], i) for i, count in pending.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, item_id = heapq.heappop(ready)
+        order.append(item_id)
+        for dependent in needed_by.get(item_id, []):
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                heapq.heappush(ready, (-value[dependent], dependent))
+    # Dependency cycles: whatever is left, by value
+    placed = set(order)
+    order.extend(sorted((i for i in selected if i not in placed), key=lambda i: -value[i]))
+    return order
@@ -0,0 +1,238 @@
+"""Find the SCDs and rules that apply to a source file by its path
+
+SCDs scope themselves to files with ``applies_to.paths`` globs, which
+``scs compile`` turns into ``paths:`` frontmatter of ``.claude/rules/``
+files. PathIndex compiles all of those globs into one matcher: a trie over
+the literal leading directories of every glob, where each node holds the
+globs starting there as one grouped regex. Looking up a path only visits
+the nodes along its own directories, and a node's globs are only tried one
+by one when their grouped regex matches, so lookups stay fast however many
+globs there are.
+
+Globs are matched against the whole path relative to the project root:
+``*`` and ``?`` don't cross ``/``, ``**`` matches any number of
+directories, ``[...]`` and ``{a,b}`` work as in shells, and a trailing
+``/`` matches everything under a directory.
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+
+import yaml
+
+from scs_tools.utils.bundle_graph import YAML_LOADER
+from scs_tools.utils.compiler import RULES_DIR, Compiler, is_managed
+from scs_tools.utils.merkle import DIGEST_CACHE_FILE, DigestCache
+
+_WILDCARDS = frozenset("*?[{")
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translate a path glob into an (unanchored) regular expression"""
+    out = []
+    i, n = 0, len(glob)
+    while i < n:
+        c = glob[i]
+        if glob.startswith("**", i):
+            at_start = i == 0 or glob[i - 1] == "/"
+            i += 2
+            if at_start and glob.startswith("/", i):
+                out.append("(?:.*/)?")  # **/ also matches no directory at all
+                i += 1
+            else:
+                out.append(".*")
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = glob.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                inner = glob[i + 1:end]
+                if inner.startswith("!"):
+                    inner = "^" + inner[1:]
+                out.append(f"[{inner.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif c == "{":
+            end, parts = _brace_parts(glob, i)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                out.append("(?:" + "|".join(glob_to_regex(part) for part in parts) + ")")
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def _brace_parts(glob: str, start: int) -> Tuple[int, List[str]]:
+    """Split ``{a,b}`` at ``start`` into its alternatives (end -1 if unclosed)"""
+    depth, parts, begin = 0, [], start + 1
+    for i in range(start, len(glob)):
+        if glob[i] == "{":
+            depth += 1
+        elif glob[i] == "}":
+            depth -= 1
+            if depth == 0:
+                parts.append(glob[begin:i])
+                return i, parts
+        elif glob[i] == "," and depth == 1:
+            parts.append(glob[begin:i])
+            begin = i + 1
+    return -1, []
+
+
+def _normalize_glob(glob: str) -> str:
+    glob = glob.strip().lstrip("/")
+    if glob.startswith("./"):
+        glob = glob[2:]
+    return glob + "**" if glob.endswith("/") else glob
+
+
+def _split_prefix(glob: str) -> Tuple[List[str], str]:
+    """Split a glob into its literal leading directories and the rest"""
+    segments = glob.split("/")
+    prefix = []
+    for segment in segments[:-1]:
+        if _WILDCARDS.intersection(segment):
+            break
+        prefix.append(segment)
+    return prefix, "/".join(segments[len(prefix):])
+
+
+class _Node:
+    """Trie node: child directories and the globs whose literal prefix ends here"""
+
+    __slots__ = ("children", "patterns", "grouped")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.patterns: Dict[str, List[int]] = {}  # remaining regex -> entry indexes
+        self.grouped = None
+
+    def compile(self) -> None:
+        if self.patterns:
+            self.grouped = re.compile("(?:" + "|".join(self.patterns) + r")\Z")
+            self.patterns = {
+                re.compile(pattern + r"\Z"): targets for pattern, targets in self.patterns.items()
+            }
+        for child in self.children.values():
+            child.compile()
+
+
+class PathIndex:
+    """Combined matcher of many path globs, each pointing at a target
+
+    Args:
+        entries: (glob, target) pairs; a target may have several globs
+        general: Targets that apply to every path
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]], general: Iterable[str] = ()):
+        self.general = [*dict.fromkeys(general)]
+        self.targets: List[str] = []
+        self.exact: Dict[str, List[int]] = {}
+        self.root = _Node()
+        order: Dict[str, int] = {}
+        for glob, target in entries:
+            index = order.setdefault(target, len(order))
+            if index == len(self.targets):
+                self.targets.append(target)
+            glob = _normalize_glob(glob)
+            if not glob:
+                continue
+            if not _WILDCARDS.intersection(glob):
+                self.exact.setdefault(glob, []).append(index)
+                continue
+            prefix, rest = _split_prefix(glob)
+            node = self.root
+            for segment in prefix:
+                node = node.children.setdefault(segment, _Node())
+            node.patterns.setdefault(glob_to_regex(rest), []).append(index)
+        self.root.compile()
+
+    def match(self, path: str, include_general: bool = False) -> List[str]:
+        """Get the targets whose globs match a path (relative, ``/``-separated)
+
+        Args:
+            path: File path relative to the indexed project root
+            include_general: Also return the targets that apply to every path
+
+        Returns:
+            Matching targets in the order they were indexed
+        """
+        path = path.lstrip("/")
+        found = set(self.exact.get(path, ()))
+        node, rest = self.root, path
+        while node is not None:
+            if node.grouped is not None and node.grouped.match(rest):
+                for pattern, targets in node.patterns.items():
+                    if pattern.match(rest):
+                        found.update(targets)
+            segment, sep, rest = rest.partition("/")
+            node = node.children.get(segment) if sep else None
+        matched = [self.targets[i] for i in sorted(found)]
+        return [*self.general, *matched] if include_general else matched
+
+
+def rules_frontmatter_paths(text: str) -> List[str]:
+    """Get the ``paths:`` globs of a rules file's YAML frontmatter"""
+    if not text.startswith("---"):
+        return []
+    end = text.find("\n---", 3)
+    try:
+        data = yaml.load(text[3:end], Loader=YAML_LOADER) if end != -1 else None
+    except yaml.YAMLError:
+        return []
+    paths = data.get("paths") if isinstance(data, dict) else None
+    if isinstance(paths, str):
+        paths = paths.split(",")
+    return [str(p).strip() for p in paths or [] if p and str(p).strip()]
+
+
+def load_project_index(compiler: Compiler) -> PathIndex:
+    """Index the ``applies_to.paths`` of a project's SCDs and its hand-written rules
+
+    SCD facts recorded by ``scs compile`` are reused for unchanged SCDs, so
+    only new or changed SCDs are parsed. Rules files compiled from SCDs are
+    skipped (their SCDs are indexed directly); other rules files with
+    ``paths:`` frontmatter are indexed by their own path.
+
+    Args:
+        compiler: Compiler of the project (its source layout is used)
+
+    Returns:
+        PathIndex whose targets are SCD IDs and rules file paths, with SCDs
+        that apply everywhere as its general targets
+    """
+    root = compiler.root
+    try:
+        concerns = compiler.load_concerns(DigestCache(root / DIGEST_CACHE_FILE))
+    except FileNotFoundError:
+        concerns = []
+    facts = compiler.scd_facts(concerns)
+
+    entries: List[Tuple[str, str]] = []
+    general: List[str] = []
+    for scd in {s.id: s for c in concerns for s in c.scds}.values():
+        globs = facts[scd.file]["paths"]
+        if globs:
+            entries.extend((glob, scd.id) for glob in globs)
+        else:
+            general.append(scd.id)
+
+    rules_dir = root / RULES_DIR
+    for rules_file in sorted(rules_dir.rglob("*.md")) if rules_dir.is_dir() else []:
+        try:
+            text = rules_file.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+        if not is_managed(text):
+            name = rules_file.relative_to(root).as_posix()
+            entries.extend((glob, name) for glob in rules_frontmatter_paths(text))
+    return PathIndex(entries, general)
+
@@ -0,0 +1,258 @@
+"""Structural diff of two bundle versions using subtree hashes"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Set, Tuple
+
+from scs_validator.utils import ValidationError
+
+from scs_tools.utils.bundle_graph import load_document
+from scs_tools.utils.canonical import canonical_bytes
+from scs_tools.utils.merkle import leaf_digest_of
+from scs_tools.utils.object_store import ObjectStore
+
+
+class HashedNode(NamedTuple):
+    """A parsed value with the digest of its whole subtree"""
+
+    digest: bytes
+    data: Any
+    children: Dict[str, "HashedNode"] | List["HashedNode"] | None
+
+
+class ContentChange(NamedTuple):
+    """One changed path inside a document"""
+
+    path: str
+    change: str  # "added", "removed" or "modified"
+    old: Any
+    new: Any
+
+
+class DocumentChange(NamedTuple):
+    """A document (SCD or bundle) present in both versions with different content"""
+
+    id: str
+    old_file: str
+    new_file: str
+    changes: List[ContentChange] | None  # None if either version's content is unavailable
+
+
+class VersionDiff(NamedTuple):
+    """Everything that changed between two version manifests"""
+
+    old_version: str
+    new_version: str
+    scds_added: List[str]
+    scds_removed: List[str]
+    scds_modified: List[DocumentChange]
+    bundles_added: List[str]
+    bundles_removed: List[str]
+    bundles_modified: List[DocumentChange]
+    relationships_added: List[Tuple[str, str, str]]
+    relationships_removed: List[Tuple[str, str, str]]
+    unchanged: int
+
+    def is_empty(self) -> bool:
+        """Check whether no SCD, bundle or relationship changed"""
+        return not any(self[2:10])
+
+
+def hash_tree(data: Any) -> HashedNode:
+    """Hash every subtree of parsed document data, bottom up
+
+    Mapping digests don't depend on key order; scalars are hashed by their
+    canonical JSON form, so ``1`` and ``"1"`` differ.
+    """
+    if isinstance(data, dict):
+        children = {str(key): hash_tree(value) for key, value in data.items()}
+        h = hashlib.sha256(b"d")
+        for key in sorted(children):
+            h.update(b"\0" + key.encode("utf-8") + b"\0" + children[key].digest)
+        return HashedNode(h.digest(), data, children)
+    if isinstance(data, (list, tuple)):
+        items = [hash_tree(item) for item in data]
+        h = hashlib.sha256(b"l")
+        for item in items:
+            h.update(item.digest)
+        return HashedNode(h.digest(), data, items)
+    return HashedNode(hashlib.sha256(b"s" + canonical_bytes(data)).digest(), data, None)
+
+
+def _child_path(path: str, key: str | int) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else key
+
+
+def diff_trees(old: HashedNode, new: HashedNode, path: str = "") -> List[ContentChange]:
+    """List the changed paths between two hashed trees
+
+    Subtrees with equal digests are skipped without being visited, so the
+    cost is proportional to the changed parts only. List items are matched
+    by digest first (an inserted item doesn't shift every later one), then
+    the leftovers are paired in order.
+    """
+    if old.digest == new.digest:
+        return []
+    if isinstance(old.children, dict) and isinstance(new.children, dict):
+        changes: List[ContentChange] = []
+        for key in sorted(old.children.keys() | new.children.keys()):
+            child_path = _child_path(path, key)
+            if key not in new.children:
+                changes.append(ContentChange(child_path, "removed", old.children[key].data, None))
+            elif key not in old.children:
+                changes.append(ContentChange(child_path, "added", None, new.children[key].data))
+            else:
+                changes.extend(diff_trees(old.children[key], new.children[key], child_path))
+        return changes
+    if isinstance(old.children, list) and isinstance(new.children, list):
+        return _diff_lists(old.children, new.children, path)
+    return [ContentChange(path, "modified", old.data, new.data)]
+
+
+def _diff_lists(old: List[HashedNode], new: List[HashedNode], path: str) -> List[ContentChange]:
+    unmatched: Dict[bytes, List[int]] = {}
+    for index, item in enumerate(old):
+        unmatched.setdefault(item.digest, []).append(index)
+    added = []
+    for index, item in enumerate(new):
+        same = unmatched.get(item.digest)
+        if same:
+            same.pop(0)
+        else:
+            added.append(index)
+    removed = sorted(index for indices in unmatched.values() for index in indices)
+
+    changes: List[ContentChange] = []
+    for old_index, new_index in zip(removed, added):
+        changes.extend(diff_trees(old[old_index], new[new_index], _child_path(path, new_index)))
+    for old_index in removed[len(added):]:
+        changes.append(ContentChange(_child_path(path, old_index), "removed", old[old_index].data, None))
+    for new_index in added[len(removed):]:
+        changes.append(ContentChange(_child_path(path, new_index), "added", None, new[new_index].data))
+    return changes
+
+
+def load_pinned(entry: Dict, base_dir: Path, store: ObjectStore | None):
+    """Load the content a manifest entry pins, or None if it's not available
+
+    The object store holds every pinned version; without it, the file on
+    disk is used only if it still has the pinned digest.
+    """
+    digest = entry["digest"]
+    if store is not None and store.has(digest):
+        with open(store.path_for(digest), "rb") as f:
+            return json.load(f)
+    path = base_dir / entry["file"]
+    try:
+        data = load_document(path)
+    except ValidationError:
+        return None
+    return data if leaf_digest_of(data)[0] == digest else None
+
+
+def relationship_edges(scd_id: str, data: Any) -> Set[Tuple[str, str, str]]:
+    """Get an SCD's relationships as (source, type, target) edges"""
+    relationships = data.get("relationships") if isinstance(data, dict) else None
+    return {
+        (scd_id, str(rel.get("type")), str(rel.get("target")))
+        for rel in relationships or []
+        if isinstance(rel, dict)
+    }
+
+
+def _diff_group(
+    group: str,
+    old_section: Dict,
+    new_section: Dict,
+    old_dir: Path,
+    new_dir: Path,
+    store: ObjectStore | None,
+    edges: Tuple[Set, Set] | None = None,
+):
+    old_entries = old_section.get(group) or {}
+    new_entries = new_section.get(group) or {}
+    added = sorted(new_entries.keys() - old_entries.keys())
+    removed = sorted(old_entries.keys() - new_entries.keys())
+    modified: List[DocumentChange] = []
+    unchanged = 0
+
+    for doc_id in sorted(old_entries.keys() & new_entries.keys()):
+        old_entry, new_entry = old_entries[doc_id], new_entries[doc_id]
+        if old_entry["digest"] == new_entry["digest"]:
+            unchanged += 1
+            continue
+        old_data = load_pinned(old_entry, old_dir, store)
+        new_data = load_pinned(new_entry, new_dir, store)
+        changes = None
+        if old_data is not None and new_data is not None:
+            if edges is not None and isinstance(old_data, dict) and isinstance(new_data, dict):
+                # Relationship edits are reported as edges, not content paths
+                edges[0].update(relationship_edges(doc_id, old_data))
+                edges[1].update(relationship_edges(doc_id, new_data))
+                old_data = {k: v for k, v in old_data.items() if k != "relationships"}
+                new_data = {k: v for k, v in new_data.items() if k != "relationships"}
+            changes = diff_trees(hash_tree(old_data), hash_tree(new_data))
+        modified.append(DocumentChange(doc_id, old_entry["file"], new_entry["file"], changes))
+
+    if edges is not None:
+        for doc_id in removed:
+            edges[0].update(relationship_edges(doc_id, load_pinned(old_entries[doc_id], old_dir, store)))
+        for doc_id in added:
+            edges[1].update(relationship_edges(doc_id, load_pinned(new_entries[doc_id], new_dir, store)))
+    return added, removed, modified, unchanged
+
+
+def diff_versions(
+    old_manifest: Dict,
+    new_manifest: Dict,
+    old_dir: Path,
+    new_dir: Path,
+    store: ObjectStore | None = None,
+) -> VersionDiff:
+    """Compare the bundles and SCDs pinned by two version manifests
+
+    Documents whose recorded digests match are skipped without being read.
+    Changed documents are loaded from the object store (or from disk if the
+    file still has the pinned digest) and compared subtree by subtree.
+
+    Args:
+        old_manifest: Earlier version manifest (with a ``merkle`` section)
+        new_manifest: Later version manifest (with a ``merkle`` section)
+        old_dir: Directory the old manifest's file paths are relative to
+        new_dir: Directory the new manifest's file paths are relative to
+        store: Object store holding pinned content (default: the one of the
+            project containing the new manifest)
+
+    Returns:
+        VersionDiff
+    """
+    store = store or ObjectStore.for_project(new_dir)
+    old_section = old_manifest.get("merkle") or {}
+    new_section = new_manifest.get("merkle") or {}
+    versions = (str(old_manifest.get("version")), str(new_manifest.get("version")))
+    if old_section.get("root") and old_section.get("root") == new_section.get("root"):
+        unchanged = len(new_section.get("bundles") or {}) + len(new_section.get("scds") or {})
+        return VersionDiff(*versions, [], [], [], [], [], [], [], [], unchanged)
+
+    edges: Tuple[Set, Set] = (set(), set())
+    scds_added, scds_removed, scds_modified, scds_unchanged = _diff_group(
+        "scds", old_section, new_section, old_dir, new_dir, store, edges
+    )
+    bundles_added, bundles_removed, bundles_modified, bundles_unchanged = _diff_group(
+        "bundles", old_section, new_section, old_dir, new_dir, store
+    )
+    return VersionDiff(
+        *versions,
+        scds_added,
+        scds_removed,
+        scds_modified,
+        bundles_added,
+        bundles_removed,
+        bundles_modified,
+        sorted(edges[1] - edges[0]),
+        sorted(edges[0] - edges[1]),
+        scds_unchanged + bundles_unchanged,
+    )
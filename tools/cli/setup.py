@@ -27,6 +27,7 @@ setup(
         "click>=8.0.0",
         "pyyaml>=6.0",
         "jinja2>=3.0.0",
+        "scs-validator>=0.1.0",
     ],
     extras_require={
         "validator": ["scs-validator>=0.1.0"],
@@ -0,0 +1 @@
+"""Tests for SCS Tools."""
@@ -0,0 +1,40 @@
+"""Tests for how bundle graphs find and load their documents."""
+
+import pytest
+from scs_validator.utils import ValidationError
+
+from scs_tools.utils.bundle_graph import index_scd_files, load_bundle_graph, load_document
+
+
+def test_index_honours_ignore_files_and_skips_non_scds(tmp_path):
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "scds").mkdir()
+    (tmp_path / "scds" / "a.yaml").write_text("id: scd:project:a\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "a-copy.yaml").write_text("id: scd:project:copy\n")
+    (tmp_path / "bundle.yaml").write_text("id: bundle:demo\n")
+
+    assert index_scd_files(tmp_path) == {"scd:project:a": tmp_path / "scds" / "a.yaml"}
+
+
+def test_documents_are_loaded_under_the_parse_limits(tmp_path):
+    deep = tmp_path / "deep.yaml"
+    deep.write_text("id: scd:project:deep\ncontent: " + "[" * 300 + "]" * 300 + "\n")
+
+    with pytest.raises(ValidationError) as excinfo:
+        load_document(deep)
+    assert excinfo.value.code == "SYN008"
+
+
+def test_graph_resolves_concern_bundles_from_the_project_root(tmp_path):
+    (tmp_path / "scds").mkdir()
+    (tmp_path / "scds" / "a.yaml").write_text("id: scd:project:a\n")
+    concerns = tmp_path / "bundles" / "concerns"
+    concerns.mkdir(parents=True)
+    (concerns / "security.yaml").write_text("id: bundle:security\nscds:\n  - scd:project:a\n")
+
+    graph = load_bundle_graph(concerns / "security.yaml")
+
+    assert graph.project_root == tmp_path
+    assert graph.scd_files == {"scd:project:a": tmp_path / "scds" / "a.yaml"}
+    assert graph.unresolved == []
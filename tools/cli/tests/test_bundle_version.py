@@ -0,0 +1,84 @@
+"""Tests for the files scs bundle version writes and how they are listed."""
+
+import pytest
+from click.testing import CliRunner
+
+from scs_tools.cli import cli
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    result = CliRunner().invoke(
+        cli,
+        [
+            "new", "project", "demo", "--type", "minimal", "--dir", str(tmp_path),
+            "--author", "Test", "--email", "test@example.com", "--no-interactive",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    monkeypatch.chdir(tmp_path / "demo")
+    return tmp_path / "demo"
+
+
+def _version(*args: str):
+    result = CliRunner().invoke(
+        cli,
+        ["bundle", "version", *args, "--approved-by", "test@example.com", "--notes", "test",
+         "--no-git", "--no-validate"],
+    )
+    assert result.exit_code == 0, result.output
+
+
+def test_single_and_batch_versions_name_manifests_alike(project):
+    _version("--version", "1.0.0")
+    _version("--all", "--version", "2.0.0")
+
+    bundles = project / "bundles"
+    assert (bundles / "project-bundle-VERSION-1.0.0-MANIFEST.yaml").is_file()
+    assert (bundles / "project-bundle-VERSION-2.0.0-MANIFEST.yaml").is_file()
+    assert not list(bundles.glob("VERSION-*"))
+    assert list((bundles / "domains").glob("*-VERSION-2.0.0-MANIFEST.yaml"))
+
+
+def test_list_skips_snapshots_and_manifests(project):
+    _version("--all", "--version", "1.0.0")
+
+    result = CliRunner().invoke(cli, ["bundle", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "ID: unknown" not in result.output
+    assert "-v1.0.0" not in result.output
+    assert "MANIFEST" not in result.output
+
+
+def test_verify_accepts_a_version_and_reports_modified_scds(project):
+    _version("--version", "1.0.0")
+
+    result = CliRunner().invoke(cli, ["bundle", "verify", "v1.0.0"])
+    assert result.exit_code == 0, result.output
+    assert "Verified" in result.output
+
+    scd = project / "context" / "project" / "authn-authz.yaml"
+    scd.write_text(scd.read_text() + "\nextra: changed\n")
+
+    result = CliRunner().invoke(cli, ["bundle", "verify", "1.0.0"])
+    assert result.exit_code == 1
+    assert "context/project/authn-authz.yaml (modified: scd:project:authn-authz)" in result.output
+
+
+def test_store_and_cache_live_in_the_project_from_any_directory(project, tmp_path, monkeypatch):
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    bundle = str(project / "bundles" / "project-bundle.yaml")
+
+    _version("--bundle", bundle, "--version", "1.0.0")
+    result = CliRunner().invoke(cli, ["bundle", "verify", "1.0.0", "--bundle", bundle])
+    assert result.exit_code == 0, result.output
+    result = CliRunner().invoke(cli, ["bundle", "checkout", "1.0.0", "--bundle", bundle])
+    assert result.exit_code == 0, result.output
+
+    assert (project / ".scs" / "digest-cache.json").is_file()
+    assert any((project / ".scs" / "objects").iterdir())
+    assert (project / ".scs" / "checkouts" / "v1.0.0" / "bundles").is_dir()
+    assert not list(elsewhere.iterdir())
@@ -0,0 +1,76 @@
+"""Tests for the canonical serialization documents are hashed over."""
+
+import math
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+import yaml
+
+from scs_tools.utils.canonical import canonical_digest, canonical_json
+
+
+def _yaml(text: str):
+    return yaml.safe_load(text)
+
+
+def test_formatting_and_key_order_do_not_matter():
+    block = _yaml("id: scd:project:a\ncontent:\n  b: 1\n  a: [x, y]\n")
+    flow = _yaml('{"content": {"a": ["x", "y"], "b": 1}, "id": "scd:project:a"}')
+
+    assert canonical_json(block) == '{"content":{"a":["x","y"],"b":1},"id":"scd:project:a"}'
+    assert canonical_digest(block) == canonical_digest(flow)
+
+
+@pytest.mark.parametrize(
+    "typed, quoted",
+    [
+        ("2: a\n10: b\n", '"2": a\n"10": b\n'),
+        ("true: a\nnull: b\n", '"true": a\n"null": b\n'),
+        ("1.5: a\n", '"1.5": a\n'),
+        ("nested:\n  - 2: a\n    10: b\n", 'nested:\n  - "2": a\n    "10": b\n'),
+    ],
+)
+def test_keys_are_sorted_as_the_strings_they_become(typed, quoted):
+    assert canonical_json(_yaml(typed)) == canonical_json(_yaml(quoted))
+
+
+def test_int_keys_sort_as_strings():
+    assert canonical_json({2: 1, 10: 1}) == '{"10":1,"2":1}'
+    assert canonical_json({2: 1, "10": 1}) == '{"10":1,"2":1}'
+
+
+@pytest.mark.parametrize(
+    "value, source, text",
+    [
+        (math.nan, ".nan", '"NaN"'),
+        (math.inf, ".inf", '"Infinity"'),
+        (-math.inf, "-.inf", '"-Infinity"'),
+    ],
+)
+def test_non_finite_floats_become_strings(value, source, text):
+    assert canonical_json({"x": value}) == '{"x":' + text + "}"
+    assert canonical_json(_yaml("x: " + source)) == '{"x":' + text + "}"
+
+
+def test_strings_and_keys_are_nfc():
+    composed, decomposed = "caf\u00e9", "cafe\u0301"
+
+    assert canonical_json({decomposed: decomposed}) == canonical_json({composed: composed})
+    assert canonical_json({decomposed: 1}) == '{"caf\u00e9":1}'
+
+
+def test_keys_are_sorted_after_nfc():
+    # Decomposed, "e\u0301" sorts before "f"; composed, "\u00e9" sorts after it
+    assert canonical_json({"e\u0301": 1, "f": 2}) == '{"f":2,"\u00e9":1}'
+
+
+def test_timestamps_are_utc():
+    plus_two = timezone(timedelta(hours=2))
+
+    assert canonical_json({"at": datetime(2025, 1, 1, 2, 0, tzinfo=plus_two)}) == (
+        '{"at":"2025-01-01T00:00:00Z"}'
+    )
+    assert canonical_json(_yaml("at: 2025-01-01T02:00:00+02:00\nday: 2025-01-01\n")) == (
+        '{"at":"2025-01-01T00:00:00Z","day":"2025-01-01"}'
+    )
+    assert canonical_json({"day": date(2025, 1, 1)}) == '{"day":"2025-01-01"}'
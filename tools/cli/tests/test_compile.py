@@ -0,0 +1,26 @@
+"""Tests for the messages scs compile prints about token-budget packing."""
+
+from click.testing import CliRunner
+
+from scs_tools.cli import cli
+
+
+def test_focus_scd_left_out_by_the_budget_is_reported(tmp_path, monkeypatch):
+    result = CliRunner().invoke(
+        cli,
+        [
+            "new", "project", "demo", "--type", "standard", "--dir", str(tmp_path),
+            "--author", "Test", "--email", "test@example.com", "--no-interactive",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    monkeypatch.chdir(tmp_path / "demo")
+    focus = "scd:project:authn-authz"
+
+    tight = CliRunner().invoke(cli, ["compile", "--budget", "2000", "--focus", focus])
+    roomy = CliRunner().invoke(cli, ["compile", "--budget", "100000", "--focus", focus])
+
+    assert tight.exit_code == 0, tight.output
+    assert f"--focus {focus} does not fit the 2000-token budget for claude" in tight.output
+    assert roomy.exit_code == 0, roomy.output
+    assert "does not fit" not in roomy.output
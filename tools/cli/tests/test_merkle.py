@@ -0,0 +1,91 @@
+"""Tests for verifying the files a version manifest pins by Merkle digest."""
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from scs_tools.cli import cli
+from scs_tools.utils import merkle
+from scs_tools.utils.merkle import DigestCache, verify_merkle
+
+SCD = "context/project/authn-authz.yaml"
+
+
+@pytest.fixture
+def release(tmp_path, monkeypatch):
+    """A scaffolded project versioned as 1.0.0: (manifest directory, snapshot, merkle section)"""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "new", "project", "demo", "--type", "minimal", "--dir", str(tmp_path),
+            "--author", "Test", "--email", "test@example.com", "--no-interactive",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    monkeypatch.chdir(tmp_path / "demo")
+    result = runner.invoke(
+        cli,
+        ["bundle", "version", "--version", "1.0.0", "--approved-by", "test@example.com",
+         "--notes", "test", "--no-git", "--no-validate"],
+    )
+    assert result.exit_code == 0, result.output
+    bundles = tmp_path / "demo" / "bundles"
+    manifest = yaml.safe_load((bundles / "project-bundle-VERSION-1.0.0-MANIFEST.yaml").read_text())
+    return bundles, bundles / "project-bundle-v1.0.0.yaml", manifest["merkle"]
+
+
+def _scd_path(bundles, section):
+    return bundles / section["scds"]["scd:project:authn-authz"]["file"]
+
+
+def test_unchanged_release_verifies_with_the_recorded_root(release):
+    bundles, snapshot, section = release
+
+    checks, root = verify_merkle(section, bundles, snapshot)
+
+    assert checks and all(check.status == "ok" for check in checks)
+    assert root == section["root"]
+
+
+def test_reformatting_an_scd_keeps_its_digest(release):
+    bundles, snapshot, section = release
+    scd = _scd_path(bundles, section)
+    data = yaml.safe_load(scd.read_text())
+    scd.write_text("# reformatted\n" + yaml.safe_dump(data, sort_keys=True, indent=4))
+
+    checks, root = verify_merkle(section, bundles, snapshot)
+
+    assert all(check.status == "ok" for check in checks)
+    assert root == section["root"]
+
+
+def test_modified_and_missing_scds_are_reported_without_a_root(release):
+    bundles, snapshot, section = release
+    scd = _scd_path(bundles, section)
+    scd.write_text(scd.read_text().replace("title:", "title: Changed\nold_title:", 1))
+    (bundles / section["scds"]["scd:project:threat-model"]["file"]).unlink()
+
+    checks, root = verify_merkle(section, bundles, snapshot)
+
+    statuses = {check.id: check.status for check in checks if check.status != "ok"}
+    assert statuses == {
+        "scd:project:authn-authz": "modified",
+        "scd:project:threat-model": "missing",
+    }
+    assert root is None
+
+
+def test_cached_digests_are_reused_for_unchanged_files(release, tmp_path, monkeypatch):
+    bundles, snapshot, section = release
+    cache = DigestCache(tmp_path / "digest-cache.json")
+    verify_merkle(section, bundles, snapshot, cache)
+
+    def unreadable(file_path):
+        raise AssertionError(f"{file_path} was read again")
+
+    monkeypatch.setattr(merkle, "load_document", unreadable)
+    checks, root = verify_merkle(section, bundles, snapshot, cache)
+
+    assert all(check.status == "ok" for check in checks)
+    assert root == section["root"]
@@ -0,0 +1,62 @@
+"""Tests that freshly scaffolded projects validate cleanly."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from scs_tools.cli import cli
+
+SCHEMA_DIR = Path(__file__).resolve().parents[3] / "schema"
+
+PROJECT_TYPES = ["standard", "healthcare", "fintech", "saas", "government", "minimal"]
+
+
+def _scaffold(tmp_path: Path, project_type: str) -> Path:
+    result = CliRunner().invoke(
+        cli,
+        [
+            "new", "project", "demo", "--type", project_type, "--dir", str(tmp_path),
+            "--author", "Test", "--email", "test@example.com", "--no-interactive",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    return tmp_path / "demo"
+
+
+def _validate(*args: str) -> dict:
+    result = CliRunner().invoke(
+        cli, ["validate", "-s", str(SCHEMA_DIR), "--no-color", "--output", "json", *args]
+    )
+    report = json.loads(result.output)
+    assert result.exit_code == 0, report
+    return report
+
+
+@pytest.mark.parametrize("project_type", PROJECT_TYPES)
+def test_scaffolded_project_bundle_is_valid(tmp_path, project_type):
+    project = _scaffold(tmp_path, project_type)
+
+    report = _validate("--bundle", str(project / "bundles" / "project-bundle.yaml"))
+
+    assert report["summary"]["total_errors"] == 0
+
+
+@pytest.mark.parametrize("project_type", PROJECT_TYPES)
+def test_scaffolded_scds_pass_schema_validation(tmp_path, project_type):
+    project = _scaffold(tmp_path, project_type)
+
+    report = _validate("--dir", str(project / "context"), "--recursive")
+
+    assert report["summary"]["total_errors"] == 0
+
+
+def test_scaffolded_project_is_valid_with_follow_imports(tmp_path):
+    project = _scaffold(tmp_path, "standard")
+
+    report = _validate(
+        "--bundle", str(project / "bundles" / "project-bundle.yaml"), "--follow-imports"
+    )
+
+    assert report["summary"]["total_errors"] == 0
@@ -0,0 +1,56 @@
+"""Tests for token-budget packing of SCDs."""
+
+from pathlib import Path
+
+from scs_tools.utils.bundle_graph import load_document
+from scs_tools.utils.packer import PackItem, pack, priority_of
+
+EXAMPLE_SCDS = (
+    Path(__file__).resolve().parents[3]
+    / "plugins" / "scs-vibe" / "spec" / "examples" / "care-plan-tracker" / "scds"
+)
+
+
+def test_priority_is_read_from_metadata():
+    assert priority_of(load_document(EXAMPLE_SCDS / "phi-handling.yaml")) == "critical"
+    assert priority_of(load_document(EXAMPLE_SCDS / "patterns.yaml")) == "normal"
+    assert priority_of({"metadata": {"priority": "High"}}) == "high"
+    assert priority_of({"priority": "low"}) == "low"
+    assert priority_of({"metadata": {"priority": "urgent"}}) == "normal"
+
+
+def test_critical_scd_beats_normal_one_under_tight_budget():
+    # The normal SCD is smaller, so it would win on value per token alone
+    critical = PackItem(
+        "scd:project:phi-handling", 400, priority_of({"metadata": {"priority": "critical"}})
+    )
+    normal = PackItem(
+        "scd:project:patterns", 300, priority_of({"metadata": {"priority": "normal"}})
+    )
+
+    result = pack([normal, critical], budget=500)
+
+    assert result.selected == ["scd:project:phi-handling"]
+    assert result.omitted == ["scd:project:patterns"]
+    assert result.tokens == 400
+
+
+def test_concern_priority_weights_otherwise_equal_scds():
+    low_concern = PackItem("scd:project:a", 100, "normal", weight=0.5)
+    high_concern = PackItem("scd:project:b", 100, "normal", weight=2.0)
+
+    result = pack([low_concern, high_concern], budget=150)
+
+    assert result.selected == ["scd:project:b"]
+
+
+def test_dependencies_are_packed_with_and_before_their_dependents():
+    base = PackItem("scd:project:tech-stack", 100, "low")
+    dependent = PackItem(
+        "scd:project:patterns", 100, "high", depends_on=("scd:project:tech-stack",)
+    )
+    other = PackItem("scd:project:other", 150, "normal")
+
+    result = pack([dependent, other, base], budget=250)
+
+    assert result.selected == ["scd:project:tech-stack", "scd:project:patterns"]
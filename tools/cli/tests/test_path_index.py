@@ -0,0 +1,79 @@
+"""Tests for matching source paths against applies_to.paths globs."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from scs_tools.cli import cli
+from scs_tools.utils.path_index import PathIndex
+
+
+@pytest.mark.parametrize(
+    "glob, matches, non_matches",
+    [
+        # * and ? stay within one directory
+        ("src/*.py", ["src/a.py", "src/.py"], ["src/a/b.py", "src/a.pyc", "a.py"]),
+        ("src/?.py", ["src/a.py"], ["src/ab.py", "src/.py", "src//.py"]),
+        # Brace expansion, including nested and empty alternatives
+        ("src/*.{ts,tsx}", ["src/a.ts", "src/a.tsx"], ["src/a.t", "src/a.js", "src/a.{ts,tsx}"]),
+        ("{api,web/{app,lib}}/x.py", ["api/x.py", "web/app/x.py", "web/lib/x.py"],
+         ["web/x.py", "web/api/x.py", "app/x.py"]),
+        ("test{,s}/*.py", ["test/a.py", "tests/a.py"], ["testss/a.py", "tests/a/b.py"]),
+        ("src/{a,b", ["src/{a,b"], ["src/a", "src/b"]),
+        # Character classes and [!...] negation
+        ("lib/[abc].py", ["lib/a.py", "lib/c.py"], ["lib/d.py", "lib/ab.py"]),
+        ("lib/[a-c]x.py", ["lib/bx.py"], ["lib/dx.py", "lib/-x.py"]),
+        ("lib/[!a]*.py", ["lib/b.py", "lib/bar.py"], ["lib/a.py", "lib/abc.py"]),
+        ("lib/[!a-c]x.py", ["lib/dx.py"], ["lib/ax.py", "lib/cx.py"]),
+        # **/ matches zero or more directories
+        ("**/*.sql", ["q.sql", "db/q.sql", "db/a/b/q.sql"], ["q.sql.bak", "db/q.sq"]),
+        ("src/**/test_*.py", ["src/test_a.py", "src/a/b/test_a.py"],
+         ["test_a.py", "src/a/atest_a.py", "other/src/test_a.py"]),
+        ("src/**", ["src/a.py", "src/a/b/c.py"], ["src", "srcx/a.py"]),
+        # A trailing / matches everything below the directory
+        ("docs/", ["docs/a.md", "docs/a/b/c.md"], ["docs", "docsx/a.md", "x/docs/a.md"]),
+        ("src/api/", ["src/api/v1/routes.py"], ["src/apis/x.py", "src/a.py"]),
+        # Leading / and ./ are the project root
+        ("/Makefile", ["Makefile"], ["src/Makefile"]),
+        ("./src/*.go", ["src/main.go"], ["main.go"]),
+    ],
+)
+def test_glob_matches_and_non_matches(glob, matches, non_matches):
+    index = PathIndex([(glob, "scd:project:x")])
+
+    for path in matches:
+        assert index.match(path) == ["scd:project:x"], (glob, path)
+    for path in non_matches:
+        assert index.match(path) == [], (glob, path)
+
+
+def test_targets_keep_their_indexed_order_and_general_ones_come_first():
+    index = PathIndex(
+        [("src/**/*.py", "scd:project:b"), ("src/api/", "scd:project:a"), ("x", "scd:project:c")],
+        general=["scd:project:g"],
+    )
+
+    assert index.match("src/api/v1.py") == ["scd:project:b", "scd:project:a"]
+    assert index.match("src/api/v1.py", include_general=True) == [
+        "scd:project:g", "scd:project:b", "scd:project:a",
+    ]
+    assert index.match("README.md") == []
+
+
+def test_context_for_json_is_always_a_list(tmp_path, monkeypatch):
+    result = CliRunner().invoke(
+        cli,
+        [
+            "new", "project", "demo", "--type", "minimal", "--dir", str(tmp_path),
+            "--author", "Test", "--email", "test@example.com", "--no-interactive",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    monkeypatch.chdir(tmp_path / "demo")
+
+    for paths in (["src/a.py"], ["src/a.py", "src/b.py"]):
+        result = CliRunner().invoke(cli, ["context-for", "--output", "json", *paths])
+        assert result.exit_code == 0, result.output
+        report = json.loads(result.output)
+        assert [entry["path"] for entry in report] == paths
@@ -0,0 +1,45 @@
+"""Tests for the sync status of outputs compiled under a token budget."""
+
+import shutil
+from pathlib import Path
+
+from scs_tools.utils.compiler import Compiler
+
+EXAMPLE_PROJECT = Path(__file__).resolve().parents[3] / "examples" / "med-adherence"
+
+
+def _copy_project(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    shutil.copytree(EXAMPLE_PROJECT, root, ignore=shutil.ignore_patterns(".claude", ".scs"))
+    return root
+
+
+def test_concerns_packed_out_by_budget_are_omitted_not_stale(tmp_path):
+    root = _copy_project(tmp_path)
+    result = Compiler(root, targets=["claude"], budget=3000).compile()
+    assert result.packing["claude"].omitted
+
+    concerns, outputs = Compiler(root).status()
+    omitted = [c.name for c in concerns if c.state == "omitted"]
+
+    assert omitted
+    assert not any((root / ".claude" / "rules" / f"{name}.md").exists() for name in omitted)
+    assert all(c.state in ("in-sync", "omitted", None) for c in concerns if c.bundle)
+    assert all(o.state == "in-sync" for o in outputs)
+    assert Compiler(root).recorded_packing() == [3000, []]
+
+
+def test_omitted_concern_is_out_of_sync_once_its_sources_change(tmp_path):
+    root = _copy_project(tmp_path)
+    compiler = Compiler(root, targets=["claude"], budget=3000)
+    compiler.compile()
+    name, entry = next(iter(compiler.manifest["omitted"].items()))
+    scd_file = root / entry["sources"][1][1]
+    scd_file.write_text(
+        scd_file.read_text(encoding="utf-8").replace("title: ", "title: Changed ", 1),
+        encoding="utf-8",
+    )
+
+    concerns, _ = Compiler(root).status()
+
+    assert {c.name: c.state for c in concerns}[name] == "out-of-sync"
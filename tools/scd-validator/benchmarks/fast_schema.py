@@ -0,0 +1,72 @@
+"""Benchmark the schema stage with and without the --fast structural pre-check.
+
+Parses the SCDs once, then times SchemaValidator over all of them for a
+number of passes in each mode and checks that both modes report the same
+findings.
+
+Usage (from the repository root):
+    python tools/scd-validator/benchmarks/fast_schema.py
+    python tools/scd-validator/benchmarks/fast_schema.py --passes 20 'context/**/*.yaml'
+"""
+
+import argparse
+import glob
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from scs_validator.parser import Parser  # noqa: E402
+from scs_validator.schema_validator import SchemaValidator  # noqa: E402
+from scs_validator.utils import ValidationError  # noqa: E402
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "patterns", nargs="*", default=["examples/*/scds/**/*.yaml"],
+        help="Glob patterns of SCD files (default: examples/*/scds/**/*.yaml)",
+    )
+    arg_parser.add_argument("--schema-dir", default="schema", help="Schema directory")
+    arg_parser.add_argument("--passes", type=int, default=50, help="Passes per mode")
+    args = arg_parser.parse_args()
+
+    files = sorted({f for p in args.patterns for f in glob.glob(p, recursive=True)})
+    parser = Parser()
+    documents = []
+    for file in files:
+        try:
+            documents.append((parser.load_scd(Path(file)), file))
+        except ValidationError:
+            pass
+    if not documents:
+        sys.exit(f"No parseable SCDs match {args.patterns}")
+
+    findings = {}
+    for fast in (False, True):
+        validator = SchemaValidator(Path(args.schema_dir), fast=fast)
+        results = list(validator.validate_many(documents))  # warm the caches
+        findings[fast] = sorted(
+            (e.code, e.file_path, e.message) for r in results for e in r.errors
+        )
+        start = time.perf_counter()
+        for _ in range(args.passes):
+            for _ in validator.validate_many(documents):
+                pass
+        elapsed = time.perf_counter() - start
+        per_scd = elapsed / (args.passes * len(documents)) * 1e6
+        print(f"{'--fast' if fast else 'full':>6}: {per_scd:7.1f} us/SCD")
+
+    print(f"{len(documents)} SCDs, {args.passes} passes per mode")
+    if findings[False] == findings[True]:
+        print(f"Findings identical in both modes ({len(findings[False])} schema errors)")
+    else:
+        print("Findings differ between modes:")
+        for mode, found in findings.items():
+            print(f"  {'--fast' if mode else 'full'}: {found}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
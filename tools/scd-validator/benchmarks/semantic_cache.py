@@ -0,0 +1,109 @@
+"""Benchmark semantic validation of many SCDs with and without the parse caches.
+
+Generates a synthetic corpus (50,000 SCDs by default) whose versions and
+timestamps repeat the way they do in a real workspace, with a share of
+invalid ones, then times SemanticValidator over all of them with the
+version/timestamp parse caches enabled and disabled, and checks that both
+modes report the same findings.
+
+Usage (from the repository root):
+    python tools/scd-validator/benchmarks/semantic_cache.py
+    python tools/scd-validator/benchmarks/semantic_cache.py --scds 200000 --passes 3
+"""
+
+import argparse
+import random
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from scs_validator import semantic_validator  # noqa: E402
+from scs_validator.rules_loader import RulesLoader  # noqa: E402
+from scs_validator.semantic_validator import SemanticValidator  # noqa: E402
+
+
+def make_scds(count: int, seed: int) -> list:
+    """Build ``count`` SCD dictionaries with repeating versions and timestamps"""
+    rng = random.Random(seed)
+    versions = [f"{major}.{minor}.{patch}" for major in range(3) for minor in range(10)
+                for patch in range(5)] + ["DRAFT", "1.0", "v2.0.0", "1.0.0-"]
+    days = [f"2025-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+    timestamps = [f"{day}T{hour:02d}:00:00Z" for day in days for hour in (9, 17)]
+    timestamps += ["2025-13-01T00:00:00Z", "yesterday"]
+    scds = []
+    for i in range(count):
+        tier = rng.choice(("project", "project", "project", "standards", "meta"))
+        scds.append({
+            "id": f"scd:{tier}:item-{i}",
+            "type": tier if rng.random() > 0.01 else "project",
+            "version": rng.choice(versions),
+            "title": f"Item {i}",
+            "description": "" if rng.random() < 0.01 else f"Synthetic SCD number {i}",
+            "content": {"summary": f"item {i}"},
+            "provenance": {
+                "created_by": "bench@example.com",
+                "created_at": rng.choice(timestamps),
+                "updated_at": rng.choice(timestamps),
+                "rationale": "benchmark",
+            },
+        })
+    return scds
+
+
+def run(validator: SemanticValidator, documents: list, passes: int) -> tuple:
+    """Validate every document ``passes`` times; return (seconds, findings)"""
+    findings = []
+    start = time.perf_counter()
+    for n in range(passes):
+        for scd, file_path in documents:
+            result = validator.validate_scd(scd, file_path)
+            if n == 0:
+                findings.extend(
+                    (f.code, f.scd_id, f.message) for f in (*result.errors, *result.warnings)
+                )
+    return time.perf_counter() - start, sorted(findings)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--scds", type=int, default=50_000, help="Number of SCDs")
+    arg_parser.add_argument("--passes", type=int, default=1, help="Passes per mode")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    args = arg_parser.parse_args()
+
+    documents = [
+        (scd, f"context/{scd['id'].split(':')[2]}.yaml")
+        for scd in make_scds(args.scds, args.seed)
+    ]
+    validator = SemanticValidator(RulesLoader())
+    cached = (semantic_validator._semver_error, semantic_validator._timestamp_error)
+
+    findings = {}
+    for use_cache in (False, True):
+        if use_cache:
+            semantic_validator._semver_error, semantic_validator._timestamp_error = cached
+            for function in cached:
+                function.cache_clear()
+        else:
+            # maxsize=0 keeps the call path (and __wrapped__) but caches nothing
+            semantic_validator._semver_error, semantic_validator._timestamp_error = (
+                lru_cache(maxsize=0)(function.__wrapped__) for function in cached
+            )
+        elapsed, findings[use_cache] = run(validator, documents, args.passes)
+        per_scd = elapsed / (args.passes * len(documents)) * 1e6
+        label = "cached" if use_cache else "uncached"
+        print(f"{label:>8}: {elapsed:6.2f} s, {per_scd:6.1f} us/SCD")
+
+    print(f"{len(documents)} SCDs, {args.passes} pass(es) per mode")
+    if findings[False] == findings[True]:
+        print(f"Findings identical in both modes ({len(findings[True])} findings)")
+    else:
+        print("Findings differ between modes")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
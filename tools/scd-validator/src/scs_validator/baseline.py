@@ -0,0 +1,116 @@
+"""Baseline module for comparing findings across validation runs."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Set
+
+from .utils import ValidationError, ValidationResult
+
+# Where the fingerprints of the last run are kept inside an SCS project
+LAST_RUN_FILE = Path(".scs") / "last-validation.json"
+
+
+def collect_fingerprints(results: List[ValidationResult]) -> Set[str]:
+    """Collect the fingerprints of all findings in a set of results.
+
+    Args:
+        results: List of validation results
+
+    Returns:
+        Set of finding fingerprints
+    """
+    fingerprints: Set[str] = set()
+    for result in results:
+        fingerprints.update(error.fingerprint for error in result.errors)
+        fingerprints.update(warning.fingerprint for warning in result.warnings)
+    return fingerprints
+
+
+def save_fingerprints(
+    baseline_path: Path, results: List[ValidationResult], validator_version: str
+) -> None:
+    """Persist the fingerprints of a run so later runs can diff against it.
+
+    Args:
+        baseline_path: File to write
+        results: List of validation results
+        validator_version: Version of the validator
+    """
+    data = {
+        "validator_version": validator_version,
+        "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "fingerprints": sorted(collect_fingerprints(results)),
+    }
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_fingerprints(baseline_path: Path) -> Set[str]:
+    """Load baseline fingerprints.
+
+    Accepts either a file written by save_fingerprints or a JSON report
+    produced with ``--output json``.
+
+    Args:
+        baseline_path: Baseline file
+
+    Returns:
+        Set of finding fingerprints
+
+    Raises:
+        ValidationError: If the baseline cannot be read
+    """
+    try:
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValidationError(f"Failed to load baseline: {e}", file_path=str(baseline_path))
+
+    if not isinstance(data, dict):
+        raise ValidationError("Baseline must be a JSON object", file_path=str(baseline_path))
+
+    if "fingerprints" in data:
+        return set(data["fingerprints"])
+
+    # JSON report: take fingerprints from the errors and warnings lists
+    fingerprints: Set[str] = set()
+    for key in ("errors", "warnings"):
+        for finding in data.get(key, []):
+            if finding.get("fingerprint"):
+                fingerprints.add(finding["fingerprint"])
+    return fingerprints
+
+
+def filter_new_findings(
+    results: List[ValidationResult], baseline: Set[str]
+) -> List[ValidationResult]:
+    """Drop findings whose fingerprint is already in the baseline.
+
+    Matching is a set lookup per finding, so this is linear in the number
+    of findings.
+
+    Args:
+        results: List of validation results
+        baseline: Fingerprints of known findings
+
+    Returns:
+        New list of results containing only newly introduced findings
+    """
+    filtered: List[ValidationResult] = []
+    for result in results:
+        new_result = ValidationResult(result.level_name)
+        new_result.details = dict(result.details)
+        for error in result.errors:
+            if error.fingerprint not in baseline:
+                new_result.add_error(error)
+        for warning in result.warnings:
+            if warning.fingerprint not in baseline:
+                new_result.add_warning(warning)
+        new_result.details["baseline_suppressed"] = (
+            result.error_count + result.warning_count
+            - new_result.error_count - new_result.warning_count
+        )
+        filtered.append(new_result)
+    return filtered
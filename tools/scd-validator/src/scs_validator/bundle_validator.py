@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .codes import CODES
 from .rules_loader import RulesLoader
 from .utils import ValidationError, ValidationResult, ValidationWarning
 
@@ -46,6 +47,7 @@ class BundleValidator:
                 ValidationError(
                     "Bundle missing required 'type' field",
                     file_path=file_path,
+                    code=CODES["missing_bundle_type"],
                 )
             )
             return result
@@ -105,11 +107,12 @@ class BundleValidator:
                 scds_count=len(scds),
             )
 
+            code = CODES["xor_violation"]
             if severity == "error":
-                result.add_error(ValidationError(error_msg, file_path=file_path))
+                result.add_error(ValidationError(error_msg, file_path=file_path, code=code))
             else:
                 result.add_warning(
-                    ValidationWarning(error_msg, level="bundle", file_path=file_path)
+                    ValidationWarning(error_msg, level="bundle", file_path=file_path, code=code)
                 )
 
     def _validate_bundle_type_rules(
@@ -138,6 +141,7 @@ class BundleValidator:
                     f"Unknown bundle type '{bundle_type}' - no validation rules found",
                     level="bundle",
                     file_path=file_path,
+                    code=CODES["unknown_bundle_type"],
                 )
             )
             return
@@ -199,7 +203,14 @@ class BundleValidator:
                 actual=array_len,
                 required=min_val,
             )
-            result.add_error(ValidationError(error_msg, file_path=file_path))
+            result.add_error(
+                ValidationError(
+                    error_msg,
+                    file_path=file_path,
+                    code=CODES["insufficient_items"],
+                    location=field_name,
+                )
+            )
 
         # Check maximum
         max_val = constraints.get("max")
@@ -212,7 +223,14 @@ class BundleValidator:
                 actual=array_len,
                 allowed=max_val,
             )
-            result.add_error(ValidationError(error_msg, file_path=file_path))
+            result.add_error(
+                ValidationError(
+                    error_msg,
+                    file_path=file_path,
+                    code=CODES["excessive_items"],
+                    location=field_name,
+                )
+            )
 
         # Check required (must have at least 1)
         required = constraints.get("required", False)
@@ -223,7 +241,14 @@ class BundleValidator:
                 field=field_name,
                 bundle_type=bundle_type,
             )
-            result.add_error(ValidationError(error_msg, file_path=file_path))
+            result.add_error(
+                ValidationError(
+                    error_msg,
+                    file_path=file_path,
+                    code=CODES["required_field_empty"],
+                    location=field_name,
+                )
+            )
 
     def _validate_meta_bundle(
         self,
@@ -259,5 +284,10 @@ class BundleValidator:
                         pattern=version_pattern,
                     )
                     result.add_warning(
-                        ValidationWarning(error_msg, level="bundle", file_path=file_path)
+                        ValidationWarning(
+                            error_msg,
+                            level="bundle",
+                            file_path=file_path,
+                            code=CODES["invalid_meta_version"],
+                        )
                     )
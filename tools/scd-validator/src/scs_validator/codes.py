@@ -0,0 +1,157 @@
+"""Stable finding codes and fingerprints.
+
+Every error and warning produced by the validator carries a code that stays
+the same across releases even if the message wording changes. Codes are keyed
+by rule name; where a rule has a template in the rules files, the rule name is
+the same as its ``error_messages`` key.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+from pathlib import Path
+
+CODES = {
+    # Level 1: Syntax
+    "file_not_found": "SYN001",
+    "load_failed": "SYN002",
+    "not_a_mapping": "SYN003",
+    "invalid_yaml": "SYN004",
+    "invalid_json": "SYN005",
+    "file_too_large": "SYN006",
+    "yaml_alias_limit": "SYN007",
+    "nesting_too_deep": "SYN008",
+    "parse_timeout": "SYN009",
+    # Level 2: Schema
+    "schema_unavailable": "SCH001",
+    "missing_id": "SCH002",
+    "invalid_id_tier": "SCH003",
+    "schema_required": "SCH004",
+    "schema_pattern": "SCH005",
+    "schema_type": "SCH006",
+    "schema_const": "SCH007",
+    "schema_min_length": "SCH008",
+    "schema_violation": "SCH009",
+    "schema_check_failed": "SCH010",
+    # Level 3: Semantic
+    "missing_type": "SEM001",
+    "type_tier_mismatch": "SEM002",
+    "invalid_version_format": "SEM003",
+    "invalid_semver": "SEM004",
+    "empty_provenance": "SEM005",
+    "missing_created_by": "SEM006",
+    "invalid_timestamp": "SEM007",
+    "missing_rationale": "SEM008",
+    "invalid_id_format": "SEM009",
+    "empty_required_string": "SEM010",
+    # Level 4: Relationships
+    "target_not_found": "REL001",
+    "target_not_in_bundle": "REL002",
+    "tier_constraint_violation": "REL003",
+    "self_reference": "REL004",
+    "invalid_type": "REL005",
+    "circular_dependency": "REL006",
+    "missing_relationship_type": "REL007",
+    "missing_relationship_target": "REL008",
+    "target_not_in_workspace": "REL009",
+    # Level 5: Bundle
+    "missing_bundle_type": "BUN001",
+    "xor_violation": "BUN002",
+    "unknown_bundle_type": "BUN003",
+    "insufficient_items": "BUN004",
+    "excessive_items": "BUN005",
+    "required_field_empty": "BUN006",
+    "invalid_meta_version": "BUN007",
+    # Level 6: Completeness
+    "completeness_rules_unavailable": "CMP001",
+    "missing_required_bundle": "CMP002",
+    "missing_domain": "CMP003",
+    "insufficient_scds_in_domain": "CMP004",
+    "missing_recommended_scd": "CMP005",
+    "stub_detected": "CMP006",
+    "no_standards_bundle": "CMP007",
+    # Workspace: ID uniqueness
+    "duplicate_scd_id": "DUP001",
+    "duplicate_bundle_id": "DUP002",
+}
+
+_RULES_BY_CODE = {code: rule for rule, code in CODES.items()}
+
+
+def describe_code(code: str) -> str:
+    """Get a human-readable label for a code, e.g. ``REL001 target_not_found``.
+
+    Args:
+        code: Finding code
+
+    Returns:
+        Code followed by its rule name (or the bare code if unknown)
+    """
+    rule = _RULES_BY_CODE.get(code)
+    return f"{code} {rule}" if rule else code
+
+
+@lru_cache(maxsize=1024)
+def _project_root(directory: str) -> Path | None:
+    """Find the SCS project containing a directory (memoized per directory)."""
+    # Imported here because scd_index depends on this module through utils
+    from .scd_index import find_workspace_root
+
+    return find_workspace_root(Path(directory))
+
+
+def normalize_location(file_path: str | None) -> str:
+    """Normalize a file path so fingerprints are stable across machines.
+
+    Paths inside an SCS project are made relative to the project root (the
+    directory holding ``.scs/``), so the same finding has the same
+    fingerprint whichever directory the validator runs from. Other paths
+    under the current working directory are made relative to it. All paths
+    use forward slashes.
+
+    Args:
+        file_path: File path as reported in a finding
+
+    Returns:
+        Normalized path ("" if no path)
+    """
+    if not file_path:
+        return ""
+    path = Path(os.path.normpath(file_path))
+    real_path = Path(os.path.realpath(path))
+    project_root = _project_root(str(real_path.parent))
+    if project_root is not None:
+        return real_path.relative_to(project_root).as_posix()
+    if path.is_absolute():
+        try:
+            path = path.relative_to(Path.cwd())
+        except ValueError:
+            pass
+    return path.as_posix()
+
+
+def fingerprint(
+    code: str | None,
+    scd_id: str | None,
+    file_path: str | None,
+    location: str | None = None,
+) -> str:
+    """Compute a stable fingerprint for a finding.
+
+    The fingerprint depends on the finding code, the SCD ID, the normalized
+    file path and an optional in-document location (field path, relationship
+    target, ...), but not on the message text.
+
+    Args:
+        code: Finding code
+        scd_id: SCD ID the finding belongs to
+        file_path: File path the finding was reported against
+        location: Optional location within the document
+
+    Returns:
+        Hex fingerprint (16 characters)
+    """
+    key = "\0".join(
+        (code or "", scd_id or "", normalize_location(file_path), location or "")
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
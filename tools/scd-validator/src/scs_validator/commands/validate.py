@@ -1,22 +1,43 @@
 """Validation command for SCS CLI."""
 
 import sys
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
 import click
 
 from .. import __version__
+from ..baseline import LAST_RUN_FILE, filter_new_findings, load_fingerprints, save_fingerprints
 from ..bundle_validator import BundleValidator
 from ..completeness_validator import CompletenessValidator
-from ..parser import Parser
+from ..discovery import discover_scd_files
+from ..model import SCDRecord
+from ..parser import STREAM_FORMATS, HeaderParser, ParseLimits, Parser, StreamDocument
+from ..pipeline import iter_file_outcomes, iter_stream_outcomes
 from ..relationship_validator import RelationshipValidator
 from ..reporter import Reporter
 from ..rules_loader import RulesLoader
+from ..scd_index import (
+    CONFIG_FILE,
+    WORKSPACE_INDEX_FILE,
+    SCDIndex,
+    WorkspaceIndex,
+    configured_standards_dirs,
+    find_workspace_root,
+    skip_non_scds,
+)
 from ..schema_validator import SchemaValidator
 from ..semantic_validator import SemanticValidator
+from ..uniqueness import DuplicateIdDetector
 from ..utils import ValidationError, ValidationResult
 
+# Bundle types whose SCDs --lazy loads only when a relationship targets them
+LAZY_BUNDLE_TYPES = ("standards", "meta")
+
+# Parse limits used unless overridden on the command line
+DEFAULT_LIMITS = ParseLimits()
+
 
 @click.command()
 @click.argument("files", nargs=-1, type=click.Path(exists=True), required=False)
@@ -26,6 +47,54 @@ from ..utils import ValidationError, ValidationResult
     type=click.Path(exists=True),
     help="Validate an SCD bundle file",
 )
+@click.option(
+    "--dir",
+    "-d",
+    "directory",
+    type=click.Path(exists=True, file_okay=False),
+    help="Discover and validate SCD files in this directory (bundles and version "
+    "snapshots are skipped)",
+)
+@click.option(
+    "--stream",
+    type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+    help="Validate every SCD in a multi-document YAML or NDJSON stream ('-' for stdin)",
+)
+@click.option(
+    "--stream-format",
+    type=click.Choice(STREAM_FORMATS, case_sensitive=False),
+    default="auto",
+    help="Format of --stream (default: auto, by suffix or first character)",
+)
+@click.option(
+    "--recursive",
+    "-r",
+    is_flag=True,
+    help="With --dir, descend into subdirectories",
+)
+@click.option(
+    "--include",
+    multiple=True,
+    help="With --dir, only validate files matching this glob (repeatable; "
+    "default: *.yaml, *.yml, *.json)",
+)
+@click.option(
+    "--exclude",
+    multiple=True,
+    help="With --dir, skip files or directories matching this glob (repeatable)",
+)
+@click.option(
+    "--no-ignore",
+    is_flag=True,
+    help="Do not honour .gitignore/.scsignore files (--dir and bundle SCD lookup)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of worker processes for file validation (default: 1)",
+)
 @click.option(
     "--schema-dir",
     "-s",
@@ -60,21 +129,125 @@ from ..utils import ValidationError, ValidationResult
     is_flag=True,
     help="Skip Level 6 completeness validation",
 )
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Run full schema validation only for SCDs that fail a structural pre-check",
+)
+@click.option(
+    "--thorough",
+    is_flag=True,
+    help="Always run full schema validation (overrides --fast)",
+)
+@click.option(
+    "--scd-root",
+    "scd_roots",
+    multiple=True,
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory to search for a bundle's SCD files (repeatable; default: project root)",
+)
+@click.option(
+    "--standards-dir",
+    "standards_dirs",
+    multiple=True,
+    type=click.Path(exists=True, file_okay=False),
+    help="External standards directory to include in the workspace SCD index (repeatable)",
+)
+@click.option(
+    "--follow-imports",
+    is_flag=True,
+    help="For project bundles, also validate the SCDs of transitively imported bundles "
+    "(concern and standards bundles)",
+)
+@click.option(
+    "--lazy",
+    is_flag=True,
+    help="Like --follow-imports, but load standards SCDs only when a relationship "
+    "targets them",
+)
+@click.option(
+    "--skip-content",
+    is_flag=True,
+    help="Structural checks only: don't load SCD content and skip Level 2 schema validation",
+)
+@click.option(
+    "--max-file-size",
+    type=click.IntRange(min=0),
+    default=DEFAULT_LIMITS.max_file_size // (1024 * 1024),
+    help="Reject files larger than this many MiB (default: 64; 0 = no limit)",
+)
+@click.option(
+    "--max-alias-expansion",
+    type=click.IntRange(min=0),
+    default=DEFAULT_LIMITS.max_alias_expansion,
+    help="Reject YAML whose aliases expand to more nodes than this "
+    "(default: 100000; 0 = no limit)",
+)
+@click.option(
+    "--max-depth",
+    type=click.IntRange(min=0),
+    default=DEFAULT_LIMITS.max_depth,
+    help="Reject documents nested deeper than this (default: 256; 0 = no limit)",
+)
+@click.option(
+    "--parse-timeout",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_LIMITS.parse_timeout,
+    help="Seconds one file may take to parse (default: no limit)",
+)
 @click.option(
     "--completeness-rules",
     type=click.Path(exists=True),
     help="Path to custom completeness rules file",
 )
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True),
+    help="Report only findings not present in this baseline (implies --new-only)",
+)
+@click.option(
+    "--new-only",
+    is_flag=True,
+    help="Report only findings that are new since the last --new-only run "
+    "(.scs/last-validation.json), and record this run's findings there",
+)
+@click.option(
+    "--save-last-run",
+    is_flag=True,
+    help="Record this run's findings in .scs/last-validation.json without filtering",
+)
 def validate(
     files: tuple,
     bundle: str | None,
+    directory: str | None,
+    stream: str | None,
+    stream_format: str,
+    recursive: bool,
+    include: tuple,
+    exclude: tuple,
+    no_ignore: bool,
+    jobs: int,
     schema_dir: str | None,
     output: str,
     strict: bool,
     no_color: bool,
     verbose: bool,
     skip_completeness: bool,
+    fast: bool,
+    thorough: bool,
+    scd_roots: tuple,
+    standards_dirs: tuple,
+    follow_imports: bool,
+    lazy: bool,
+    skip_content: bool,
+    max_file_size: int,
+    max_alias_expansion: int,
+    max_depth: int,
+    parse_timeout: float,
     completeness_rules: str | None,
+    baseline: str | None,
+    new_only: bool,
+    save_last_run: bool,
 ) -> None:
     """Validate SCS documents and bundles.
 
@@ -88,6 +261,14 @@ def validate(
         # Validate multiple SCD files
         scs validate context/meta/*.yaml
 
+        \b
+        # Discover and validate every SCD under a directory, 4 processes
+        scs validate --dir context/ --recursive --jobs 4
+
+        \b
+        # Validate SCDs piped from a generator (YAML --- stream or NDJSON)
+        generate-scds | scs validate --stream -
+
         \b
         # Validate a bundle
         scs validate --bundle context/bundle.yaml
@@ -99,6 +280,10 @@ def validate(
         \b
         # JSON output
         scs validate --bundle context/bundle.yaml --output json
+
+        \b
+        # Only report findings introduced since a saved report
+        scs validate --bundle context/bundle.yaml --baseline report.json
     """
     try:
         # Determine schema directory
@@ -120,9 +305,12 @@ def validate(
             sys.exit(4)
 
         # Initialize rules loader and validators
-        parser = Parser()
+        limits = ParseLimits(
+            max_file_size * 1024 * 1024, max_alias_expansion, max_depth, parse_timeout
+        )
+        parser = HeaderParser(limits) if skip_content else Parser(limits)
         rules_loader = RulesLoader()
-        schema_validator = SchemaValidator(schema_path)
+        schema_validator = SchemaValidator(schema_path, fast=fast and not thorough)
         semantic_validator = SemanticValidator(rules_loader)
         bundle_validator = BundleValidator(rules_loader)
         relationship_validator = RelationshipValidator(rules_loader)
@@ -147,17 +335,77 @@ def validate(
                 completeness_validator,
                 verbose,
                 skip_completeness,
+                lazy,
+                [Path(root) for root in scd_roots],
+                not no_ignore,
+                skip_content,
+                [Path(d) for d in standards_dirs],
+                follow_imports or lazy,
             )
-        elif files:
-            # Validate individual files
-            results = validate_files(
-                files, parser, schema_validator, semantic_validator, verbose
-            )
+        elif files or directory or stream:
+            # Validate individual files, files discovered under --dir and/or
+            # the documents of --stream
+            file_paths: Iterable = files
+            if directory:
+                discovered = skip_non_scds(
+                    discover_scd_files(
+                        Path(directory),
+                        recursive=recursive,
+                        include=include,
+                        exclude=exclude,
+                        use_ignore_files=not no_ignore,
+                    )
+                )
+                file_paths = chain(files, discovered)
+            stream_file = None
+            if stream:
+                stream_file = sys.stdin.buffer if stream == "-" else open(stream, "rb")
+            try:
+                stream_documents = None
+                if stream_file is not None:
+                    stream_documents = parser.iter_stream(
+                        stream_file,
+                        "<stdin>" if stream == "-" else stream,
+                        stream_format.lower(),
+                        skip_content,
+                    )
+                results = validate_files(
+                    file_paths,
+                    parser,
+                    schema_validator,
+                    semantic_validator,
+                    verbose,
+                    jobs,
+                    skip_content,
+                    stream_documents,
+                )
+            finally:
+                if stream_file is not None and stream != "-":
+                    stream_file.close()
         else:
             click.echo("Error: No files or bundle specified\n", err=True)
             click.echo(click.get_current_context().get_help())
             sys.exit(3)
 
+        # The last run is kept in the SCS project holding what was validated
+        # (a stream is taken to belong to the current directory's project)
+        target = bundle or directory or (files[0] if files else ".")
+        workspace_root = find_workspace_root(Path(target))
+        last_run_file = workspace_root / LAST_RUN_FILE if workspace_root else None
+
+        # Diff against the baseline if requested; only --new-only runs
+        # against the last run (or --save-last-run) record a new last run
+        baseline_path = Path(baseline) if baseline else None
+        if baseline_path is None and new_only and last_run_file and last_run_file.exists():
+            baseline_path = last_run_file
+        known_fingerprints = load_fingerprints(baseline_path) if baseline_path else set()
+
+        if last_run_file is not None and (save_last_run or (new_only and not baseline)):
+            save_fingerprints(last_run_file, results, __version__)
+
+        if baseline_path:
+            results = filter_new_findings(results, known_fingerprints)
+
         # Generate report
         if output == "json":
             report = reporter.report_json(results, __version__, strict)
@@ -183,52 +431,89 @@ def validate(
 
 
 def validate_files(
-    file_paths: tuple,
+    file_paths: Iterable,
     parser: Parser,
     schema_validator: SchemaValidator,
     semantic_validator: SemanticValidator,
     verbose: bool,
+    jobs: int = 1,
+    skip_content: bool = False,
+    stream_documents: Iterable[StreamDocument] | None = None,
 ) -> List[ValidationResult]:
-    """Validate individual SCD files."""
+    """Validate individual SCD files and documents read from a stream.
+
+    ``file_paths`` may be a generator; files are validated as they arrive.
+    ``stream_documents`` (from Parser.iter_stream) are validated after the
+    files, one at a time; findings name them ``<source>:<line> (document
+    <n>)``. With ``skip_content``, Level 2 (which needs the content tree) is
+    skipped. IDs declared by more than one of the files or documents are
+    reported as they stream past, without reading anything twice.
+    """
     syntax_result = ValidationResult("syntax")
     schema_result = ValidationResult("schema")
     semantic_result = ValidationResult("semantic")
+    duplicates = DuplicateIdDetector()
 
     files_checked = 0
 
-    for file_path_str in file_paths:
-        file_path = Path(file_path_str)
-
+    def announce(file_path: Path) -> None:
         if verbose:
             click.echo(f"Validating {file_path}...")
 
-        try:
-            # Parse file (syntax validation)
-            scd = parser.load_scd(file_path)
-            files_checked += 1
-
-            # Schema validation
-            result = schema_validator.validate_scd(scd, str(file_path))
-            schema_result.errors.extend(result.errors)
-            schema_result.warnings.extend(result.warnings)
-            if not result.passed:
-                schema_result.passed = False
-
-            # Semantic validation
-            result = semantic_validator.validate_scd(scd, str(file_path))
-            semantic_result.errors.extend(result.errors)
-            semantic_result.warnings.extend(result.warnings)
+    if skip_content and verbose:
+        click.echo("Skipping schema validation (--skip-content)")
+
+    outcomes: Iterable = iter_file_outcomes(
+        (Path(p) for p in file_paths),
+        parser,
+        None if skip_content else schema_validator,
+        semantic_validator,
+        jobs=jobs,
+        on_submit=announce,
+    )
+    if stream_documents is not None:
+        outcomes = chain(
+            outcomes,
+            iter_stream_outcomes(
+                stream_documents,
+                parser,
+                None if skip_content else schema_validator,
+                semantic_validator,
+                jobs=jobs,
+            ),
+        )
+
+    for outcome in outcomes:
+        # Parse file (syntax validation)
+        if outcome.syntax_error is not None:
+            syntax_result.add_error(outcome.syntax_error)
+            continue
+        files_checked += 1
+        duplicates.add(outcome.scd_id, outcome.file_path)
+
+        # Schema and semantic validation
+        for result, level_result in (
+            (outcome.schema, schema_result),
+            (outcome.semantic, semantic_result),
+        ):
+            if result is None:
+                continue
+            level_result.errors.extend(result.errors)
+            level_result.warnings.extend(result.warnings)
             if not result.passed:
-                semantic_result.passed = False
-
-        except ValidationError as e:
-            syntax_result.add_error(e)
+                level_result.passed = False
 
     syntax_result.details["files_checked"] = files_checked
     schema_result.details["files_checked"] = files_checked
     semantic_result.details["files_checked"] = files_checked
 
-    return [syntax_result, schema_result, semantic_result]
+    results = [syntax_result, schema_result, semantic_result]
+    if skip_content:
+        results.remove(schema_result)
+    uniqueness_result = duplicates.validate()
+    if uniqueness_result.errors:
+        results.append(uniqueness_result)
+    return results
 
 
 def validate_bundle(
@@ -241,14 +526,47 @@ def validate_bundle(
     completeness_validator: CompletenessValidator,
     verbose: bool,
     skip_completeness: bool,
+    lazy: bool = False,
+    scd_roots: List[Path] | None = None,
+    use_ignore_files: bool = True,
+    skip_content: bool = False,
+    standards_dirs: List[Path] | None = None,
+    follow_imports: bool = False,
 ) -> List[ValidationResult]:
-    """Validate an SCD bundle."""
+    """Validate an SCD bundle.
+
+    SCD references are resolved by the ID files declare rather than by file
+    name: through the WorkspaceIndex below (so one walk of the workspace
+    serves both resolution and the uniqueness check), or through an SCDIndex
+    built from ``scd_roots`` if given (or from the project root outside a
+    workspace).
+
+    For project bundles, the SCDs of the domain bundles it imports are
+    validated. With ``follow_imports``, imports are followed transitively
+    (concern and standards bundles too). With ``lazy`` (which callers pair
+    with ``follow_imports``), SCDs listed by imported standards/meta bundles
+    are not loaded up front; one is loaded (and schema/semantically validated) only
+    when a relationship check needs it as a target.
+
+    With ``skip_content``, SCDs are loaded without their content tree and
+    Level 2 schema validation of SCDs is skipped.
+
+    Inside an SCS project, a WorkspaceIndex covers the workspace,
+    configured standards directories and ``standards_dirs``. For non-project
+    bundles, relationship targets outside the bundle are looked up in it; the
+    IDs of the bundles and SCDs the validation reaches (and of relationship
+    targets) must be declared by only one file in it. A bundle
+    outside any project gets no workspace index: its SCDs are resolved from
+    the project root and outside targets from ``standards_dirs`` only.
+    """
     syntax_result = ValidationResult("syntax")
     bundle_schema_result = ValidationResult("bundle_schema")
+    schema_result = ValidationResult("schema")
     semantic_result = ValidationResult("semantic")
     bundle_result = ValidationResult("bundle")
     relationship_result = ValidationResult("relationships")
     completeness_result = ValidationResult("completeness")
+    uniqueness_result = ValidationResult("uniqueness")
 
     if verbose:
         click.echo(f"Validating bundle {bundle_path}...")
@@ -273,94 +591,148 @@ def validate_bundle(
         bundle_result = bundle_validator.validate_bundle(bundle, bundle_path)
 
         # Load SCDs for further validation
-        all_scds = []
-        scd_refs = []
-
         # Collect SCD references from bundle and imported bundles
         bundle_dir = Path(bundle_path).parent
-        # Project root is parent of bundles/ directory
-        project_root = bundle_dir.parent if bundle_dir.name == "bundles" else bundle_dir
+        # Project root is parent of the bundles/ directory (bundles may sit in
+        # bundles/domains/ or bundles/concerns/)
+        project_root = next(
+            (d.parent for d in (bundle_dir, bundle_dir.parent) if d.name == "bundles"),
+            bundle_dir,
+        )
+        # Only a bundle inside an SCS project (a directory with .scs/) gets
+        # a workspace index; a standalone bundle is resolved from its project
+        # root alone
+        workspace_root = find_workspace_root(bundle_dir)
+        workspace_index = None
+        if workspace_root is not None:
+            workspace_index = WorkspaceIndex(
+                workspace_roots(workspace_root, standards_dirs or []),
+                workspace_root / WORKSPACE_INDEX_FILE,
+                use_ignore_files,
+            )
 
-        # If this is a project bundle, load domain bundles to get SCD references
+        # IDs of the bundles and SCDs this validation reaches; only their
+        # duplicates in the workspace concern this bundle
+        reached_ids: Set[str] = {bundle_id}
+        reached_ids.update(_bundle_id(ref) for ref in bundle.get("imports", []))
         if bundle_type == "project":
-            imports = bundle.get("imports", [])
-
-            if verbose:
-                click.echo(f"Loading {len(imports)} imported bundles...")
-
-            for import_ref in imports:
-                # Parse bundle reference: bundle:<name>:<version> or bundle:<name>
-                parts = import_ref.split(":")
-                if len(parts) >= 2 and parts[0] == "bundle":
-                    bundle_name = parts[1]
-
-                    # Skip meta and standards bundles for now
-                    if bundle_name in ["meta", "standards"]:
-                        continue
-
-                    # Try to find the domain bundle file
-                    domain_bundle_path = bundle_dir / "domains" / f"{bundle_name}.yaml"
-
-                    if domain_bundle_path.exists():
-                        try:
-                            domain_bundle = parser.load_bundle(domain_bundle_path)
-                            domain_scds = domain_bundle.get("scds", [])
-                            scd_refs.extend(domain_scds)
-
-                            if verbose:
-                                click.echo(f"  Loaded {bundle_name}: {len(domain_scds)} SCDs")
-                        except Exception as e:
-                            if verbose:
-                                click.echo(f"  Warning: Could not load {domain_bundle_path}: {e}")
-                    else:
-                        if verbose:
-                            click.echo(f"  Warning: Domain bundle not found: {domain_bundle_path}")
+            # Project bundles list no SCDs themselves; follow their imports
+            owned_refs = collect_imported_scd_refs(
+                bundle, bundle_dir, parser, verbose, transitive=follow_imports,
+                reached_bundles=reached_ids,
+            )
         else:
             # For non-project bundles, use SCDs directly from the bundle
-            scd_refs = bundle.get("scds", [])
+            owned_refs = [(scd_ref, bundle_type) for scd_ref in bundle.get("scds", [])]
+
+        # In lazy mode SCDs owned by library bundles (standards, meta) are only
+        # loaded when a relationship targets them
+        scd_refs: List[str] = []
+        deferred_refs: Set[str] = set()
+        for scd_ref, owner_type in owned_refs:
+            if lazy and bundle_type == "project" and owner_type in LAZY_BUNDLE_TYPES:
+                deferred_refs.add(scd_ref)
+            elif scd_ref not in scd_refs:
+                scd_refs.append(scd_ref)
+        deferred_refs.difference_update(scd_refs)
 
         if scd_refs and verbose:
             click.echo(f"Loading {len(scd_refs)} SCDs...")
+        if deferred_refs and verbose:
+            click.echo(f"Deferring {len(deferred_refs)} SCDs until referenced (--lazy)")
+
+        scd_index: SCDIndex | WorkspaceIndex | None = None
+
+        def load_scd_ref(scd_ref: str) -> Tuple[Dict[str, Any], str] | None:
+            """Load one referenced SCD, returning its data and file path."""
+            nonlocal scd_index
+            if not scd_ref.startswith("scd:"):
+                return None
+
+            # Resolve SCD reference to file path (index built on first use)
+            if scd_index is None:
+                if scd_roots or workspace_index is None:
+                    scd_index = SCDIndex.build(scd_roots or [project_root], use_ignore_files)
+                else:
+                    scd_index = workspace_index
+                if verbose:
+                    click.echo(f"Indexed {len(scd_index)} SCD files")
+            scd_file = scd_index.get(scd_ref)
+
+            if scd_file is None:
+                if verbose:
+                    click.echo(f"  Warning: SCD file not found for {scd_ref}")
+                return None
+
+            try:
+                return parser.load_scd(scd_file), str(scd_file)
+            except Exception as e:
+                if verbose:
+                    click.echo(f"  Warning: Could not load {scd_file}: {e}")
+                return None
+
+        def check_scds(loaded: List[Tuple[Dict[str, Any], str]]) -> List[SCDRecord]:
+            """Run Levels 2-3 on loaded SCDs and return their records."""
+            records = []
+            if skip_content:
+                schema_results: Iterable[ValidationResult | None] = [None] * len(loaded)
+            else:
+                schema_results = schema_validator.validate_many(loaded)
+            for (scd_data, scd_file), schema in zip(loaded, schema_results):
+                record = SCDRecord.from_dict(scd_data)
+                records.append(record)
+                semantic = semantic_validator.validate_scd(record, scd_file)
+                for result, level_result in (
+                    (schema, schema_result),
+                    (semantic, semantic_result),
+                ):
+                    if result is None:
+                        continue
+                    level_result.errors.extend(result.errors)
+                    level_result.warnings.extend(result.warnings)
+                    if not result.passed:
+                        level_result.passed = False
+            return records
 
-        # Load each SCD file
-        for scd_ref in scd_refs:
-            # Resolve SCD reference to file path
-            # Format: scd:project:system-context → context/project/system-context.yaml
-            if scd_ref.startswith("scd:"):
-                parts = scd_ref.split(":", 2)
-                if len(parts) >= 3:
-                    tier = parts[1]  # project, meta, or standards
-                    scd_name = parts[2]
-
-                    # Construct file path
-                    scd_file = project_root / "context" / tier / f"{scd_name}.yaml"
-
-                    if scd_file.exists():
-                        try:
-                            scd_data = parser.load_scd(scd_file)
-                            all_scds.append(scd_data)
-
-                            # Level 3: Semantic validation for this SCD
-                            result = semantic_validator.validate_scd(scd_data, str(scd_file))
-                            semantic_result.errors.extend(result.errors)
-                            semantic_result.warnings.extend(result.warnings)
-                            if not result.passed:
-                                semantic_result.passed = False
-                        except Exception as e:
-                            if verbose:
-                                click.echo(f"  Warning: Could not load {scd_file}: {e}")
-                    else:
-                        if verbose:
-                            click.echo(f"  Warning: SCD file not found: {scd_file}")
+        # Load each SCD file, then validate them as one batch
+        loaded = [doc for doc in map(load_scd_ref, scd_refs) if doc is not None]
+        all_scds = check_scds(loaded)
 
         if verbose:
             click.echo(f"Successfully loaded {len(all_scds)} SCDs")
 
-        # Level 4: Relationship validation
+        loaded_on_demand: List[str] = []
+
+        def resolve_deferred(scd_id: str) -> SCDRecord | None:
+            """Load a deferred SCD the first time a relationship targets it."""
+            if scd_id not in deferred_refs:
+                return None
+            deferred_refs.discard(scd_id)
+            doc = load_scd_ref(scd_id)
+            if doc is None:
+                return None
+            loaded_on_demand.append(scd_id)
+            return check_scds([doc])[0]
+
+        # Level 4: Relationship validation. Targets outside a standalone
+        # domain, concern or standards bundle are looked up in the workspace,
+        # or in the --standards-dir directories outside one
+        outside_ids: SCDIndex | WorkspaceIndex | None = None
+        if bundle_type != "project":
+            if workspace_index is not None:
+                outside_ids = workspace_index
+            elif standards_dirs:
+                outside_ids = SCDIndex.build(standards_dirs, use_ignore_files)
         if all_scds:
             relationship_result = relationship_validator.validate_relationships(
-                all_scds, bundle_type, bundle_path
+                all_scds,
+                bundle_type,
+                bundle_path,
+                resolve_target=resolve_deferred if lazy else None,
+                workspace_ids=outside_ids,
             )
+            if lazy and verbose:
+                click.echo(f"Loaded {len(loaded_on_demand)} deferred SCDs on demand")
 
         # Level 6: Completeness validation (if not skipped)
         if not skip_completeness and bundle_type == "project":
@@ -371,10 +743,24 @@ def validate_bundle(
         elif skip_completeness and verbose:
             click.echo("Skipping completeness validation (--skip-completeness)")
 
+        # Uniqueness, across the workspace, of the IDs this bundle reaches
+        if workspace_index is not None:
+            reached_ids.update(scd_ref for scd_ref, _ in owned_refs)
+            reached_ids.update(
+                rel.target for record in all_scds for rel in record.relationships if rel.target
+            )
+            duplicates = DuplicateIdDetector()
+            duplicates.add_all(workspace_index.declared_ids())
+            uniqueness_result = duplicates.validate(reached_ids)
+            if verbose:
+                click.echo(f"Checked {len(reached_ids)} reached IDs for workspace duplicates")
+
     except ValidationError as e:
         syntax_result.add_error(e)
 
     results = [syntax_result, bundle_schema_result, semantic_result, bundle_result]
+    if not skip_content:
+        results.insert(2, schema_result)
 
     if relationship_result.errors or relationship_result.warnings:
         results.append(relationship_result)
@@ -382,9 +768,120 @@ def validate_bundle(
     if not skip_completeness and (completeness_result.errors or completeness_result.warnings):
         results.append(completeness_result)
 
+    if uniqueness_result.errors:
+        results.append(uniqueness_result)
+
     return results
 
 
+def workspace_roots(workspace_root: Path, standards_dirs: List[Path]) -> List[Path]:
+    """Get the directories covered by the workspace SCD index.
+
+    Args:
+        workspace_root: Root of the SCS project being validated
+        standards_dirs: Extra standards directories given on the command line
+
+    Returns:
+        The workspace root, the standards directories configured in its
+        ``.scs/config`` and ``standards_dirs``
+    """
+    return [
+        workspace_root,
+        *configured_standards_dirs(workspace_root / CONFIG_FILE),
+        *standards_dirs,
+    ]
+
+
+def _bundle_id(ref: str) -> str:
+    """Strip the version from a bundle reference (bundle:name:1.0.0 -> bundle:name)"""
+    return ":".join(str(ref).split(":")[:2])
+
+
+def collect_imported_scd_refs(
+    bundle: Dict[str, Any],
+    bundle_dir: Path,
+    parser: Parser,
+    verbose: bool,
+    transitive: bool = False,
+    reached_bundles: Set[str] | None = None,
+) -> List[Tuple[str, str]]:
+    """Collect SCD references from the bundles a project bundle imports.
+
+    By default only the domain bundles it imports directly are read
+    (``domains/<name>.yaml``). With ``transitive``, imports are followed
+    through every bundle (project → domain → concern, and the standards
+    bundle). Meta bundles are skipped for now.
+
+    Args:
+        bundle: Importing bundle
+        bundle_dir: Directory of the importing bundle
+        parser: Parser instance
+        verbose: Whether to print progress
+        transitive: Follow imports of imported bundles too
+        reached_bundles: If given, the ID of every imported bundle read is
+            added to it
+
+    Returns:
+        List of (scd_ref, type of the bundle that lists it)
+    """
+    scd_refs: List[Tuple[str, str]] = []
+    visited: Set[Path] = set()
+    pending = list(bundle.get("imports", []))
+
+    if verbose:
+        click.echo(f"Loading {len(pending)} imported bundles...")
+
+    while pending:
+        import_ref = pending.pop(0)
+        # Parse bundle reference: bundle:<name>:<version> or bundle:<name>
+        parts = import_ref.split(":")
+        if len(parts) < 2 or parts[0] != "bundle":
+            continue
+        bundle_name = parts[1]
+
+        # Skip meta bundles for now (and standards bundles unless transitive)
+        if bundle_name == "meta" or (bundle_name == "standards" and not transitive):
+            continue
+
+        # Try to find the imported bundle file
+        candidates = [bundle_dir / "domains" / f"{bundle_name}.yaml"]
+        if transitive:
+            candidates += [
+                bundle_dir / "concerns" / f"{bundle_name}.yaml",
+                bundle_dir / f"{bundle_name}.yaml",
+                bundle_dir / f"{bundle_name}-bundle.yaml",
+            ]
+        imported_path = next((c for c in candidates if c.exists()), None)
+        if imported_path is None:
+            if verbose:
+                click.echo(f"  Warning: Imported bundle not found: {import_ref}")
+            continue
+        if imported_path in visited:
+            continue
+        visited.add(imported_path)
+
+        try:
+            imported = parser.load_bundle(imported_path)
+        except Exception as e:
+            if verbose:
+                click.echo(f"  Warning: Could not load {imported_path}: {e}")
+            continue
+
+        if reached_bundles is not None:
+            reached_bundles.add(_bundle_id(import_ref))
+            reached_bundles.update(_bundle_id(ref) for ref in imported.get("imports") or [])
+        imported_type = imported.get("type", "unknown")
+        imported_scds = imported.get("scds", [])
+        scd_refs.extend((scd_ref, imported_type) for scd_ref in imported_scds)
+        if transitive:
+            pending.extend(imported.get("imports", []))
+
+        if verbose:
+            click.echo(f"  Loaded {bundle_name}: {len(imported_scds)} SCDs")
+
+    return scd_refs
+
+
 def determine_exit_code(results: List[ValidationResult], strict: bool) -> int:
     """Determine exit code based on validation results."""
     has_errors = any(not r.passed for r in results)
@@ -2,8 +2,10 @@
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set
 
+from .codes import CODES
+from .model import SCDRecord, as_records
 from .rules_loader import RulesLoader
 from .utils import ValidationError, ValidationResult, ValidationWarning
 
@@ -26,7 +28,7 @@ class CompletenessValidator:
     def validate_completeness(
         self,
         bundle: Dict[str, Any],
-        all_scds: List[Dict[str, Any]],
+        all_scds: Sequence[SCDRecord | Dict[str, Any]],
         file_path: str | None = None,
         project_root: Optional[Path] = None,
     ) -> ValidationResult:
@@ -42,7 +44,7 @@ class CompletenessValidator:
 
         Args:
             bundle: Project bundle data
-            all_scds: List of all SCDs in project
+            all_scds: SCD records in project (raw SCD dictionaries are converted)
             file_path: Optional file path for error messages
             project_root: Optional project root for finding custom rules
 
@@ -57,6 +59,7 @@ class CompletenessValidator:
                 self.custom_rules_path, project_root
             )
         except ValidationError as e:
+            e.code = CODES["completeness_rules_unavailable"]
             result.add_error(e)
             return result
 
@@ -67,6 +70,7 @@ class CompletenessValidator:
 
         # Check rule severity
         severity = rules.get("severity", "warning")
+        records = as_records(all_scds)
 
         # Validate required bundles
         self._validate_required_bundles(bundle, rules, severity, result, file_path)
@@ -74,17 +78,17 @@ class CompletenessValidator:
         # Validate required domains
         domain_bundles = self._extract_domain_bundles(bundle)
         self._validate_required_domains(
-            domain_bundles, all_scds, rules, severity, result, file_path
+            domain_bundles, records, rules, severity, result, file_path
         )
 
         # Validate recommended SCDs
-        self._validate_recommended_scds(all_scds, rules, result, file_path)
+        self._validate_recommended_scds(records, rules, result, file_path)
 
         # Stub detection
-        self._detect_stubs(all_scds, rules, result, file_path)
+        self._detect_stubs(records, rules, result, file_path)
 
         # Compliance validation
-        self._validate_compliance(bundle, all_scds, rules, result, file_path)
+        self._validate_compliance(bundle, records, rules, result, file_path)
 
         return result
 
@@ -143,6 +147,8 @@ class CompletenessValidator:
                         message,
                         result,
                         file_path,
+                        CODES["missing_required_bundle"],
+                        req_type,
                     )
             elif req_min is not None:
                 # Minimum count required
@@ -152,6 +158,8 @@ class CompletenessValidator:
                         message,
                         result,
                         file_path,
+                        CODES["missing_required_bundle"],
+                        req_type,
                     )
 
     def _extract_domain_bundles(self, bundle: Dict[str, Any]) -> Set[str]:
@@ -180,7 +188,7 @@ class CompletenessValidator:
     def _validate_required_domains(
         self,
         domain_bundles: Set[str],
-        all_scds: List[Dict[str, Any]],
+        all_scds: List[SCDRecord],
         rules: Dict[str, Any],
         severity: str,
         result: ValidationResult,
@@ -190,7 +198,7 @@ class CompletenessValidator:
 
         Args:
             domain_bundles: Set of domain bundle IDs
-            all_scds: List of all SCDs
+            all_scds: List of all SCD records
             rules: Completeness rules
             severity: Rule severity level
             result: Validation result to update
@@ -199,10 +207,10 @@ class CompletenessValidator:
         required_domains = rules.get("required_domains", [])
 
         # Group SCDs by domain (from SCD domain field)
-        domain_scds: Dict[str, List[Dict[str, Any]]] = {}
+        domain_scds: Dict[str, List[SCDRecord]] = {}
         for scd in all_scds:
             # Use the domain field from the SCD itself
-            domain = scd.get("domain")
+            domain = scd.domain
             if domain:
                 if domain not in domain_scds:
                     domain_scds[domain] = []
@@ -219,7 +227,9 @@ class CompletenessValidator:
                 error_msg = self.rules_loader.get_error_message(
                     rules, "missing_domain", domain=domain_name
                 )
-                self._add_result(severity, error_msg, result, file_path)
+                self._add_result(
+                    severity, error_msg, result, file_path, CODES["missing_domain"], domain_id
+                )
                 continue
 
             # Check minimum SCDs in domain
@@ -232,11 +242,18 @@ class CompletenessValidator:
                     actual=actual_scds,
                     required=min_scds,
                 )
-                self._add_result(severity, error_msg, result, file_path)
+                self._add_result(
+                    severity,
+                    error_msg,
+                    result,
+                    file_path,
+                    CODES["insufficient_scds_in_domain"],
+                    domain_id,
+                )
 
     def _validate_recommended_scds(
         self,
-        all_scds: List[Dict[str, Any]],
+        all_scds: List[SCDRecord],
         rules: Dict[str, Any],
         result: ValidationResult,
         file_path: str | None,
@@ -244,7 +261,7 @@ class CompletenessValidator:
         """Validate recommended SCDs are present (warnings).
 
         Args:
-            all_scds: List of all SCDs
+            all_scds: List of all SCD records
             rules: Completeness rules
             result: Validation result to update
             file_path: Optional file path
@@ -252,7 +269,7 @@ class CompletenessValidator:
         required_domains = rules.get("required_domains", [])
 
         # Build set of all SCD IDs
-        scd_ids = {scd.get("id", "") for scd in all_scds}
+        scd_ids = {scd.id or "" for scd in all_scds}
 
         for domain_req in required_domains:
             domain_id = domain_req.get("id")
@@ -285,7 +302,11 @@ class CompletenessValidator:
                     if rec_severity == "warning":
                         result.add_warning(
                             ValidationWarning(
-                                warning_msg, level="completeness", file_path=file_path
+                                warning_msg,
+                                level="completeness",
+                                file_path=file_path,
+                                code=CODES["missing_recommended_scd"],
+                                location=f"{domain_id}:{pattern}",
                             )
                         )
 
@@ -309,7 +330,7 @@ class CompletenessValidator:
 
     def _detect_stubs(
         self,
-        all_scds: List[Dict[str, Any]],
+        all_scds: List[SCDRecord],
         rules: Dict[str, Any],
         result: ValidationResult,
         file_path: str | None,
@@ -317,7 +338,7 @@ class CompletenessValidator:
         """Detect stub/placeholder SCDs.
 
         Args:
-            all_scds: List of all SCDs
+            all_scds: List of all SCD records
             rules: Completeness rules
             result: Validation result to update
             file_path: Optional file path
@@ -330,8 +351,8 @@ class CompletenessValidator:
         threshold = stub_config.get("stub_threshold", 2)
 
         for scd in all_scds:
-            scd_id = scd.get("id", "unknown")
-            version = scd.get("version", "")
+            scd_id = "unknown" if scd.id is None else scd.id
+            version = scd.version
 
             # Skip DRAFT versions (stubs expected)
             if version == "DRAFT":
@@ -346,27 +367,26 @@ class CompletenessValidator:
 
                 if check == "short_description":
                     threshold_chars = indicator.get("threshold", 50)
-                    description = scd.get("description", "")
+                    description = scd.data.get("description", "")
                     if len(description.strip()) < threshold_chars:
                         stub_indicators.append(message)
 
                 elif check == "minimal_content":
                     threshold_fields = indicator.get("threshold", 2)
-                    content = scd.get("content", {})
+                    content = scd.data.get("content", {})
                     if isinstance(content, dict) and len(content) < threshold_fields:
                         stub_indicators.append(message)
 
                 elif check == "generic_title":
                     patterns = indicator.get("patterns", [])
-                    title = scd.get("title", "").lower()
+                    title = scd.data.get("title", "").lower()
                     for pattern in patterns:
                         if pattern.lower() in title:
                             stub_indicators.append(message)
                             break
 
                 elif check == "no_relationships":
-                    relationships = scd.get("relationships", [])
-                    if not relationships:
+                    if not scd.relationships:
                         stub_indicators.append(message)
 
             # If enough indicators, warn about stub
@@ -374,13 +394,19 @@ class CompletenessValidator:
                 warning_msg = stub_config.get("warning_message", "SCD appears to be a stub")
                 warning_msg = warning_msg.format(scd_id=scd_id, indicators="; ".join(stub_indicators))
                 result.add_warning(
-                    ValidationWarning(warning_msg, level="completeness", scd_id=scd_id, file_path=file_path)
+                    ValidationWarning(
+                        warning_msg,
+                        level="completeness",
+                        scd_id=scd_id,
+                        file_path=file_path,
+                        code=CODES["stub_detected"],
+                    )
                 )
 
     def _validate_compliance(
         self,
         bundle: Dict[str, Any],
-        all_scds: List[Dict[str, Any]],
+        all_scds: List[SCDRecord],
         rules: Dict[str, Any],
         result: ValidationResult,
         file_path: str | None,
@@ -389,7 +415,7 @@ class CompletenessValidator:
 
         Args:
             bundle: Project bundle data
-            all_scds: List of all SCDs
+            all_scds: List of all SCD records
             rules: Completeness rules
             result: Validation result to update
             file_path: Optional file path
@@ -413,7 +439,13 @@ class CompletenessValidator:
                     error_msg = self.rules_loader.get_error_message(
                         rules, "no_standards_bundle"
                     )
-                    self._add_result(check_severity, error_msg, result, file_path)
+                    self._add_result(
+                        check_severity,
+                        error_msg,
+                        result,
+                        file_path,
+                        CODES["no_standards_bundle"],
+                    )
 
     def _add_result(
         self,
@@ -421,6 +453,8 @@ class CompletenessValidator:
         message: str,
         result: ValidationResult,
         file_path: str | None,
+        code: str | None = None,
+        location: str | None = None,
     ) -> None:
         """Add error or warning based on severity.
 
@@ -429,10 +463,20 @@ class CompletenessValidator:
             message: Message text
             result: Validation result to update
             file_path: Optional file path
+            code: Optional finding code
+            location: Optional location used for the finding fingerprint
         """
         if severity == "error":
-            result.add_error(ValidationError(message, file_path=file_path))
+            result.add_error(
+                ValidationError(message, file_path=file_path, code=code, location=location)
+            )
         else:
             result.add_warning(
-                ValidationWarning(message, level="completeness", file_path=file_path)
+                ValidationWarning(
+                    message,
+                    level="completeness",
+                    file_path=file_path,
+                    code=code,
+                    location=location,
+                )
             )
@@ -0,0 +1,273 @@
+"""Discovery module for finding SCD files in a directory tree."""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+# Ignore files honoured while walking (gitignore syntax)
+IGNORE_FILES = (".gitignore", ".scsignore")
+
+# File patterns validated when no --include is given
+DEFAULT_INCLUDE = ("*.yaml", "*.yml", "*.json")
+
+# Versioned bundle snapshots (<name>-vX.Y.Z.yaml) and version manifests
+# written by ``scs bundle version``; they are never SCDs, and snapshots keep
+# the ID of the bundle they copy
+VERSION_ARTIFACT = re.compile(r"(-v\d+\.\d+\.\d+\.ya?ml|MANIFEST\.ya?ml)$")
+
+# Directories that never contain SCDs worth validating
+_SKIP_DIRS = {
+    ".git", ".hg", ".svn", ".scs", "__pycache__", "node_modules", ".venv", "venv",
+}
+
+
+def is_version_artifact(file_path: Path | str) -> bool:
+    """Check whether a file is a versioned bundle snapshot or version manifest.
+
+    Args:
+        file_path: Path or name of a file
+
+    Returns:
+        True if the file name matches VERSION_ARTIFACT
+    """
+    return VERSION_ARTIFACT.search(Path(file_path).name) is not None
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore-style glob into a regular expression.
+
+    ``*`` and ``?`` never cross a ``/``; ``**`` matches any number of
+    directories.
+
+    Args:
+        pattern: Glob pattern (without leading ``!`` or trailing ``/``)
+
+    Returns:
+        Regular expression source matching a full relative path
+    """
+    i = 0
+    out = []
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        elif c == "\\" and i + 1 < len(pattern):
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class PathPattern:
+    """A single gitignore-style pattern, relative to a base directory."""
+
+    def __init__(self, pattern: str, base: str = "", root: str = ""):
+        """Compile a pattern.
+
+        Args:
+            pattern: Pattern line (may start with ``!`` and end with ``/``)
+            base: Directory the pattern is relative to (posix, "" for root)
+            root: For a pattern from above the walk root, the walk root's
+                path relative to the pattern's directory (posix)
+        """
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # A slash anywhere but the end anchors the pattern to its base
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        prefix = "" if anchored else "(?:.*/)?"
+        self.base = base
+        self.root = root
+        self._regex = re.compile(prefix + glob_to_regex(pattern) + r"\Z")
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """Check whether a path (relative to the walk root) matches.
+
+        Args:
+            rel_path: Posix path relative to the walk root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the pattern matches the path
+        """
+        if self.dir_only and not is_dir:
+            return False
+        if self.root:
+            rel_path = f"{self.root}/{rel_path}"
+        elif self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return False
+            rel_path = rel_path[len(self.base) + 1 :]
+        return self._regex.match(rel_path) is not None
+
+
+def load_ignore_patterns(directory: Path, base: str, root: str = "") -> List[PathPattern]:
+    """Load patterns from the ignore files in a directory.
+
+    Args:
+        directory: Directory to look in
+        base: The directory's path relative to the walk root
+        root: For a directory above the walk root, the walk root's path
+            relative to it
+
+    Returns:
+        Compiled patterns (empty if there are no ignore files)
+    """
+    patterns: List[PathPattern] = []
+    for name in IGNORE_FILES:
+        ignore_file = directory / name
+        try:
+            with open(ignore_file, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            patterns.append(PathPattern(line, base, root))
+    return patterns
+
+
+def load_ancestor_ignore_patterns(root: Path) -> List[PathPattern]:
+    """Load the ignore files above a walk root, up to its repository root.
+
+    Walks up from ``root`` to the nearest directory that is a git checkout
+    (has ``.git``) or an SCS project (has ``.scs/``), so walking a
+    subdirectory ignores the same files as walking the whole tree. The walk
+    root itself is never ignored, even if an ancestor's patterns match it.
+
+    Args:
+        root: Walk root
+
+    Returns:
+        Patterns in precedence order (outermost directory first); empty if
+        the walk root is itself a repository root or isn't inside one
+    """
+    root = root.resolve()
+    ancestors = []
+    for directory in (root, *root.parents):
+        if directory != root:
+            ancestors.append(directory)
+        if (directory / ".git").exists() or (directory / ".scs").is_dir():
+            break
+    else:
+        return []
+
+    patterns: List[PathPattern] = []
+    for directory in reversed(ancestors):
+        patterns += load_ignore_patterns(directory, "", root.relative_to(directory).as_posix())
+    return patterns
+
+
+def is_ignored(patterns: Sequence[PathPattern], rel_path: str, is_dir: bool) -> bool:
+    """Apply ignore patterns in order; the last matching pattern wins.
+
+    Args:
+        patterns: Patterns in precedence order (later overrides earlier)
+        rel_path: Posix path relative to the walk root
+        is_dir: Whether the path is a directory
+
+    Returns:
+        True if the path is ignored
+    """
+    ignored = False
+    for pattern in patterns:
+        if pattern.matches(rel_path, is_dir):
+            ignored = not pattern.negated
+    return ignored
+
+
+def discover_scd_files(
+    root: Path,
+    recursive: bool = False,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    use_ignore_files: bool = True,
+) -> Iterator[Path]:
+    """Walk a directory and yield candidate SCD files as they are found.
+
+    Uses ``os.scandir`` so file types come from the directory listing rather
+    than a separate stat per entry. Entries are yielded in sorted order per
+    directory, so results are deterministic. Because this is a generator,
+    callers can start validating the first files while the walk continues.
+
+    Args:
+        root: Directory to walk
+        recursive: Descend into subdirectories
+        include: Glob patterns a file must match (default: YAML and JSON files;
+            version snapshots and manifests are always skipped)
+        exclude: Glob patterns for files or directories to skip
+        use_ignore_files: Honour .gitignore/.scsignore files found in the tree
+            and above it, up to the repository or SCS project root
+
+    Yields:
+        Paths of files to validate
+    """
+    include_patterns = [PathPattern(p) for p in (tuple(include) or DEFAULT_INCLUDE)]
+    exclude_patterns = [PathPattern(p) for p in exclude]
+
+    # Stack of (directory, relative posix path, inherited ignore patterns)
+    seed = load_ancestor_ignore_patterns(root) if use_ignore_files else []
+    stack: List[Tuple[Path, str, List[PathPattern]]] = [(root, "", seed)]
+    while stack:
+        directory, rel_dir, inherited = stack.pop()
+        ignore = inherited
+        if use_ignore_files:
+            ignore = inherited + load_ignore_patterns(directory, rel_dir)
+
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            is_dir = entry.is_dir()
+            if is_dir and (not recursive or entry.name in _SKIP_DIRS):
+                continue
+            if ignore and is_ignored(ignore, rel_path, is_dir):
+                continue
+            if any(p.matches(rel_path, is_dir) for p in exclude_patterns):
+                continue
+            if is_dir:
+                subdirs.append((Path(entry.path), rel_path, ignore))
+            elif (
+                entry.is_file()
+                and not is_version_artifact(entry.name)
+                and any(p.matches(rel_path, False) for p in include_patterns)
+            ):
+                yield Path(entry.path)
+
+        # Reverse so directories are visited in sorted order
+        stack.extend(reversed(subdirs))
@@ -0,0 +1,264 @@
+"""Columnar findings store for aggregating validation errors and warnings."""
+
+from array import array
+from collections import Counter
+from itertools import compress
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from .utils import ValidationResult
+
+SEVERITIES = ("error", "warning")
+
+
+class Finding(NamedTuple):
+    """A single finding materialized from the store."""
+
+    severity: str
+    level: str
+    code: str | None
+    scd_id: str | None
+    file_path: str | None
+    message: str
+    fingerprint: str | None
+
+    def format_message(self) -> str:
+        """Format the finding like ValidationError, prefixed with its code."""
+        parts = []
+        if self.file_path:
+            parts.append(f"{self.file_path}")
+        if self.scd_id:
+            parts.append(f"({self.scd_id})")
+        parts.append("-")
+        if self.code:
+            parts.append(f"[{self.code}]")
+        parts.append(self.message)
+        return " ".join(parts)
+
+
+class _StringTable:
+    """Interns strings to small integer indexes (index 0 is reserved for None)."""
+
+    def __init__(self) -> None:
+        self.values: List[str | None] = [None]
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        idx = self._index.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self._index[value] = idx
+            self.values.append(value)
+        return idx
+
+    def lookup(self, value: str | None) -> int | None:
+        if value is None:
+            return 0
+        return self._index.get(value)
+
+
+class FindingsStore:
+    """Stores findings as parallel arrays of interned column values.
+
+    Each finding occupies one row across the ``level``, ``severity``, ``code``,
+    ``scd``, ``file`` and ``message`` columns. Repeated strings (file paths, SCD
+    IDs, message texts) are stored once, so grouping and filtering operate on
+    compact integer arrays instead of lists of objects. Fingerprints are
+    (nearly) unique per finding, so interning would only add a dictionary
+    entry per row; they are kept in a plain list alongside the columns.
+    """
+
+    COLUMNS = ("level", "severity", "code", "scd", "file", "message")
+
+    def __init__(self) -> None:
+        self._tables: Dict[str, _StringTable] = {
+            name: _StringTable() for name in self.COLUMNS if name != "severity"
+        }
+        self._columns: Dict[str, array] = {name: array("I") for name in self.COLUMNS}
+        self._columns["severity"] = array("B")
+        self._fingerprints: List[str | None] = []
+
+    @classmethod
+    def from_results(cls, results: List[ValidationResult]) -> "FindingsStore":
+        """Build a store from validation results.
+
+        Errors are recorded under the level of the result that holds them,
+        warnings under their own ``level`` attribute.
+
+        Args:
+            results: List of validation results
+
+        Returns:
+            Populated findings store
+        """
+        store = cls()
+        for result in results:
+            for error in result.errors:
+                store.add(
+                    "error",
+                    result.level_name,
+                    error.message,
+                    scd_id=error.scd_id,
+                    file_path=error.file_path,
+                    code=error.code,
+                    fingerprint=error.fingerprint,
+                )
+            for warning in result.warnings:
+                store.add(
+                    "warning",
+                    warning.level,
+                    warning.message,
+                    scd_id=warning.scd_id,
+                    file_path=warning.file_path,
+                    code=warning.code,
+                    fingerprint=warning.fingerprint,
+                )
+        return store
+
+    def add(
+        self,
+        severity: str,
+        level: str,
+        message: str,
+        scd_id: str | None = None,
+        file_path: str | None = None,
+        code: str | None = None,
+        fingerprint: str | None = None,
+    ) -> None:
+        """Append a finding to the store.
+
+        Args:
+            severity: "error" or "warning"
+            level: Validation level name
+            message: Finding message
+            scd_id: Optional SCD ID
+            file_path: Optional file path
+            code: Optional finding code
+            fingerprint: Optional finding fingerprint
+        """
+        columns = self._columns
+        tables = self._tables
+        columns["severity"].append(SEVERITIES.index(severity))
+        columns["level"].append(tables["level"].intern(level))
+        columns["code"].append(tables["code"].intern(code))
+        columns["scd"].append(tables["scd"].intern(scd_id))
+        columns["file"].append(tables["file"].intern(file_path))
+        columns["message"].append(tables["message"].intern(message))
+        self._fingerprints.append(fingerprint)
+
+    def __len__(self) -> int:
+        return len(self._columns["severity"])
+
+    def count(self, severity: str | None = None) -> int:
+        """Count findings, optionally restricted to one severity."""
+        if severity is None:
+            return len(self)
+        return self._columns["severity"].count(SEVERITIES.index(severity))
+
+    def count_by(self, column: str, severity: str | None = None) -> Dict[str | None, int]:
+        """Group findings by a column and count each group.
+
+        Args:
+            column: One of ``COLUMNS``
+            severity: Optional severity to restrict the count to
+
+        Returns:
+            Mapping of column value to number of findings
+        """
+        counts = Counter(self._column_values(column, severity))
+        if column == "severity":
+            return {SEVERITIES[idx]: n for idx, n in counts.items()}
+        values = self._tables[column].values
+        return {values[idx]: n for idx, n in counts.items()}
+
+    def top(
+        self, column: str, n: int = 10, severity: str | None = None
+    ) -> List[Tuple[str, int]]:
+        """Return the ``n`` values of a column with the most findings.
+
+        Findings without a value for the column (e.g. no SCD ID) are ignored.
+
+        Args:
+            column: One of ``COLUMNS``
+            n: Number of entries to return
+            severity: Optional severity to restrict the count to
+
+        Returns:
+            List of (value, count) pairs, most findings first
+        """
+        counts = Counter(self._column_values(column, severity))
+        counts.pop(0, None)
+        values = self._tables[column].values
+        return [(values[idx], count) for idx, count in counts.most_common(n)]
+
+    def select(
+        self,
+        severity: str | None = None,
+        level: str | None = None,
+        file_path: str | None = None,
+        scd_id: str | None = None,
+        code: str | None = None,
+    ) -> List[int]:
+        """Return row indexes of findings matching all given filters.
+
+        Args:
+            severity: Optional severity filter
+            level: Optional level filter
+            file_path: Optional file path filter
+            scd_id: Optional SCD ID filter
+            code: Optional finding code filter
+
+        Returns:
+            Matching row indexes in insertion order
+        """
+        rows: range | List[int] = range(len(self))
+        filters = [
+            ("severity", SEVERITIES.index(severity) if severity is not None else None),
+            ("level", self._lookup("level", level)),
+            ("file", self._lookup("file", file_path)),
+            ("scd", self._lookup("scd", scd_id)),
+            ("code", self._lookup("code", code)),
+        ]
+        for column, wanted in filters:
+            if wanted is None:
+                continue
+            if wanted < 0:
+                return []
+            values = self._columns[column]
+            rows = [i for i in rows if values[i] == wanted]
+        return list(rows)
+
+    def finding(self, row: int) -> Finding:
+        """Materialize a single row as a Finding."""
+        columns = self._columns
+        tables = self._tables
+        return Finding(
+            severity=SEVERITIES[columns["severity"][row]],
+            level=tables["level"].values[columns["level"][row]] or "",
+            code=tables["code"].values[columns["code"][row]],
+            scd_id=tables["scd"].values[columns["scd"][row]],
+            file_path=tables["file"].values[columns["file"][row]],
+            message=tables["message"].values[columns["message"][row]] or "",
+            fingerprint=self._fingerprints[row],
+        )
+
+    def iter_findings(self, rows: List[int] | None = None) -> Iterator[Finding]:
+        """Iterate findings for the given rows (all rows if omitted)."""
+        for row in range(len(self)) if rows is None else rows:
+            yield self.finding(row)
+
+    def _column_values(self, column: str, severity: str | None) -> array | Iterator[int]:
+        """Get a column's raw values, optionally masked by severity."""
+        values = self._columns[column]
+        if severity is None:
+            return values
+        wanted = SEVERITIES.index(severity)
+        return compress(values, (s == wanted for s in self._columns["severity"]))
+
+    def _lookup(self, column: str, value: str | None) -> int | None:
+        """Resolve a filter value to its interned index (-1 if never seen)."""
+        if value is None:
+            return None
+        idx = self._tables[column].lookup(value)
+        return -1 if idx is None else idx
@@ -0,0 +1,102 @@
+"""Parsed SCD records shared by the validators."""
+
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+# Tiers an SCD ID may name
+TIERS = ("meta", "project", "standards")
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated IDs share one object; pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Relationship(NamedTuple):
+    """A relationship entry of an SCD."""
+
+    type: str | None
+    target: str | None
+
+
+class SCDRecord(NamedTuple):
+    """Immutable view of an SCD, built once when the document is loaded.
+
+    ID, tier and name are derived from the ID a single time, and frequently
+    read fields are extracted up front so validators don't repeatedly split
+    strings or probe the raw dictionary. ``data`` is the raw document for
+    fields without a dedicated attribute.
+    """
+
+    id: str | None
+    tier: str | None
+    name: str | None
+    type: str | None
+    version: Any
+    domain: str | None
+    relationships: Tuple[Relationship, ...]
+    data: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, scd: Dict[str, Any]) -> "SCDRecord":
+        """Build a record from a raw SCD dictionary.
+
+        Args:
+            scd: SCD data as dictionary
+
+        Returns:
+            SCD record
+        """
+        scd_id = _intern(scd.get("id"))
+        tier = name = None
+        if isinstance(scd_id, str):
+            parts = scd_id.split(":", 2)
+            if len(parts) >= 2 and parts[0] == "scd" and parts[1] in TIERS:
+                tier = _intern(parts[1])
+                name = parts[2] if len(parts) == 3 else None
+
+        relationships = []
+        for rel in scd.get("relationships") or ():
+            if isinstance(rel, dict):
+                relationships.append(
+                    Relationship(_intern(rel.get("type")), _intern(rel.get("target")))
+                )
+            else:
+                relationships.append(Relationship(None, None))
+
+        return cls(
+            id=scd_id,
+            tier=tier,
+            name=name,
+            type=_intern(scd.get("type")),
+            version=scd.get("version"),
+            domain=_intern(scd.get("domain")),
+            relationships=tuple(relationships),
+            data=scd,
+        )
+
+
+def as_record(scd: "SCDRecord | Dict[str, Any]") -> SCDRecord:
+    """Coerce a raw SCD dictionary to a record (records are returned as-is).
+
+    Args:
+        scd: SCD record or raw SCD dictionary
+
+    Returns:
+        SCD record
+    """
+    if isinstance(scd, SCDRecord):
+        return scd
+    return SCDRecord.from_dict(scd)
+
+
+def as_records(scds: Iterable["SCDRecord | Dict[str, Any]"]) -> List[SCDRecord]:
+    """Coerce a collection of SCDs to records.
+
+    Args:
+        scds: SCD records and/or raw SCD dictionaries
+
+    Returns:
+        List of SCD records
+    """
+    return [as_record(scd) for scd in scds]
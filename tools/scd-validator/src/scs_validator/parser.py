@@ -1,23 +1,583 @@
 """Parser module for loading SCD and bundle files."""
 
 import json
+import mmap
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, Iterator, NamedTuple
 
 import yaml
+from yaml.composer import Composer, ComposerError
+from yaml.constructor import ConstructorError, SafeConstructor
+from yaml.events import (
+    CollectionEndEvent,
+    CollectionStartEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+from yaml.nodes import CollectionNode, MappingNode, ScalarNode
+from yaml.resolver import Resolver
 
+from .codes import CODES
 from .utils import ValidationError
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_FastSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parse with libyaml when PyYAML was built with it
+try:
+    from yaml.cyaml import CParser as _EventParser
+except ImportError:  # PyYAML built without libyaml
+    _EventParser = None
+
+class ParseLimits(NamedTuple):
+    """Resource limits applied to every file a Parser loads.
+
+    A limit of 0 (or None) disables that check.
+
+    Attributes:
+        max_file_size: Largest file read, in bytes
+        max_alias_expansion: Most nodes that YAML aliases may expand to in
+            one document (an alias counts every node of the subtree it
+            repeats, so "billion laughs" documents are rejected early)
+        max_depth: Deepest nesting of mappings and sequences, after alias
+            expansion
+        parse_timeout: Seconds one file may spend being parsed (off by
+            default). Checked while scanning and constructing, and once
+            libyaml has composed the document, which it can't interrupt
+    """
+
+    max_file_size: int | None = 64 * 1024 * 1024
+    max_alias_expansion: int | None = 100_000
+    max_depth: int | None = 256
+    parse_timeout: float | None = None
+
+
+class ParseLimitError(yaml.YAMLError):
+    """Raised while loading a document that exceeds a ParseLimits limit.
+
+    Attributes:
+        code_name: Key of the finding code in CODES
+    """
+
+    def __init__(self, message: str, code_name: str) -> None:
+        super().__init__(message)
+        self.code_name = code_name
+
+
+# libyaml's composer recurses once per nesting level without any guard (the
+# process crashes somewhere past 40,000 levels), so deeper documents are
+# never handed to it, whatever --max-depth says
+_COMPOSER_MAX_DEPTH = 10_000
+
+# A [ or { that can open a flow collection (not right after a word
+# character or a quote), and an alias (*name) where a node can start. Both
+# match the bracket or star first and look behind only then, which keeps
+# the scan fast on large files.
+_FLOW_START = r"[\[{](?<![\w\"'][\[{])"
+_ALIAS = r"\*(?<![^\s\[{,:?-]\*)"
+_PATTERNS = {
+    kind: (re.compile(encode(_FLOW_START)), re.compile(encode(_ALIAS)))
+    for kind, encode in ((str, str), (bytes, str.encode))
+}
+
+
+def _patterns(text: str | bytes | mmap.mmap) -> tuple[re.Pattern, re.Pattern]:
+    return _PATTERNS[str if isinstance(text, str) else bytes]
+
+
+def may_nest_deeper(text: str | bytes | mmap.mmap, limit: int) -> bool:
+    """Tell cheaply whether a YAML or JSON document may nest deeper than ``limit``.
+
+    Counts every ``[`` or ``{`` that could open a flow collection, then looks
+    for a line led by more indentation and block indicators than the rest
+    of the budget allows (block collections nest at most one level per
+    column). Runs at regex speed, without building events or nodes; a True
+    answer may be a false alarm.
+
+    Args:
+        text: Document as text, bytes or a memory-mapped file
+        limit: Deepest nesting allowed
+
+    Returns:
+        False if the document certainly nests at most ``limit`` levels deep
+    """
+    flow, _ = _patterns(text)
+    room = limit - len(flow.findall(text)) - 1
+    if room <= 0:
+        return True
+    first_line = rf"[ \t?:-]{{{room},}}"
+    # Searching for a newline first is several times faster than anchoring
+    # the pattern at every line start with ^
+    other_lines = "\n" + first_line
+    if not isinstance(text, str):
+        first_line, other_lines = first_line.encode(), other_lines.encode()
+    return bool(re.match(first_line, text) or re.search(other_lines, text))
+
+
+def _depth_limit(limits: ParseLimits) -> tuple[int, str]:
+    """The depth to enforce and the message when it's exceeded"""
+    if limits.max_depth and limits.max_depth <= _COMPOSER_MAX_DEPTH:
+        return limits.max_depth, f"Nesting is deeper than {limits.max_depth} levels"
+    return _COMPOSER_MAX_DEPTH, "Nesting is too deep to parse"
+
+
+def check_nesting(
+    text: str | bytes | mmap.mmap, limits: ParseLimits, deadline: float | None = None
+) -> None:
+    """Reject a YAML document nested deeper than allowed, before it is composed.
+
+    The depth is only counted exactly, on the event stream, when
+    may_nest_deeper() doesn't already rule deep nesting out.
+
+    Args:
+        text: Document as text, bytes or a memory-mapped file
+        limits: Limits to enforce
+        deadline: ``time.monotonic()`` value after which parsing is aborted
+
+    Raises:
+        ParseLimitError: If the document is nested too deeply
+    """
+    limit, message = _depth_limit(limits)
+    if not may_nest_deeper(text, limit):
+        return
+    depth = events = 0
+    try:
+        for event in yaml.parse(text, Loader=_FastSafeLoader):
+            if isinstance(event, CollectionStartEvent):
+                depth += 1
+                if depth > limit:
+                    raise ParseLimitError(message, "nesting_too_deep")
+            elif isinstance(event, CollectionEndEvent):
+                depth -= 1
+            events += 1
+            if deadline is not None and events % 4096 == 0:
+                _check_deadline(deadline, limits)
+    except ParseLimitError:
+        raise
+    except yaml.YAMLError:
+        pass  # Reported with its position when the document is loaded
+
+
+def check_object_nesting(data: Any, limits: ParseLimits) -> None:
+    """Reject parsed JSON nested deeper than allowed.
+
+    Args:
+        data: Parsed document
+        limits: Limits to enforce
+
+    Raises:
+        ParseLimitError: If the document is nested too deeply
+    """
+    limit, message = _depth_limit(limits)
+    stack = [(data, 1)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, dict):
+            value = value.values()
+        elif not isinstance(value, list):
+            continue
+        if depth > limit:
+            raise ParseLimitError(message, "nesting_too_deep")
+        stack.extend((child, depth + 1) for child in value)
+
+
+def _check_deadline(deadline: float | None, limits: ParseLimits) -> None:
+    if deadline is not None and time.monotonic() > deadline:
+        raise ParseLimitError(f"Parsing took longer than {limits.parse_timeout}s", "parse_timeout")
+
+
+@contextmanager
+def _recursion_room(limits: ParseLimits) -> Iterator[None]:
+    """Let the pure-Python composer reach the depth limit, restoring the recursion limit after.
+
+    It recurses through a few frames per nesting level, so the default
+    limit of 1000 frames doesn't leave room for much more than 256 levels.
+    """
+    previous = sys.getrecursionlimit()
+    needed = _depth_limit(limits)[0] * 3 + 500
+    if needed > previous:
+        sys.setrecursionlimit(needed)
+    try:
+        yield
+    finally:
+        if needed > previous:
+            sys.setrecursionlimit(previous)
+
+
+def check_node_limits(node: Any, limits: ParseLimits, deadline: float | None = None) -> None:
+    """Check a composed YAML node graph against alias and nesting limits.
+
+    Runs before any Python objects are constructed. Nodes reached through
+    an alias are shared in the graph, so each one is visited once and its
+    expanded size and depth are memoized; the cost is proportional to the
+    document as written, not as expanded.
+
+    Args:
+        node: Root node returned by the composer
+        limits: Limits to enforce
+        deadline: ``time.monotonic()`` value after which parsing is aborted
+
+    Raises:
+        ParseLimitError: If a limit is exceeded or an alias refers to one of
+            its own ancestors
+    """
+    # Expanded node count and depth of every collection node seen, by id
+    sizes: Dict[int, tuple[int, int]] = {}
+    on_path = set()
+    aliased = 0
+    stack = [(node, False)]
+    visited = 0
+    while stack:
+        current, children_done = stack.pop()
+        key = id(current)
+        if not children_done:
+            if key in sizes:
+                # Seen before: an alias repeating an earlier subtree
+                aliased += sizes[key][0]
+                if limits.max_alias_expansion and aliased > limits.max_alias_expansion:
+                    raise ParseLimitError(
+                        f"YAML aliases expand to more than {limits.max_alias_expansion} nodes",
+                        "yaml_alias_limit",
+                    )
+                continue
+            if key in on_path:
+                raise ParseLimitError(
+                    "YAML alias refers to one of its own ancestors", "yaml_alias_limit"
+                )
+            if not isinstance(current, CollectionNode):
+                sizes[key] = (1, 0)
+                continue
+            visited += 1
+            if deadline is not None and visited % 4096 == 0:
+                _check_deadline(deadline, limits)
+            on_path.add(key)
+            stack.append((current, True))
+            if isinstance(current, MappingNode):
+                children = [child for pair in current.value for child in pair]
+            else:
+                children = current.value
+            stack.extend((child, False) for child in reversed(children))
+        else:
+            on_path.discard(key)
+            if isinstance(current, MappingNode):
+                children = [child for pair in current.value for child in pair]
+            else:
+                children = current.value
+            size, depth = 1, 0
+            for child in children:
+                child_size, child_depth = sizes[id(child)]
+                size += child_size
+                depth = max(depth, child_depth)
+            depth += 1
+            if limits.max_depth and depth > limits.max_depth:
+                raise ParseLimitError(
+                    f"Nesting is deeper than {limits.max_depth} levels", "nesting_too_deep"
+                )
+            sizes[key] = (size, depth)
+
+
+class _Deadline:
+    """Loader mixin aborting construction once the parse deadline has passed."""
+
+    deadline: float | None = None
+    limits = ParseLimits()
+    _constructed = 0
+
+    def construct_object(self, node, deep=False):
+        self._constructed += 1
+        if self._constructed % 1024 == 0:
+            _check_deadline(self.deadline, self.limits)
+        return super().construct_object(node, deep)
+
+
+class _LimitingComposer(_Deadline, Composer):
+    """Composer mixin enforcing nesting depth and the time budget while composing.
+
+    Used for multi-document streams, which can't be checked up front like
+    a file: composition runs in Python (over libyaml's events when
+    available) and counts nesting as it goes.
+    """
+
+    has_anchors = False
+    _nesting = 0
+    _composed = 0
+
+    def compose_document(self):
+        # Composer.compose_document, noting whether any anchor was defined
+        # (without anchors there are no aliases to expand)
+        self.get_event()
+        node = self.compose_node(None, None)
+        self.get_event()
+        self.has_anchors = bool(self.anchors)
+        self.anchors = {}
+        return node
+
+    def compose_node(self, parent, index):
+        self._composed += 1
+        if self._composed % 1024 == 0:
+            _check_deadline(self.deadline, self.limits)
+        self._nesting += 1
+        try:
+            max_depth, message = _depth_limit(self.limits)
+            if self._nesting > max_depth + 1:
+                raise ParseLimitError(message, "nesting_too_deep")
+            return super().compose_node(parent, index)
+        finally:
+            self._nesting -= 1
+
+
+class _TimedLoader(_Deadline, yaml.SafeLoader):
+    """Pure-Python safe loader with a parse deadline."""
+
+
+class _TimedFastLoader(_Deadline, _FastSafeLoader):
+    """Safe loader (libyaml when available) with a parse deadline."""
+
+
+# Loaders whose composer is libyaml's
+_C_COMPOSED = () if _FastSafeLoader is yaml.SafeLoader else (_FastSafeLoader, _TimedFastLoader)
+
+
+if _EventParser is not None:
+
+    class _StreamLoader(_LimitingComposer, _EventParser, SafeConstructor, Resolver):
+        """Safe loader on libyaml events with parse limits, for streams."""
+
+        def __init__(self, stream):
+            _EventParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+else:
+
+    class _StreamLoader(_LimitingComposer, yaml.SafeLoader):  # type: ignore[no-redef]
+        """Pure-Python safe loader with parse limits, for streams."""
+
+
+def _load_limited(content: str | IO[bytes], limits: ParseLimits, header: bool = False) -> Any:
+    """Load one YAML document under limits.
+
+    Nesting is checked before composing (see check_nesting), so libyaml's
+    unguarded composer only sees documents it can handle; the alias limits
+    are checked on the composed node graph, before any Python objects are
+    built, and only if the document can contain an alias at all.
+
+    Args:
+        content: A str is loaded by the pure-Python loader (as
+            ``yaml.safe_load`` does); a binary file, open at its start, by
+            libyaml when available (the checks scan it memory-mapped)
+        limits: Limits to enforce
+        header: Skip the values of the top-level content mapping
+
+    Returns:
+        Parsed document
+    """
+    if isinstance(content, str):
+        return _load_checked(content, content, limits, header)
+    with mmap.mmap(content.fileno(), 0, access=mmap.ACCESS_READ) as text:
+        return _load_checked(content, text, limits, header)
+
+
+def _load_checked(
+    content: str | IO[bytes], text: str | mmap.mmap, limits: ParseLimits, header: bool
+) -> Any:
+    """Load ``content`` after checking its nesting, scanning it as ``text``"""
+    deadline = time.monotonic() + limits.parse_timeout if limits.parse_timeout else None
+    check_nesting(text, limits, deadline)
+    if header:
+        loader_class = _TimedHeaderLoader if deadline else _HeaderLoader
+    elif isinstance(content, str):
+        loader_class = _TimedLoader if deadline else yaml.SafeLoader
+    else:
+        loader_class = _TimedFastLoader if deadline else _FastSafeLoader
+    loader = loader_class(content)
+    try:
+        if deadline:
+            loader.deadline = deadline
+            loader.limits = limits
+        # libyaml composes in C, without recursing in Python
+        with nullcontext() if loader_class in _C_COMPOSED else _recursion_room(limits):
+            node = loader.get_single_node()
+        if node is None:
+            return None
+        _check_deadline(deadline, limits)
+        if _patterns(text)[1].search(text):
+            check_node_limits(node, limits, deadline)
+        return loader.construct_document(node)
+    except RecursionError:
+        raise ParseLimitError("Nesting is too deep to parse", "nesting_too_deep")
+    finally:
+        loader.dispose()
+
+
+class StreamDocument(NamedTuple):
+    """One document read from a multi-document YAML stream or NDJSON.
+
+    Attributes:
+        index: 1-based position of the document in the stream
+        line: 1-based line the document starts on
+        label: ``<source>:<line> (document <index>)``, used as the file path
+            of findings
+        data: Parsed document, or None if it couldn't be read
+        error: Why the document couldn't be read, or None
+    """
+
+    index: int
+    line: int
+    label: str
+    data: Dict[str, Any] | None
+    error: ValidationError | None
+
+
+# Stream formats accepted by Parser.iter_stream
+STREAM_FORMATS = ("auto", "yaml", "ndjson")
+
+# File suffixes read as NDJSON when the stream format is "auto"
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def strip_content(data: Any) -> Any:
+    """Replace an SCD's ``content`` mapping with its keys (values set to None).
+
+    Keeps ``len(content)`` and key membership intact for structural checks
+    while dropping the (possibly large) content tree.
+
+    Args:
+        data: Parsed document
+
+    Returns:
+        The same document, with content reduced to its keys
+    """
+    if isinstance(data, dict) and isinstance(data.get("content"), dict):
+        data["content"] = dict.fromkeys(data["content"])
+    return data
+
+
+class _ContentSkippingComposer(Composer):
+    """Composer that reads a document's top-level ``content`` mapping as keys only.
+
+    Values inside ``content`` are consumed from the event stream without
+    creating nodes (and so without constructing Python objects); each is
+    composed as null. Everything else is composed normally.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._depth = 0
+
+    def compose_node(self, parent, index):
+        if (
+            self._depth == 1
+            and isinstance(index, ScalarNode)
+            and index.value == "content"
+            and self.check_event(MappingStartEvent)
+        ):
+            return self._compose_content_keys()
+        self._depth += 1
+        try:
+            return super().compose_node(parent, index)
+        finally:
+            self._depth -= 1
+
+    def _compose_content_keys(self) -> MappingNode:
+        """Compose a mapping's keys, skipping every value subtree."""
+        start_event = self.get_event()
+        tag = start_event.tag
+        if tag is None or tag == "!":
+            tag = self.resolve(MappingNode, None, start_event.implicit)
+        node = MappingNode(tag, [], start_event.start_mark, None, flow_style=start_event.flow_style)
+        if start_event.anchor is not None:
+            self.anchors[start_event.anchor] = node
+        while not self.check_event(MappingEndEvent):
+            key = self.compose_node(node, None)
+            mark = self.peek_event().start_mark
+            self._skip_node()
+            node.value.append((key, ScalarNode("tag:yaml.org,2002:null", "", mark, mark)))
+        node.end_mark = self.get_event().end_mark
+        return node
+
+    def _skip_node(self) -> None:
+        """Consume the events of one node (scalar, alias or whole collection)."""
+        depth = 0
+        while True:
+            event = self.get_event()
+            if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+                depth += 1
+            elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+                depth -= 1
+            if depth == 0:
+                return
+
+
+if _EventParser is not None:
+
+    class _HeaderLoader(_ContentSkippingComposer, _EventParser, SafeConstructor, Resolver):
+        """Safe loader on libyaml events that skips the content subtree."""
+
+        def __init__(self, stream):
+            _EventParser.__init__(self, stream)
+            _ContentSkippingComposer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+else:
+    from yaml.parser import Parser as _PyEventParser
+    from yaml.reader import Reader
+    from yaml.scanner import Scanner
+
+    class _HeaderLoader(  # type: ignore[no-redef]
+        Reader, Scanner, _PyEventParser, _ContentSkippingComposer, SafeConstructor, Resolver
+    ):
+        """Safe loader that skips the content subtree."""
+
+        def __init__(self, stream):
+            Reader.__init__(self, stream)
+            Scanner.__init__(self)
+            _PyEventParser.__init__(self)
+            _ContentSkippingComposer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+class _TimedHeaderLoader(_Deadline, _HeaderLoader):
+    """Content-skipping loader with a parse deadline."""
+
 
 class Parser:
-    """Parser for SCD and bundle files."""
+    """Parser for SCD and bundle files.
 
-    @staticmethod
-    def load_scd(file_path: Path) -> Dict[str, Any]:
+    Every file is loaded under the parser's ParseLimits; a file exceeding
+    them is reported as a syntax-level error. The limits travel with the
+    instance, so worker processes apply the same ones.
+    """
+
+    # YAML files at least this large are streamed into the loader as bytes
+    # instead of being read into a str first
+    STREAM_THRESHOLD = 1024 * 1024
+
+    def __init__(self, limits: ParseLimits | None = None) -> None:
+        """Initialize parser.
+
+        Args:
+            limits: Resource limits (default: ParseLimits())
+        """
+        self.limits = limits or ParseLimits()
+
+    def load_scd(self, file_path: Path, skip_content: bool = False) -> Dict[str, Any]:
         """Load an SCD file (YAML or JSON).
 
         Args:
             file_path: Path to the SCD file
+            skip_content: Load ``content`` as its keys only (see strip_content);
+                for YAML the content values are never built
 
         Returns:
             Parsed SCD as dictionary
@@ -25,37 +585,61 @@ class Parser:
         Raises:
             ValidationError: If file cannot be loaded or parsed
         """
-        if not file_path.exists():
+        # Open once and size the open file, rather than probing the path
+        # with separate exists()/stat() calls
+        try:
+            stream = open(file_path, "rb")
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValidationError(
+                f"File not found: {file_path}",
+                file_path=str(file_path),
+                code=CODES["file_not_found"],
+            )
+        except OSError as e:
             raise ValidationError(
-                f"File not found: {file_path}", file_path=str(file_path)
+                f"Failed to load file: {e}",
+                file_path=str(file_path),
+                code=CODES["load_failed"],
             )
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            with stream:
+                size = os.fstat(stream.fileno()).st_size
+                if self.limits.max_file_size and size > self.limits.max_file_size:
+                    raise ValidationError(
+                        f"File is {size} bytes, more than the {self.limits.max_file_size} "
+                        "byte limit",
+                        file_path=str(file_path),
+                        code=CODES["file_too_large"],
+                    )
+                if file_path.suffix in [".yaml", ".yml"] and size >= Parser.STREAM_THRESHOLD:
+                    return self._parse_yaml(stream, file_path, skip_content)
+
+                content = stream.read().decode("utf-8")
 
             # Try to parse based on file extension
             if file_path.suffix in [".yaml", ".yml"]:
-                return Parser._parse_yaml(content, file_path)
+                return self._parse_yaml(content, file_path, skip_content)
             elif file_path.suffix == ".json":
-                return Parser._parse_json(content, file_path)
+                data = self._parse_json(content, file_path)
             else:
                 # Try YAML first, then JSON
                 try:
-                    return Parser._parse_yaml(content, file_path)
+                    return self._parse_yaml(content, file_path, skip_content)
                 except Exception:
-                    return Parser._parse_json(content, file_path)
+                    data = self._parse_json(content, file_path)
+            return strip_content(data) if skip_content else data
 
         except ValidationError:
             raise
         except Exception as e:
             raise ValidationError(
                 f"Failed to load file: {e}",
-                file_path=str(file_path)
+                file_path=str(file_path),
+                code=CODES["load_failed"],
             )
 
-    @staticmethod
-    def load_bundle(file_path: Path) -> Dict[str, Any]:
+    def load_bundle(self, file_path: Path) -> Dict[str, Any]:
         """Load a bundle file (YAML or JSON).
 
         Args:
@@ -68,41 +652,70 @@ class Parser:
             ValidationError: If file cannot be loaded or parsed
         """
         # Bundle loading is the same as SCD loading
-        return Parser.load_scd(file_path)
+        return Parser.load_scd(self, file_path)
 
-    @staticmethod
-    def _parse_yaml(content: str, file_path: Path) -> Dict[str, Any]:
+    def _parse_yaml(
+        self, content: str | IO[bytes], file_path: Path, skip_content: bool = False
+    ) -> Dict[str, Any]:
         """Parse YAML content.
 
         Args:
-            content: YAML content as string
+            content: YAML content as string, or a binary file open at its start
             file_path: Path to file (for error messages)
+            skip_content: Skip the values of the top-level content mapping
 
         Returns:
             Parsed content as dictionary
 
         Raises:
-            ValidationError: If YAML is invalid
+            ValidationError: If YAML is invalid or exceeds the parse limits
         """
         try:
-            data = yaml.safe_load(content)
+            if skip_content:
+                data = self._load_yaml_header(content)
+            else:
+                data = _load_limited(content, self.limits)
             if not isinstance(data, dict):
                 raise ValidationError(
                     "YAML content must be an object/dictionary",
-                    file_path=str(file_path)
+                    file_path=str(file_path),
+                    code=CODES["not_a_mapping"],
                 )
             return data
+        except ParseLimitError as e:
+            raise ValidationError(
+                f"YAML rejected: {e}", file_path=str(file_path), code=CODES[e.code_name]
+            )
         except yaml.YAMLError as e:
             # Extract line and column information if available
             error_msg = f"Invalid YAML syntax: {e}"
             if hasattr(e, "problem_mark"):
                 mark = e.problem_mark
                 error_msg = f"Invalid YAML syntax at line {mark.line + 1}, column {mark.column + 1}: {e.problem}"
-            raise ValidationError(error_msg, file_path=str(file_path))
+            raise ValidationError(
+                error_msg, file_path=str(file_path), code=CODES["invalid_yaml"]
+            )
 
-    @staticmethod
-    def _parse_json(content: str, file_path: Path) -> Dict[str, Any]:
-        """Parse JSON content.
+    def _load_yaml_header(self, content: str | IO[bytes]) -> Any:
+        """Load YAML with the content subtree skipped.
+
+        Args:
+            content: YAML content as string, or a binary file open at its start
+
+        Returns:
+            Parsed document
+        """
+        try:
+            return _load_limited(content, self.limits, header=True)
+        except (ComposerError, ConstructorError):
+            # A skipped node was needed (an alias into content, a merge key,
+            # ...); load the whole document instead
+            if not isinstance(content, str):
+                content.seek(0)
+            return strip_content(_load_limited(content, self.limits))
+
+    def _parse_json(self, content: str, file_path: Path) -> Dict[str, Any]:
+        """Parse JSON content under the depth and time limits.
 
         Args:
             content: JSON content as string
@@ -112,21 +725,228 @@ class Parser:
             Parsed content as dictionary
 
         Raises:
-            ValidationError: If JSON is invalid
+            ValidationError: If JSON is invalid or exceeds the parse limits
         """
         try:
-            data = json.loads(content)
+            data = self._load_json(content)
             if not isinstance(data, dict):
                 raise ValidationError(
                     "JSON content must be an object",
-                    file_path=str(file_path)
+                    file_path=str(file_path),
+                    code=CODES["not_a_mapping"],
                 )
             return data
+        except ParseLimitError as e:
+            raise ValidationError(
+                f"JSON rejected: {e}", file_path=str(file_path), code=CODES[e.code_name]
+            )
         except json.JSONDecodeError as e:
             raise ValidationError(
                 f"Invalid JSON syntax at line {e.lineno}, column {e.colno}: {e.msg}",
-                file_path=str(file_path)
+                file_path=str(file_path),
+                code=CODES["invalid_json"],
+            )
+
+    def _load_json(self, content: str | bytes) -> Any:
+        """Load one JSON document, enforcing the depth and time limits.
+
+        json.loads can't be interrupted, so the time limit is checked once
+        it returns; the parsed tree is only walked for depth when
+        may_nest_deeper() doesn't already rule deep nesting out.
+
+        Raises:
+            ParseLimitError: If a limit is exceeded
+            json.JSONDecodeError: If the JSON is invalid
+        """
+        limits = self.limits
+        deadline = time.monotonic() + limits.parse_timeout if limits.parse_timeout else None
+        try:
+            data = json.loads(content)
+        except RecursionError:
+            raise ParseLimitError("Nesting is too deep to parse", "nesting_too_deep")
+        _check_deadline(deadline, limits)
+        if may_nest_deeper(content, _depth_limit(limits)[0]):
+            check_object_nesting(data, limits)
+        return data
+
+    def iter_stream(
+        self,
+        stream: IO[bytes],
+        source: str,
+        stream_format: str = "auto",
+        skip_content: bool = False,
+    ) -> Iterator[StreamDocument]:
+        """Read SCDs one at a time from a YAML ``---`` stream or NDJSON.
+
+        Documents are parsed and yielded as they are read, so memory use
+        doesn't grow with the length of the stream. Every document is
+        loaded under the parser's limits (the size and time limits apply
+        per document).
+
+        Args:
+            stream: Binary stream (a file or stdin)
+            source: Name of the stream for error locations
+            stream_format: "yaml", "ndjson", or "auto" (NDJSON for .ndjson
+                and .jsonl sources, or when the stream starts with ``{``)
+            skip_content: Reduce each document's content to its keys
+
+        Yields:
+            StreamDocument per document; empty documents are skipped
+        """
+        if stream_format == "auto":
+            stream_format = self._detect_stream_format(stream, source)
+        documents = (
+            self._iter_ndjson(stream, source)
+            if stream_format == "ndjson"
+            else self._iter_yaml_stream(stream, source)
+        )
+        for document in documents:
+            if skip_content and document.data is not None:
+                document = document._replace(data=strip_content(document.data))
+            yield document
+
+    @staticmethod
+    def _detect_stream_format(stream: IO[bytes], source: str) -> str:
+        """Guess whether a stream is NDJSON or YAML without consuming it."""
+        if source.endswith(NDJSON_SUFFIXES):
+            return "ndjson"
+        peek = getattr(stream, "peek", None)
+        head = peek(64) if peek else b""
+        return "ndjson" if head.lstrip()[:1] == b"{" else "yaml"
+
+    def _stream_error(
+        self, source: str, index: int, line: int, message: str, code_name: str
+    ) -> StreamDocument:
+        label = f"{source}:{line} (document {index})"
+        error = ValidationError(message, file_path=label, code=CODES[code_name])
+        return StreamDocument(index, line, label, None, error)
+
+    def _iter_yaml_stream(self, stream: IO[bytes], source: str) -> Iterator[StreamDocument]:
+        """Yield the documents of a ``---``-separated YAML stream."""
+        limits = self.limits
+        loader = _StreamLoader(stream)
+        loader.limits = limits
+        index = 0
+        try:
+            while True:
+                if limits.parse_timeout:
+                    loader.deadline = time.monotonic() + limits.parse_timeout
+                start_line = 0
+                try:
+                    if not loader.check_node():
+                        return
+                    start_line = loader.peek_event().start_mark.line + 1
+                    with _recursion_room(limits):
+                        node = loader.get_node()
+                except (yaml.YAMLError, RecursionError) as e:
+                    # The parser can't resynchronize after a broken document
+                    yield self._broken_stream(source, index + 1, start_line, e)
+                    return
+                line = node.start_mark.line + 1
+                try:
+                    if limits.max_file_size and (
+                        node.end_mark.index - node.start_mark.index > limits.max_file_size
+                    ):
+                        raise ParseLimitError(
+                            f"Document is more than the {limits.max_file_size} byte limit",
+                            "file_too_large",
+                        )
+                    if loader.has_anchors:
+                        check_node_limits(node, limits, loader.deadline)
+                    data = loader.construct_document(node)
+                except ParseLimitError as e:
+                    index += 1
+                    yield self._stream_error(
+                        source, index, line, f"YAML rejected: {e}", e.code_name
+                    )
+                    continue
+                except yaml.YAMLError as e:
+                    index += 1
+                    yield self._stream_error(
+                        source, index, line, f"Invalid YAML: {e}", "invalid_yaml"
+                    )
+                    continue
+                if data is None:
+                    continue
+                index += 1
+                if not isinstance(data, dict):
+                    yield self._stream_error(
+                        source, index, line,
+                        "YAML content must be an object/dictionary", "not_a_mapping",
+                    )
+                    continue
+                yield StreamDocument(index, line, f"{source}:{line} (document {index})", data, None)
+        finally:
+            loader.dispose()
+
+    def _broken_stream(
+        self, source: str, index: int, start_line: int, error: BaseException
+    ) -> StreamDocument:
+        """Report the document a YAML stream broke off at."""
+        mark = getattr(error, "problem_mark", None)
+        line = mark.line + 1 if mark is not None else start_line
+        if isinstance(error, ParseLimitError):
+            message, code_name = f"YAML rejected: {error}", error.code_name
+        elif isinstance(error, RecursionError):
+            message, code_name = "YAML rejected: Nesting is too deep to parse", "nesting_too_deep"
+        elif mark is not None:
+            message = (
+                f"Invalid YAML syntax at line {line}, column {mark.column + 1}: {error.problem}"
             )
+            code_name = "invalid_yaml"
+        else:
+            message, code_name = f"Invalid YAML syntax: {error}", "invalid_yaml"
+        return self._stream_error(
+            source, index, line, f"{message} (rest of the stream not read)", code_name
+        )
+
+    def _iter_ndjson(self, stream: IO[bytes], source: str) -> Iterator[StreamDocument]:
+        """Yield the documents of an NDJSON stream (one JSON object per line)."""
+        max_size = self.limits.max_file_size
+        index = line_number = 0
+        while True:
+            raw = stream.readline(max_size + 1) if max_size else stream.readline()
+            if not raw:
+                return
+            line_number += 1
+            if max_size and len(raw) > max_size and not raw.endswith(b"\n"):
+                # Skip the rest of the oversized line without holding it
+                while raw and not raw.endswith(b"\n"):
+                    raw = stream.readline(max_size)
+                index += 1
+                yield self._stream_error(
+                    source, index, line_number,
+                    f"Document is more than the {max_size} byte limit", "file_too_large",
+                )
+                continue
+            if not raw.strip():
+                continue
+            index += 1
+            try:
+                data = self._load_json(raw)
+            except ParseLimitError as e:
+                yield self._stream_error(
+                    source, index, line_number, f"JSON rejected: {e}", e.code_name
+                )
+                continue
+            except json.JSONDecodeError as e:
+                yield self._stream_error(
+                    source, index, line_number,
+                    f"Invalid JSON syntax at column {e.colno}: {e.msg}", "invalid_json",
+                )
+                continue
+            except UnicodeDecodeError as e:
+                yield self._stream_error(
+                    source, index, line_number, f"Failed to load document: {e}", "load_failed"
+                )
+                continue
+            if not isinstance(data, dict):
+                yield self._stream_error(
+                    source, index, line_number, "JSON content must be an object", "not_a_mapping"
+                )
+                continue
+            label = f"{source}:{line_number} (document {index})"
+            yield StreamDocument(index, line_number, label, data, None)
 
     @staticmethod
     def load_schema(schema_path: Path) -> Dict[str, Any]:
@@ -157,3 +977,25 @@ class Parser:
                 f"Failed to load schema: {e}",
                 file_path=str(schema_path)
             )
+
+
+class HeaderParser(Parser):
+    """Parser that loads SCDs without their content (``--skip-content``).
+
+    Only ``load_scd`` differs; bundles are loaded in full.
+    """
+
+    def load_scd(self, file_path: Path, skip_content: bool = True) -> Dict[str, Any]:
+        """Load an SCD file with its content reduced to keys.
+
+        Args:
+            file_path: Path to the SCD file
+            skip_content: Load content as its keys only (default True)
+
+        Returns:
+            Parsed SCD as dictionary
+
+        Raises:
+            ValidationError: If file cannot be loaded or parsed
+        """
+        return Parser.load_scd(self, file_path, skip_content)
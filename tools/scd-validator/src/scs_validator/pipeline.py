@@ -0,0 +1,273 @@
+"""Pipeline module for validating many SCD files, optionally in parallel."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from .model import SCDRecord
+from .parser import Parser, StreamDocument
+from .schema_validator import SchemaValidator
+from .semantic_validator import SemanticValidator
+from .utils import ValidationError, ValidationResult
+
+# Number of files handed to a worker process per task
+CHUNK_SIZE = 16
+
+
+class FileOutcome(NamedTuple):
+    """Result of running syntax, schema and semantic checks on one file.
+
+    For a document read from a stream, ``file_path`` is its stream label.
+    """
+
+    file_path: Path | str
+    syntax_error: ValidationError | None
+    schema: ValidationResult | None
+    semantic: ValidationResult | None
+    scd_id: str | None = None
+
+
+def check_file(
+    file_path: Path,
+    parser: Parser,
+    schema_validator: SchemaValidator,
+    semantic_validator: SemanticValidator,
+) -> FileOutcome:
+    """Run Levels 1-3 on a single SCD file.
+
+    Args:
+        file_path: Path to the SCD file
+        parser: Parser instance
+        schema_validator: Schema validator instance
+        semantic_validator: Semantic validator instance
+
+    Returns:
+        FileOutcome for the file
+    """
+    return next(check_files([file_path], parser, schema_validator, semantic_validator))
+
+
+def check_files(
+    file_paths: Iterable[Path],
+    parser: Parser,
+    schema_validator: SchemaValidator | None,
+    semantic_validator: SemanticValidator,
+    on_submit: Callable[[Path], None] | None = None,
+) -> Iterator[FileOutcome]:
+    """Run Levels 1-3 on a sequence of SCD files.
+
+    Args:
+        file_paths: Paths to validate (any iterable, including generators)
+        parser: Parser instance
+        schema_validator: Schema validator instance, or None to skip Level 2
+        semantic_validator: Semantic validator instance
+        on_submit: Optional callback invoked as each path is picked up
+
+    Yields:
+        FileOutcome per path, in the order the paths were supplied
+    """
+
+    def parsed() -> Iterator[Tuple[Path, Dict[str, Any] | ValidationError]]:
+        for file_path in file_paths:
+            if on_submit:
+                on_submit(file_path)
+            try:
+                yield file_path, parser.load_scd(file_path)
+            except ValidationError as e:
+                yield file_path, e
+
+    return check_documents(parsed(), schema_validator, semantic_validator)
+
+
+def check_documents(
+    documents: Iterable[Tuple[Path | str, Dict[str, Any] | ValidationError]],
+    schema_validator: SchemaValidator | None,
+    semantic_validator: SemanticValidator,
+) -> Iterator[FileOutcome]:
+    """Run Levels 2-3 on parsed documents (Level 1 outcomes pass through).
+
+    Parsed documents are streamed through SchemaValidator.validate_many, so
+    each tier's schema is compiled once for the whole sequence. Without a
+    schema validator (``--skip-content``) Level 2 is skipped.
+
+    Args:
+        documents: (file path or label, parsed document or the syntax error
+            it failed with) pairs, consumed lazily
+        schema_validator: Schema validator instance, or None to skip Level 2
+        semantic_validator: Semantic validator instance
+
+    Yields:
+        FileOutcome per document, in input order
+    """
+    # Outcomes for documents that failed to parse, and parsed documents, in
+    # input order; validate_many pulls one document at a time, so this
+    # never holds more than the documents read ahead of the current one
+    pending: Deque[FileOutcome | Tuple[Path | str, Dict[str, Any]]] = deque()
+
+    def parsed_only() -> Iterator[Tuple[Dict[str, Any], str]]:
+        for file_path, scd in documents:
+            if isinstance(scd, ValidationError):
+                pending.append(FileOutcome(file_path, scd, None, None))
+                continue
+            pending.append((file_path, scd))
+            yield scd, str(file_path)
+
+    if schema_validator is not None:
+        schema_results: Iterator[ValidationResult | None] = schema_validator.validate_many(
+            parsed_only()
+        )
+    else:
+        schema_results = (None for _ in parsed_only())
+
+    for schema in schema_results:
+        while isinstance(pending[0], FileOutcome):
+            yield pending.popleft()
+        file_path, scd = pending.popleft()
+        record = SCDRecord.from_dict(scd)
+        semantic = semantic_validator.validate_scd(record, str(file_path))
+        yield FileOutcome(file_path, None, schema, semantic, record.id)
+
+    # Documents after the last parsed one that failed to parse
+    while pending:
+        yield pending.popleft()
+
+
+# Validators owned by a worker process (set once by _init_worker)
+_worker_validators: tuple = ()
+
+
+def _init_worker(
+    parser: Parser,
+    schema_validator: SchemaValidator | None,
+    semantic_validator: SemanticValidator,
+) -> None:
+    """Install the validators used by this worker process."""
+    global _worker_validators
+    _worker_validators = (parser, schema_validator, semantic_validator)
+
+
+def _check_files_in_worker(file_paths: List[Path]) -> List[FileOutcome]:
+    """Run check_files on a chunk of paths with the worker's validators."""
+    return list(check_files(file_paths, *_worker_validators))
+
+
+def _check_documents_in_worker(
+    documents: List[Tuple[str, Dict[str, Any] | ValidationError]]
+) -> List[FileOutcome]:
+    """Run check_documents on a chunk of parsed documents with the worker's validators."""
+    return list(check_documents(documents, *_worker_validators[1:]))
+
+
+def _iter_in_pool(
+    items: Iterable,
+    task: Callable[[List], List[FileOutcome]],
+    jobs: int,
+    initargs: tuple,
+    on_submit: Callable[[Any], None] | None = None,
+) -> Iterator[FileOutcome]:
+    """Run a worker task over chunks of items, yielding outcomes in input order.
+
+    At most a few chunks per worker are in flight, so memory stays bounded
+    for arbitrarily long inputs.
+    """
+    max_in_flight = jobs * 4
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=initargs,
+    ) as executor:
+        remaining = iter(items)
+        while True:
+            chunk = list(islice(remaining, CHUNK_SIZE))
+            if not chunk:
+                break
+            if on_submit:
+                for item in chunk:
+                    on_submit(item)
+            pending.append(executor.submit(task, chunk))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_file_outcomes(
+    file_paths: Iterable[Path],
+    parser: Parser,
+    schema_validator: SchemaValidator | None,
+    semantic_validator: SemanticValidator,
+    jobs: int = 1,
+    on_submit: Callable[[Path], None] | None = None,
+) -> Iterator[FileOutcome]:
+    """Validate files and yield outcomes in input order.
+
+    ``file_paths`` is consumed lazily, so a discovery generator keeps walking
+    while earlier files are being validated. With ``jobs > 1`` files are
+    checked in a process pool in chunks of ``CHUNK_SIZE``.
+
+    Args:
+        file_paths: Paths to validate (any iterable, including generators)
+        parser: Parser instance
+        schema_validator: Schema validator instance, or None to skip Level 2
+        semantic_validator: Semantic validator instance
+        jobs: Number of worker processes (1 = validate in this process)
+        on_submit: Optional callback invoked as each path is picked up
+
+    Yields:
+        FileOutcome per path, in the order the paths were supplied
+    """
+    if jobs <= 1:
+        yield from check_files(
+            file_paths, parser, schema_validator, semantic_validator, on_submit
+        )
+        return
+
+    yield from _iter_in_pool(
+        file_paths,
+        _check_files_in_worker,
+        jobs,
+        (parser, schema_validator, semantic_validator),
+        on_submit,
+    )
+
+
+def iter_stream_outcomes(
+    documents: Iterable[StreamDocument],
+    parser: Parser,
+    schema_validator: SchemaValidator | None,
+    semantic_validator: SemanticValidator,
+    jobs: int = 1,
+) -> Iterator[FileOutcome]:
+    """Validate documents read from a stream and yield outcomes in input order.
+
+    Reading the stream is sequential and happens in this process; with
+    ``jobs > 1`` the parsed documents are checked in a process pool in
+    chunks of ``CHUNK_SIZE``.
+
+    Args:
+        documents: Documents from Parser.iter_stream (consumed lazily)
+        parser: Parser instance (for the worker processes)
+        schema_validator: Schema validator instance, or None to skip Level 2
+        semantic_validator: Semantic validator instance
+        jobs: Number of worker processes (1 = validate in this process)
+
+    Yields:
+        FileOutcome per document, labelled ``<source>:<line> (document <n>)``
+    """
+    pairs = (
+        (document.label, document.error if document.error is not None else document.data)
+        for document in documents
+    )
+    if jobs <= 1:
+        yield from check_documents(pairs, schema_validator, semantic_validator)
+        return
+
+    yield from _iter_in_pool(
+        pairs,
+        _check_documents_in_worker,
+        jobs,
+        (parser, schema_validator, semantic_validator),
+    )
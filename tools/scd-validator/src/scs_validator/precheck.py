@@ -0,0 +1,139 @@
+"""Structural pre-check used by fast schema validation."""
+
+import re
+import zlib
+from typing import Any, Dict, List, Set, Tuple
+
+# Python types accepted for each JSON Schema type name
+_JSON_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "object": (dict,),
+    "array": (list,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+    "null": (type(None),),
+}
+
+# Keywords that do not constrain a document (or are covered by the pre-check);
+# additionalProperties is only covered as a boolean
+_TOP_LEVEL_KEYWORDS = {
+    "$schema", "$id", "title", "description", "type", "required",
+    "properties", "additionalProperties", "examples",
+}
+
+
+class StructuralPrecheck:
+    """Checks the top-level structure of an SCD against a tier schema.
+
+    The pre-check is compiled from the schema itself and covers the document's
+    required fields, ``additionalProperties: false`` (no unknown top-level
+    keys) and each top-level property's ``type``, ``pattern``, ``const``,
+    ``minLength`` and ``required`` keywords. Nested keywords (for
+    example ``content`` item schemas) are not checked, so documents that pass
+    are only sampled for a full validation.
+    """
+
+    def __init__(self, schema: Dict[str, Any], sample_rate: int = 20):
+        """Compile a pre-check from a tier schema.
+
+        Args:
+            schema: Tier schema as dictionary
+            sample_rate: Fully validate one in this many documents that pass
+                the pre-check (1 = every document)
+        """
+        self.sample_rate = max(1, sample_rate)
+        # A schema using keywords the pre-check doesn't understand at the top
+        # level can't be approximated; always defer to the full validator
+        additional = schema.get("additionalProperties", True)
+        self.supported = (
+            set(schema) <= _TOP_LEVEL_KEYWORDS
+            and schema.get("type", "object") == "object"
+            and isinstance(additional, bool)
+        )
+        self.required: List[str] = list(schema.get("required", []))
+        # Top-level keys a document may have, None if any key is allowed
+        self.allowed: Set[str] | None = (
+            None if additional else set(schema.get("properties", {}))
+        )
+        self.checks: List[Tuple[str, Dict[str, Any]]] = [
+            (name, self._compile_property(spec))
+            for name, spec in schema.get("properties", {}).items()
+        ]
+
+    @staticmethod
+    def _compile_property(spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the keywords the pre-check evaluates for one property."""
+        check: Dict[str, Any] = {}
+        json_type = spec.get("type")
+        if isinstance(json_type, str) and json_type in _JSON_TYPES:
+            check["types"] = _JSON_TYPES[json_type]
+            # bool is an int subclass but not a JSON integer/number
+            check["reject_bool"] = json_type in ("integer", "number")
+        if "pattern" in spec:
+            check["pattern"] = re.compile(spec["pattern"])
+        if "const" in spec:
+            check["const"] = spec["const"]
+        if "minLength" in spec:
+            check["min_length"] = spec["minLength"]
+        if "required" in spec:
+            check["required"] = list(spec["required"])
+        return check
+
+    def passes(self, scd: Dict[str, Any]) -> bool:
+        """Check whether a document passes the structural pre-check.
+
+        Args:
+            scd: SCD data as dictionary
+
+        Returns:
+            True if no top-level constraint is violated
+        """
+        if not self.supported or not isinstance(scd, dict):
+            return False
+
+        for field in self.required:
+            if field not in scd:
+                return False
+
+        if self.allowed is not None and not self.allowed.issuperset(scd):
+            return False
+
+        for name, check in self.checks:
+            if name not in scd:
+                continue
+            value = scd[name]
+            types = check.get("types")
+            if types is not None:
+                if not isinstance(value, types):
+                    return False
+                if check["reject_bool"] and isinstance(value, bool):
+                    return False
+            if "const" in check and value != check["const"]:
+                return False
+            if isinstance(value, str):
+                pattern = check.get("pattern")
+                if pattern is not None and not pattern.search(value):
+                    return False
+                if len(value) < check.get("min_length", 0):
+                    return False
+            required = check.get("required")
+            if required and isinstance(value, dict):
+                for field in required:
+                    if field not in value:
+                        return False
+        return True
+
+    def sampled(self, scd_id: str) -> bool:
+        """Decide whether a passing document is picked for a full validation.
+
+        The choice depends only on the SCD ID, so the same documents are
+        sampled on every run, in any order and with any number of workers.
+
+        Args:
+            scd_id: SCD ID
+
+        Returns:
+            True if the document should be fully validated
+        """
+        return zlib.crc32(scd_id.encode("utf-8")) % self.sample_rate == 0
@@ -1,7 +1,9 @@
 """Relationship validation module for Level 4 validation."""
 
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Container, Dict, List, Sequence, Set
 
+from .codes import CODES
+from .model import Relationship, SCDRecord, as_record, as_records
 from .rules_loader import RelationshipTypeValidator, RulesLoader
 from .utils import ValidationError, ValidationResult, ValidationWarning, get_tier_from_id
 
@@ -21,9 +23,11 @@ class RelationshipValidator:
 
     def validate_relationships(
         self,
-        scds: List[Dict[str, Any]],
+        scds: Sequence[SCDRecord | Dict[str, Any]],
         bundle_type: str = "project",
         file_path: str | None = None,
+        resolve_target: Callable[[str], SCDRecord | Dict[str, Any] | None] | None = None,
+        workspace_ids: Container[str] | None = None,
     ) -> ValidationResult:
         """Validate relationships in a collection of SCDs.
 
@@ -34,62 +38,82 @@ class RelationshipValidator:
         - Circular dependency detection (for depends-on)
 
         Args:
-            scds: List of SCD dictionaries
+            scds: SCD records (raw SCD dictionaries are converted)
             bundle_type: Type of bundle being validated
             file_path: Optional file path for error messages
+            resolve_target: Optional callback that loads an SCD by ID when a
+                relationship targets an SCD not in ``scds``. Resolved SCDs
+                count as existing targets but their own relationships are not
+                validated.
+            workspace_ids: Optional set of every SCD ID in the workspace (e.g. a
+                WorkspaceIndex). For non-project bundles, a target outside the
+                bundle that is found there passes without a warning; one found
+                nowhere is warned about as not in the workspace.
 
         Returns:
             ValidationResult with errors and warnings
         """
         result = ValidationResult("relationships")
+        records = as_records(scds)
 
         # Build SCD lookup
-        scd_lookup = {scd.get("id"): scd for scd in scds if scd.get("id")}
+        # First declaration wins; duplicate IDs are reported by DuplicateIdDetector
+        scd_lookup: Dict[str, SCDRecord] = {}
+        for record in records:
+            if record.id:
+                scd_lookup.setdefault(record.id, record)
 
         # Track validation mode (standalone vs complete)
         is_complete_project = bundle_type == "project"
 
         # Validate each SCD's relationships
-        for scd in scds:
-            scd_id = scd.get("id")
-            if not scd_id:
+        for record in records:
+            if not record.id:
                 continue
 
-            relationships = scd.get("relationships", [])
-            if not relationships:
-                continue
-
-            for rel in relationships:
+            for rel in record.relationships:
                 self._validate_relationship(
-                    scd_id, rel, scd_lookup, is_complete_project, result, file_path
+                    record,
+                    rel,
+                    scd_lookup,
+                    is_complete_project,
+                    result,
+                    file_path,
+                    resolve_target,
+                    workspace_ids,
                 )
 
         # Detect circular dependencies
-        self._detect_circular_dependencies(scds, result, file_path)
+        self._detect_circular_dependencies(records, result, file_path)
 
         return result
 
     def _validate_relationship(
         self,
-        source_id: str,
-        relationship: Dict[str, Any],
-        scd_lookup: Dict[str, Dict[str, Any]],
+        source: SCDRecord,
+        relationship: Relationship,
+        scd_lookup: Dict[str, SCDRecord],
         is_complete_project: bool,
         result: ValidationResult,
         file_path: str | None,
+        resolve_target: Callable[[str], SCDRecord | Dict[str, Any] | None] | None = None,
+        workspace_ids: Container[str] | None = None,
     ) -> None:
         """Validate a single relationship.
 
         Args:
-            source_id: Source SCD ID
-            relationship: Relationship dictionary
+            source: Source SCD record
+            relationship: Relationship entry
             scd_lookup: Lookup of all SCDs by ID
             is_complete_project: Whether this is a complete project bundle
             result: Validation result to update
             file_path: Optional file path
+            resolve_target: Optional callback to load a missing target on demand
+            workspace_ids: Optional set of every SCD ID in the workspace
         """
-        rel_type = relationship.get("type")
-        target_id = relationship.get("target")
+        source_id = source.id
+        rel_type = relationship.type
+        target_id = relationship.target
 
         if not rel_type:
             result.add_error(
@@ -97,6 +121,8 @@ class RelationshipValidator:
                     f"Relationship missing 'type' field in SCD '{source_id}'",
                     scd_id=source_id,
                     file_path=file_path,
+                    code=CODES["missing_relationship_type"],
+                    location=target_id,
                 )
             )
             return
@@ -107,6 +133,8 @@ class RelationshipValidator:
                     f"Relationship missing 'target' field in SCD '{source_id}'",
                     scd_id=source_id,
                     file_path=file_path,
+                    code=CODES["missing_relationship_target"],
+                    location=rel_type,
                 )
             )
             return
@@ -122,7 +150,13 @@ class RelationshipValidator:
                 ),
             )
             result.add_error(
-                ValidationError(error_msg, scd_id=source_id, file_path=file_path)
+                ValidationError(
+                    error_msg,
+                    scd_id=source_id,
+                    file_path=file_path,
+                    code=CODES["invalid_type"],
+                    location=f"{rel_type}:{target_id}",
+                )
             )
             return
 
@@ -132,13 +166,29 @@ class RelationshipValidator:
                 self.rules, "self_reference", scd_id=source_id, type=rel_type
             )
             result.add_error(
-                ValidationError(error_msg, scd_id=source_id, file_path=file_path)
+                ValidationError(
+                    error_msg,
+                    scd_id=source_id,
+                    file_path=file_path,
+                    code=CODES["self_reference"],
+                    location=rel_type,
+                )
             )
             return
 
-        # Validate target exists
-        target_exists = target_id in scd_lookup
-        if not target_exists:
+        # Validate target exists, loading it on demand if a resolver is given
+        if target_id not in scd_lookup and resolve_target is not None:
+            resolved = resolve_target(target_id)
+            if resolved is not None:
+                scd_lookup[target_id] = as_record(resolved)
+        target = scd_lookup.get(target_id)
+        target_in_workspace = (
+            target is None
+            and not is_complete_project
+            and workspace_ids is not None
+            and target_id in workspace_ids
+        )
+        if target is None and not target_in_workspace:
             # Different severity based on bundle type
             if is_complete_project:
                 error_msg = self.rules_loader.get_error_message(
@@ -149,21 +199,45 @@ class RelationshipValidator:
                     type=rel_type,
                 )
                 result.add_error(
-                    ValidationError(error_msg, scd_id=source_id, file_path=file_path)
+                    ValidationError(
+                        error_msg,
+                        scd_id=source_id,
+                        file_path=file_path,
+                        code=CODES["target_not_found"],
+                        location=f"{rel_type}:{target_id}",
+                    )
+                )
+            elif workspace_ids is not None:
+                # Standalone bundle, and no file in the workspace declares it
+                result.add_warning(
+                    ValidationWarning(
+                        f"Relationship target '{target_id}' not found in this bundle "
+                        f"or anywhere in the workspace",
+                        level="relationships",
+                        scd_id=source_id,
+                        file_path=file_path,
+                        code=CODES["target_not_in_workspace"],
+                        location=f"{rel_type}:{target_id}",
+                    )
                 )
             else:
                 # Warning for standalone domain bundles
                 warning_msg = f"Relationship target '{target_id}' not found in this bundle. May exist in another bundle."
                 result.add_warning(
                     ValidationWarning(
-                        warning_msg, level="relationships", scd_id=source_id, file_path=file_path
+                        warning_msg,
+                        level="relationships",
+                        scd_id=source_id,
+                        file_path=file_path,
+                        code=CODES["target_not_in_bundle"],
+                        location=f"{rel_type}:{target_id}",
                     )
                 )
             return
 
         # Validate tier constraints
-        source_tier = get_tier_from_id(source_id)
-        target_tier = get_tier_from_id(target_id)
+        source_tier = source.tier
+        target_tier = target.tier if target is not None else get_tier_from_id(target_id)
 
         if source_tier and target_tier:
             if not self.type_validator.is_valid_tier_combination(
@@ -179,19 +253,25 @@ class RelationshipValidator:
                     allowed=", ".join(allowed),
                 )
                 result.add_error(
-                    ValidationError(error_msg, scd_id=source_id, file_path=file_path)
+                    ValidationError(
+                        error_msg,
+                        scd_id=source_id,
+                        file_path=file_path,
+                        code=CODES["tier_constraint_violation"],
+                        location=f"{rel_type}:{target_id}",
+                    )
                 )
 
     def _detect_circular_dependencies(
         self,
-        scds: List[Dict[str, Any]],
+        records: List[SCDRecord],
         result: ValidationResult,
         file_path: str | None,
     ) -> None:
         """Detect circular dependencies in depends-on relationships.
 
         Args:
-            scds: List of SCD dictionaries
+            records: List of SCD records
             result: Validation result to update
             file_path: Optional file path
         """
@@ -201,21 +281,17 @@ class RelationshipValidator:
 
         # Build dependency graph for depends-on relationships
         graph: Dict[str, List[str]] = {}
-        for scd in scds:
-            scd_id = scd.get("id")
-            if not scd_id:
+        for record in records:
+            if not record.id:
                 continue
 
-            dependencies = []
-            relationships = scd.get("relationships", [])
-            for rel in relationships:
-                if rel.get("type") == "depends-on":
-                    target = rel.get("target")
-                    if target:
-                        dependencies.append(target)
-
+            dependencies = [
+                rel.target
+                for rel in record.relationships
+                if rel.type == "depends-on" and rel.target
+            ]
             if dependencies:
-                graph[scd_id] = dependencies
+                graph[record.id] = dependencies
 
         # Detect cycles using DFS
         visited: Set[str] = set()
@@ -244,7 +320,11 @@ class RelationshipValidator:
                     )
                     result.add_warning(
                         ValidationWarning(
-                            error_msg, level="relationships", file_path=file_path
+                            error_msg,
+                            level="relationships",
+                            file_path=file_path,
+                            code=CODES["circular_dependency"],
+                            location=cycle_str,
                         )
                     )
                     return True
@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 
 from colorama import Fore, Style, init
 
+from .findings import FindingsStore
 from .utils import ValidationResult
 
 # Initialize colorama for cross-platform colored output
@@ -14,13 +15,15 @@ init(autoreset=True)
 class Reporter:
     """Formats and outputs validation results."""
 
-    def __init__(self, use_color: bool = True):
+    def __init__(self, use_color: bool = True, top_n: int = 10):
         """Initialize reporter.
 
         Args:
             use_color: Whether to use colored output
+            top_n: Number of top offenders (files/SCDs) to list in reports
         """
         self.use_color = use_color
+        self.top_n = top_n
 
     def report_text(
         self,
@@ -39,14 +42,13 @@ class Reporter:
             Formatted text report
         """
         lines = []
+        store = FindingsStore.from_results(results)
 
         # Header
         lines.append(f"SCS Validator v{validator_version}")
         lines.append("")
 
         # Summary of each validation level
-        total_errors = 0
-        total_warnings = 0
         all_passed = True
 
         for result in results:
@@ -65,34 +67,43 @@ class Reporter:
 
             lines.append(line)
 
-            total_errors += result.error_count
-            total_warnings += result.warning_count
-
             if not result.passed:
                 all_passed = False
 
         lines.append("")
 
+        total_errors = store.count("error")
+        total_warnings = store.count("warning")
+
         # Errors section
         if total_errors > 0:
             lines.append(self._colored("Errors:", Fore.RED))
-            for result in results:
-                for error in result.errors:
-                    lines.append(f"  {self._x_mark()} {error.format_message()}")
+            for finding in store.iter_findings(store.select(severity="error")):
+                lines.append(f"  {self._x_mark()} {finding.format_message()}")
             lines.append("")
 
         # Warnings section
         if total_warnings > 0:
             lines.append(self._colored("Warnings:", Fore.YELLOW))
-            for result in results:
-                for warning in result.warnings:
-                    lines.append(f"  {self._warning_mark()} {str(warning)}")
+            for finding in store.iter_findings(store.select(severity="warning")):
+                lines.append(f"  {self._warning_mark()} {finding.format_message()}")
+            lines.append("")
+
+        # Top offenders (only useful once findings span more than a handful of files)
+        top_files = store.top("file", self.top_n)
+        if len(store) > self.top_n and len(top_files) > 1:
+            lines.append("Most findings by file:")
+            for file_path, count in top_files:
+                lines.append(f"  {count:>6}  {file_path}")
             lines.append("")
 
         # Summary
         lines.append("Summary:")
         lines.append(f"  {total_errors} errors")
         lines.append(f"  {total_warnings} warnings")
+        suppressed = sum(r.details.get("baseline_suppressed", 0) for r in results)
+        if suppressed:
+            lines.append(f"  {suppressed} known findings suppressed (baseline)")
         lines.append("")
 
         # Final status
@@ -124,8 +135,9 @@ class Reporter:
         Returns:
             JSON formatted report
         """
-        total_errors = sum(r.error_count for r in results)
-        total_warnings = sum(r.warning_count for r in results)
+        store = FindingsStore.from_results(results)
+        total_errors = store.count("error")
+        total_warnings = store.count("warning")
         all_passed = all(r.passed for r in results)
 
         # Determine overall status
@@ -146,6 +158,16 @@ class Reporter:
                 "total_errors": total_errors,
                 "total_warnings": total_warnings,
                 "status": status,
+                "by_level": store.count_by("level"),
+                "by_code": store.count_by("code"),
+                "top_files": [
+                    {"file_path": file_path, "count": count}
+                    for file_path, count in store.top("file", self.top_n)
+                ],
+                "top_scds": [
+                    {"scd_id": scd_id, "count": count}
+                    for scd_id, count in store.top("scd", self.top_n)
+                ],
             },
         }
 
@@ -159,25 +181,17 @@ class Reporter:
             level_data.update(result.details)
             report["validation_levels"][result.level_name] = level_data
 
-            # Add errors
-            for error in result.errors:
-                report["errors"].append(
-                    {
-                        "level": result.level_name,
-                        "message": error.message,
-                        "scd_id": error.scd_id,
-                        "file_path": error.file_path,
-                    }
-                )
-
-            # Add warnings
-            for warning in result.warnings:
-                report["warnings"].append(
+        # Add errors and warnings
+        for severity, key in (("error", "errors"), ("warning", "warnings")):
+            for finding in store.iter_findings(store.select(severity=severity)):
+                report[key].append(
                     {
-                        "level": warning.level,
-                        "message": warning.message,
-                        "scd_id": warning.scd_id,
-                        "file_path": warning.file_path,
+                        "level": finding.level,
+                        "message": finding.message,
+                        "scd_id": finding.scd_id,
+                        "file_path": finding.file_path,
+                        "code": finding.code,
+                        "fingerprint": finding.fingerprint,
                     }
                 )
 
@@ -0,0 +1,384 @@
+"""Indexes of SCD files by ID, for resolving references without per-file probes."""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import yaml
+
+from .discovery import discover_scd_files
+from .parser import Parser
+from .utils import ValidationError
+
+# Files read while indexing are loaded under the default parse limits
+_PARSER = Parser()
+
+# Bytes read from the start of each file when looking for its ID
+HEADER_BYTES = 8192
+
+# Top-level ``id:`` key of a YAML document (top-level keys start in column 0)
+_YAML_ID = re.compile(
+    rb"""^id:[ \t]*(?:"([^"\\\r\n]*)"|'([^'\r\n]*)'|([^\s#'"][^\s#]*))[ \t]*(?:\#[^\r\n]*)?\r?$""",
+    re.MULTILINE,
+)
+
+# ``"id": "..."`` member of a JSON object
+_JSON_ID = re.compile(rb'"id"\s*:\s*"([^"\\]*)"')
+
+
+def read_header_id(file_path: Path) -> str | None:
+    """Read an SCD's ID from the start of its file without parsing it.
+
+    For YAML the ID must be a top-level ``id:`` line; for JSON the ``"id"``
+    member must belong to the outermost object. If the header doesn't settle
+    the question (ID further down, unusual formatting), the whole file is
+    parsed instead.
+
+    Args:
+        file_path: Path to a YAML or JSON file
+
+    Returns:
+        The file's ``id`` value, or None if it has none or can't be read
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = f.read(HEADER_BYTES)
+    except OSError:
+        return None
+    if len(header) == HEADER_BYTES:
+        # Don't match a line cut off at the end of the header
+        header = header[: header.rfind(b"\n") + 1]
+
+    if file_path.suffix == ".json":
+        match = _JSON_ID.search(header)
+        # Only trust a match that isn't inside a nested object or array
+        start = match.start() if match else 0
+        if match and header.count(b"{", 0, start) == 1 and b"[" not in header[:start]:
+            return match.group(1).decode("utf-8", "replace")
+    else:
+        match = _YAML_ID.search(header)
+        if match:
+            value = next(group for group in match.groups() if group is not None)
+            return value.decode("utf-8", "replace")
+
+    try:
+        data = _PARSER.load_scd(file_path, skip_content=True)
+    except ValidationError:
+        return None
+    scd_id = data.get("id")
+    return scd_id if isinstance(scd_id, str) else None
+
+
+def skip_non_scds(file_paths: Iterable[Path]) -> Iterator[Path]:
+    """Drop files that declare a non-SCD ID (bundles, domain manifests, ...).
+
+    Files without a readable ID are kept, so a broken SCD is still reported.
+
+    Args:
+        file_paths: Candidate files, e.g. from discover_scd_files
+
+    Yields:
+        Files that may be SCDs
+    """
+    for file_path in file_paths:
+        declared_id = read_header_id(file_path)
+        if declared_id is None or declared_id.startswith("scd:"):
+            yield file_path
+
+
+class SCDIndex:
+    """Maps SCD IDs to the files that define them.
+
+    The index is built from a single ``os.scandir`` walk over the search
+    roots and answers every lookup from memory, so resolving a bundle's SCD
+    references costs no per-reference filesystem probes.
+    """
+
+    def __init__(self, paths: Dict[str, Path] | None = None):
+        """Initialize an index.
+
+        Args:
+            paths: Optional initial mapping of SCD ID to file path
+        """
+        self.paths: Dict[str, Path] = dict(paths or {})
+
+    @classmethod
+    def build(cls, roots: Iterable[Path], use_ignore_files: bool = True) -> "SCDIndex":
+        """Walk search roots and index every SCD found.
+
+        Files are read in sorted order; if two files declare the same ID the
+        first one wins.
+
+        Args:
+            roots: Directories to search (recursively)
+            use_ignore_files: Honour .gitignore/.scsignore files in the roots
+
+        Returns:
+            Populated index
+        """
+        index = cls()
+        for scd_id, file_path in iter_scd_ids(roots, use_ignore_files):
+            index.paths.setdefault(scd_id, file_path)
+        return index
+
+    def get(self, scd_id: str) -> Path | None:
+        """Look up the file defining an SCD.
+
+        Args:
+            scd_id: SCD ID
+
+        Returns:
+            Path of the SCD file, or None if it isn't indexed
+        """
+        return self.paths.get(scd_id)
+
+    def __contains__(self, scd_id: object) -> bool:
+        return scd_id in self.paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def iter_scd_ids(
+    roots: Iterable[Path], use_ignore_files: bool = True
+) -> Iterator[Tuple[str, Path]]:
+    """Yield (SCD ID, path) for every SCD file under the search roots.
+
+    Files whose ID isn't an ``scd:`` ID (bundles, rules files, ...) are
+    skipped.
+
+    Args:
+        roots: Directories to search (recursively)
+        use_ignore_files: Honour .gitignore/.scsignore files in the roots
+
+    Yields:
+        (SCD ID, file path) pairs in walk order
+    """
+    for root in roots:
+        for file_path in discover_scd_files(
+            Path(root), recursive=True, use_ignore_files=use_ignore_files
+        ):
+            scd_id = read_header_id(file_path)
+            if scd_id and scd_id.startswith("scd:"):
+                yield scd_id, file_path
+
+
+# Where the workspace index is kept inside an SCS project
+WORKSPACE_INDEX_FILE = Path(".scs") / "scd-index.json"
+
+# Project configuration file that may list external standards directories
+CONFIG_FILE = Path(".scs") / "config"
+
+# Bumped whenever the on-disk layout of the workspace index changes
+_INDEX_FORMAT = 1
+
+
+def find_workspace_root(start: Path) -> Path | None:
+    """Find the SCS project containing a path.
+
+    Args:
+        start: File or directory inside the project
+
+    Returns:
+        Nearest directory (``start`` or an ancestor) that has a ``.scs/``
+        directory, or None if there is none
+    """
+    start = start.resolve()
+    for directory in (start, *start.parents):
+        if (directory / ".scs").is_dir():
+            return directory
+    return None
+
+
+def configured_standards_dirs(config_file: Path = CONFIG_FILE) -> List[Path]:
+    """Read the ``standards_dirs`` list from the project configuration.
+
+    Args:
+        config_file: Project configuration file (YAML)
+
+    Returns:
+        Configured directories (relative paths are relative to the config's
+        project), or an empty list if none are configured
+    """
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError):
+        return []
+    if not isinstance(config, dict):
+        return []
+    dirs = config.get("standards_dirs") or []
+    if isinstance(dirs, str):
+        dirs = [dirs]
+    project_dir = config_file.parent.parent
+    return [project_dir / d for d in dirs if isinstance(d, str)]
+
+
+class WorkspaceIndex:
+    """Persistent index of every SCD and bundle in a workspace.
+
+    Each file under the roots is remembered with its mtime and size, the ID
+    it declares and, for bundles, the SCDs it lists. A refresh walks the
+    roots and only re-reads files whose mtime or size changed, so repeated
+    runs cost one ``stat`` per file. The index is built on first lookup.
+    """
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        index_file: Path | None = None,
+        use_ignore_files: bool = True,
+    ):
+        """Initialize a workspace index.
+
+        Args:
+            roots: Directories to index (recursively)
+            index_file: File the index is loaded from and saved to (None to
+                keep it in memory only)
+            use_ignore_files: Honour .gitignore/.scsignore files in the roots
+        """
+        self.roots = [Path(root).resolve() for root in roots]
+        self.index_file = index_file
+        self.use_ignore_files = use_ignore_files
+        # path -> [mtime_ns, size, declared id, listed SCDs (bundles only)]
+        self._files: Dict[str, list] = {}
+        self._scd_paths: Dict[str, str] = {}
+        self._scd_bundles: Dict[str, List[str]] = {}
+        self._ready = False
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the files on disk.
+
+        Returns:
+            Number of files that had to be (re)read
+        """
+        previous = self._load() if not self._ready else self._files
+        files: Dict[str, list] = {}
+        reread = 0
+        for root in self.roots:
+            for file_path in discover_scd_files(
+                root, recursive=True, use_ignore_files=self.use_ignore_files
+            ):
+                key = str(file_path)
+                if key in files:
+                    continue
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                entry = previous.get(key)
+                if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+                    entry = [st.st_mtime_ns, st.st_size, *self._read_entry(file_path)]
+                    reread += 1
+                files[key] = entry
+
+        changed = reread > 0 or len(files) != len(previous)
+        self._files = files
+        self._rebuild_lookups()
+        self._ready = True
+        if changed:
+            self._save()
+        return reread
+
+    def get(self, scd_id: str) -> Path | None:
+        """Look up the file defining an SCD.
+
+        Args:
+            scd_id: SCD ID
+
+        Returns:
+            Path of the SCD file, or None if no file in the workspace declares it
+        """
+        self._ensure_ready()
+        path = self._scd_paths.get(scd_id)
+        return Path(path) if path is not None else None
+
+    def declared_ids(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (declared ID, path) for every indexed SCD and bundle file.
+
+        Uses the cached file table, so no file is read.
+
+        Yields:
+            (ID, file path) pairs in path order
+        """
+        self._ensure_ready()
+        for path, (_, _, declared_id, _) in sorted(self._files.items()):
+            if declared_id and declared_id.startswith(("scd:", "bundle:")):
+                yield declared_id, Path(path)
+
+    def bundles_for(self, scd_id: str) -> List[str]:
+        """List the bundles that include an SCD.
+
+        Args:
+            scd_id: SCD ID
+
+        Returns:
+            IDs of the bundles listing the SCD (empty if none)
+        """
+        self._ensure_ready()
+        return list(self._scd_bundles.get(scd_id, []))
+
+    def __contains__(self, scd_id: object) -> bool:
+        self._ensure_ready()
+        return scd_id in self._scd_paths
+
+    def __len__(self) -> int:
+        self._ensure_ready()
+        return len(self._scd_paths)
+
+    def _ensure_ready(self) -> None:
+        if not self._ready:
+            self.refresh()
+
+    @staticmethod
+    def _read_entry(file_path: Path) -> Tuple[str | None, List[str] | None]:
+        """Read a file's declared ID and, for bundles, its SCD list."""
+        declared_id = read_header_id(file_path)
+        if declared_id is None or not declared_id.startswith("bundle:"):
+            return declared_id, None
+        try:
+            bundle = _PARSER.load_bundle(file_path)
+        except ValidationError:
+            return declared_id, None
+        scds = bundle.get("scds") or []
+        return declared_id, [ref for ref in scds if isinstance(ref, str)]
+
+    def _rebuild_lookups(self) -> None:
+        """Derive the SCD -> path and SCD -> bundles maps from the file table."""
+        self._scd_paths = {}
+        self._scd_bundles = {}
+        for path, (_, _, declared_id, scds) in sorted(self._files.items()):
+            if not declared_id:
+                continue
+            if declared_id.startswith("scd:"):
+                self._scd_paths.setdefault(declared_id, path)
+            elif scds:
+                for scd_ref in scds:
+                    self._scd_bundles.setdefault(scd_ref, []).append(declared_id)
+
+    def _load(self) -> Dict[str, list]:
+        """Load the file table saved by a previous run (empty if unusable)."""
+        if self.index_file is None:
+            return {}
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("format") != _INDEX_FORMAT:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _save(self) -> None:
+        """Persist the file table if an index file is configured."""
+        if self.index_file is None or not self.index_file.parent.is_dir():
+            return
+        data = {"format": _INDEX_FORMAT, "files": self._files}
+        try:
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
@@ -1,32 +1,85 @@
 """Schema validation module for SCDs."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 import jsonschema
 from jsonschema import Draft202012Validator
 
+from .codes import CODES
 from .parser import Parser
+from .precheck import StructuralPrecheck
 from .utils import ValidationError, ValidationResult, get_tier_from_id, find_schema_file
 
 
 class SchemaValidator:
     """Validator for JSON Schema compliance."""
 
-    def __init__(self, schema_dir: Path):
+    # Finding rule for each JSON Schema keyword with a dedicated code
+    _ERROR_RULES = {
+        "required": "schema_required",
+        "pattern": "schema_pattern",
+        "type": "schema_type",
+        "const": "schema_const",
+        "minLength": "schema_min_length",
+    }
+
+    # Cache key for the bundle schema
+    _BUNDLE_KEY = "__bundle__"
+
+    def __init__(self, schema_dir: Path, fast: bool = False):
         """Initialize schema validator.
 
         Args:
             schema_dir: Root directory containing schema files
+            fast: Run a structural pre-check first and only run the full
+                JSON Schema validation when it fails (or for a sample of
+                documents that pass)
         """
         self.schema_dir = schema_dir
+        self.fast = fast
         self._schema_cache: Dict[str, Dict[str, Any]] = {}
+        self._validator_cache: Dict[str, Draft202012Validator] = {}
+        self._precheck_cache: Dict[str, StructuralPrecheck] = {}
 
     def validate_scd(
         self, scd: Dict[str, Any], file_path: str | None = None
     ) -> ValidationResult:
         """Validate an SCD against its tier-specific schema.
 
+        Args:
+            scd: SCD data as dictionary
+            file_path: Optional file path for error messages
+
+        Returns:
+            ValidationResult with errors if validation fails
+        """
+        return next(self.validate_many([(scd, file_path)]))
+
+    def validate_many(
+        self, documents: Iterable[Tuple[Dict[str, Any], str | None]]
+    ) -> Iterator[ValidationResult]:
+        """Validate many SCDs, yielding one result per document.
+
+        Documents are consumed lazily and results are yielded in input order,
+        so callers can stream documents through without holding them all.
+        Each tier's schema is compiled once and the compiled validator is
+        shared by every document of that tier.
+
+        Args:
+            documents: Iterable of (SCD data, optional file path) pairs
+
+        Returns:
+            Iterator of ValidationResult, one per document
+        """
+        for scd, file_path in documents:
+            yield self._validate_document(scd, file_path)
+
+    def _validate_document(
+        self, scd: Dict[str, Any], file_path: str | None
+    ) -> ValidationResult:
+        """Validate one SCD against its tier's compiled validator.
+
         Args:
             scd: SCD data as dictionary
             file_path: Optional file path for error messages
@@ -40,7 +93,11 @@ class SchemaValidator:
         scd_id = scd.get("id")
         if not scd_id:
             result.add_error(
-                ValidationError("Missing required field 'id'", file_path=file_path)
+                ValidationError(
+                    "Missing required field 'id'",
+                    file_path=file_path,
+                    code=CODES["missing_id"],
+                )
             )
             return result
 
@@ -52,32 +109,44 @@ class SchemaValidator:
                     f"Invalid SCD ID format: '{scd_id}'. Expected format: scd:<tier>:<name>",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["invalid_id_tier"],
                 )
             )
             return result
 
-        # Load schema for tier
+        # Fast path: skip full validation for structurally sound documents
+        if self.fast and self._passes_precheck(tier, scd, scd_id):
+            result.details["tier"] = tier
+            result.details["scd_id"] = scd_id
+            return result
+
+        # Get the compiled validator for the tier
         try:
-            schema = self._load_schema(tier)
+            validator = self._get_validator(tier)
         except ValidationError as e:
+            e.code = CODES["schema_unavailable"]
             result.add_error(e)
             return result
 
         # Validate against schema
         try:
-            validator = Draft202012Validator(schema)
-            errors = list(validator.iter_errors(scd))
-
-            if errors:
-                for error in errors:
-                    error_msg = self._format_schema_error(error)
-                    result.add_error(
-                        ValidationError(error_msg, scd_id=scd_id, file_path=file_path)
+            for error in validator.iter_errors(scd):
+                result.add_error(
+                    ValidationError(
+                        self._format_schema_error(error),
+                        scd_id=scd_id,
+                        file_path=file_path,
+                        code=self._schema_error_code(error),
+                        location=self._schema_error_location(error),
                     )
+                )
         except Exception as e:
             result.add_error(
                 ValidationError(
-                    f"Schema validation failed: {e}", scd_id=scd_id, file_path=file_path
+                    f"Schema validation failed: {e}",
+                    scd_id=scd_id,
+                    file_path=file_path,
+                    code=CODES["schema_check_failed"],
                 )
             )
 
@@ -101,25 +170,36 @@ class SchemaValidator:
         """
         result = ValidationResult("bundle_schema")
 
-        # Load bundle schema
+        # Get the compiled bundle validator
         try:
-            schema = self._load_bundle_schema()
+            validator = self._get_validator(self._BUNDLE_KEY)
         except ValidationError as e:
+            e.code = CODES["schema_unavailable"]
             result.add_error(e)
             return result
 
         # Validate against schema
         try:
-            validator = Draft202012Validator(schema)
             errors = list(validator.iter_errors(bundle))
 
             if errors:
                 for error in errors:
                     error_msg = self._format_schema_error(error)
-                    result.add_error(ValidationError(error_msg, file_path=file_path))
+                    result.add_error(
+                        ValidationError(
+                            error_msg,
+                            file_path=file_path,
+                            code=self._schema_error_code(error),
+                            location=self._schema_error_location(error),
+                        )
+                    )
         except Exception as e:
             result.add_error(
-                ValidationError(f"Bundle schema validation failed: {e}", file_path=file_path)
+                ValidationError(
+                    f"Bundle schema validation failed: {e}",
+                    file_path=file_path,
+                    code=CODES["schema_check_failed"],
+                )
             )
 
         if result.passed:
@@ -128,6 +208,49 @@ class SchemaValidator:
 
         return result
 
+    def _get_validator(self, key: str) -> Draft202012Validator:
+        """Get the compiled validator for a tier or the bundle schema (with caching).
+
+        Args:
+            key: Tier name, or ``_BUNDLE_KEY`` for the bundle schema
+
+        Returns:
+            Compiled JSON Schema validator
+
+        Raises:
+            ValidationError: If the schema cannot be loaded
+        """
+        validator = self._validator_cache.get(key)
+        if validator is None:
+            if key == self._BUNDLE_KEY:
+                schema = self._load_bundle_schema()
+            else:
+                schema = self._load_schema(key)
+            validator = Draft202012Validator(schema)
+            self._validator_cache[key] = validator
+        return validator
+
+    def _passes_precheck(self, tier: str, scd: Dict[str, Any], scd_id: str) -> bool:
+        """Check whether a document can skip full schema validation.
+
+        Args:
+            tier: Tier name
+            scd: SCD data as dictionary
+            scd_id: SCD ID
+
+        Returns:
+            True if the pre-check passes and the document isn't sampled
+        """
+        precheck = self._precheck_cache.get(tier)
+        if precheck is None:
+            try:
+                precheck = StructuralPrecheck(self._load_schema(tier))
+            except ValidationError:
+                # Let the full path report the missing schema
+                return False
+            self._precheck_cache[tier] = precheck
+        return precheck.passes(scd) and not precheck.sampled(scd_id)
+
     def _load_schema(self, tier: str) -> Dict[str, Any]:
         """Load schema for a specific tier (with caching).
 
@@ -162,7 +285,7 @@ class SchemaValidator:
         Raises:
             ValidationError: If schema cannot be loaded
         """
-        cache_key = "__bundle__"
+        cache_key = self._BUNDLE_KEY
         if cache_key in self._schema_cache:
             return self._schema_cache[cache_key]
 
@@ -205,3 +328,33 @@ class SchemaValidator:
             return f"Field '{path}' is too short: {error.message}"
         else:
             return f"Field '{path}': {error.message}"
+
+    @staticmethod
+    def _schema_error_code(error: jsonschema.ValidationError) -> str:
+        """Map a JSON Schema validation error to its finding code.
+
+        Args:
+            error: JSON Schema validation error
+
+        Returns:
+            Finding code
+        """
+        rule = SchemaValidator._ERROR_RULES.get(str(error.validator), "schema_violation")
+        return CODES[rule]
+
+    @staticmethod
+    def _schema_error_location(error: jsonschema.ValidationError) -> str:
+        """Get a stable location for a JSON Schema validation error.
+
+        Args:
+            error: JSON Schema validation error
+
+        Returns:
+            Instance path plus the failing keyword (and missing field for 'required')
+        """
+        path = "/".join(str(p) for p in error.absolute_path)
+        location = f"{path}#{error.validator}"
+        if error.validator == "required" and "'" in error.message:
+            missing_field = error.message.split("'")[1]
+            location += f":{missing_field}"
+        return location
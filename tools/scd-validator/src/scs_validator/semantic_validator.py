@@ -2,12 +2,61 @@
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict
 
 import semver
 
+from .codes import CODES
+from .model import SCDRecord, as_record
 from .rules_loader import RulesLoader
-from .utils import ValidationError, ValidationResult, ValidationWarning, get_tier_from_id
+from .utils import ValidationError, ValidationResult, ValidationWarning
+
+# Version pattern shipped in scd-rules.yaml; matched without a regex
+DEFAULT_VERSION_PATTERN = r"^(\d+\.\d+\.\d+|DRAFT)$"
+
+# Distinct version strings and timestamps remembered between SCDs
+PARSE_CACHE_SIZE = 4096
+
+
+def is_version_or_draft(version: str) -> bool:
+    """Check a version against ``DEFAULT_VERSION_PATTERN`` without a regex.
+
+    Behaves exactly like ``re.match(DEFAULT_VERSION_PATTERN, version)``,
+    including ``$`` accepting a single trailing newline.
+
+    Args:
+        version: Version string
+
+    Returns:
+        True if the version is DRAFT or X.Y.Z
+    """
+    if version.endswith("\n"):
+        version = version[:-1]
+    if version == "DRAFT":
+        return True
+    parts = version.split(".")
+    return len(parts) == 3 and all(part.isdecimal() for part in parts)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _semver_error(version: str) -> str | None:
+    """Parse a version as semver, returning the error text (None if valid)."""
+    try:
+        semver.VersionInfo.parse(version)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _timestamp_error(timestamp: Any) -> str | None:
+    """Parse an ISO8601 timestamp, returning the error text (None if valid)."""
+    try:
+        datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except (ValueError, AttributeError) as e:
+        return str(e)
+    return None
 
 
 class SemanticValidator:
@@ -22,50 +71,51 @@ class SemanticValidator:
         self.rules_loader = rules_loader
         self.rules = rules_loader.load_scd_rules()
 
-    def validate_scd(self, scd: Dict[str, Any], file_path: str | None = None) -> ValidationResult:
+    def validate_scd(
+        self, scd: SCDRecord | Dict[str, Any], file_path: str | None = None
+    ) -> ValidationResult:
         """Validate semantic consistency of an SCD.
 
         Args:
-            scd: SCD data as dictionary
+            scd: SCD record (raw SCD dictionaries are converted)
             file_path: Optional file path for error messages
 
         Returns:
             ValidationResult with errors and warnings
         """
         result = ValidationResult("semantic")
+        record = as_record(scd)
 
-        scd_id = scd.get("id", "unknown")
-        scd_type = scd.get("type")
+        scd_id = "unknown" if record.id is None else record.id
 
         # Validate type matches tier in ID
-        self._validate_type_tier_match(scd_id, scd_type, result, file_path)
+        self._validate_type_tier_match(scd_id, record.tier, record.type, result, file_path)
 
         # Validate version is valid semver or DRAFT
-        version = scd.get("version")
-        if version:
-            self._validate_version(version, scd_id, result, file_path)
+        if record.version:
+            self._validate_version(record.version, scd_id, result, file_path)
 
         # Validate provenance
-        provenance = scd.get("provenance", {})
+        provenance = record.data.get("provenance", {})
         self._validate_provenance(provenance, scd_id, result, file_path)
 
         # Validate ID format
         self._validate_id_format(scd_id, result, file_path)
 
         # Validate required string fields are not empty
-        self._validate_required_strings(scd, scd_id, result, file_path)
+        self._validate_required_strings(record.data, scd_id, result, file_path)
 
         return result
 
     def _validate_type_tier_match(
         self,
         scd_id: str,
+        tier: str | None,
         scd_type: str | None,
         result: ValidationResult,
         file_path: str | None,
     ) -> None:
         """Validate that type field matches tier in ID."""
-        tier = get_tier_from_id(scd_id)
         if not tier:
             # Already caught by schema validation
             return
@@ -76,6 +126,7 @@ class SemanticValidator:
                     "Missing 'type' field",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["missing_type"],
                 )
             )
             return
@@ -86,6 +137,7 @@ class SemanticValidator:
                     f"Type '{scd_type}' does not match tier '{tier}' in ID '{scd_id}'",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["type_tier_mismatch"],
                 )
             )
 
@@ -96,7 +148,11 @@ class SemanticValidator:
         # Check against version pattern from rules
         version_pattern = self.rules.get("version_pattern", {}).get("pattern")
         if version_pattern:
-            if not re.match(version_pattern, version):
+            if version_pattern == DEFAULT_VERSION_PATTERN and isinstance(version, str):
+                matched = is_version_or_draft(version)
+            else:
+                matched = re.match(version_pattern, version) is not None
+            if not matched:
                 error_msg = self.rules_loader.get_error_message(
                     self.rules,
                     "invalid_version_format",
@@ -104,20 +160,25 @@ class SemanticValidator:
                     pattern=version_pattern,
                 )
                 result.add_error(
-                    ValidationError(error_msg, scd_id=scd_id, file_path=file_path)
+                    ValidationError(
+                        error_msg,
+                        scd_id=scd_id,
+                        file_path=file_path,
+                        code=CODES["invalid_version_format"],
+                    )
                 )
                 return
 
         # If not DRAFT, validate as semver
         if version != "DRAFT":
-            try:
-                semver.VersionInfo.parse(version)
-            except ValueError as e:
+            error = _semver_error(version)
+            if error is not None:
                 result.add_error(
                     ValidationError(
-                        f"Version '{version}' is not valid semantic versioning: {e}",
+                        f"Version '{version}' is not valid semantic versioning: {error}",
                         scd_id=scd_id,
                         file_path=file_path,
+                        code=CODES["invalid_semver"],
                     )
                 )
 
@@ -136,6 +197,7 @@ class SemanticValidator:
                     level="semantic",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["empty_provenance"],
                 )
             )
             return
@@ -148,6 +210,7 @@ class SemanticValidator:
                     "Provenance 'created_by' is required and must not be empty",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["missing_created_by"],
                 )
             )
 
@@ -174,6 +237,7 @@ class SemanticValidator:
                     level="semantic",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["missing_rationale"],
                 )
             )
 
@@ -182,14 +246,19 @@ class SemanticValidator:
         timestamp: str, field_name: str, scd_id: str, result: ValidationResult, file_path: str | None
     ) -> None:
         """Validate timestamp is ISO8601 format."""
-        try:
-            datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        except (ValueError, AttributeError) as e:
+        if isinstance(timestamp, str):
+            error = _timestamp_error(timestamp)
+        else:
+            # Non-strings may be unhashable; parse them without the cache
+            error = _timestamp_error.__wrapped__(timestamp)
+        if error is not None:
             result.add_error(
                 ValidationError(
-                    f"Provenance '{field_name}' is not valid ISO8601 format: {e}",
+                    f"Provenance '{field_name}' is not valid ISO8601 format: {error}",
                     scd_id=scd_id,
                     file_path=file_path,
+                    code=CODES["invalid_timestamp"],
+                    location=field_name,
                 )
             )
 
@@ -209,7 +278,12 @@ class SemanticValidator:
                 pattern=id_pattern,
             )
             result.add_error(
-                ValidationError(error_msg, scd_id=scd_id, file_path=file_path)
+                ValidationError(
+                    error_msg,
+                    scd_id=scd_id,
+                    file_path=file_path,
+                    code=CODES["invalid_id_format"],
+                )
             )
 
     def _validate_required_strings(
@@ -228,5 +302,7 @@ class SemanticValidator:
                             f"Field '{field}' must not be empty",
                             scd_id=scd_id,
                             file_path=file_path,
+                            code=CODES["empty_required_string"],
+                            location=field,
                         )
                     )
@@ -0,0 +1,90 @@
+"""Detection of SCD and bundle IDs declared by more than one file."""
+
+from pathlib import Path
+from typing import Container, Dict, Iterable, List, Tuple
+
+from .codes import CODES
+from .discovery import is_version_artifact
+from .utils import ValidationError, ValidationResult
+
+
+class DuplicateIdDetector:
+    """Finds IDs declared by more than one file.
+
+    IDs are fed in one at a time as files are read, so detection needs a
+    single pass and one dictionary entry per ID.
+    """
+
+    def __init__(self):
+        """Initialize an empty detector."""
+        self._paths: Dict[str, List[str]] = {}
+
+    def add(self, declared_id: str | None, file_path: Path | str) -> None:
+        """Record that a file declares an ID.
+
+        Bundle IDs declared by version snapshots and manifests are ignored.
+
+        Args:
+            declared_id: ID declared by the file (None or non-string is ignored)
+            file_path: Path of the file
+        """
+        if not isinstance(declared_id, str) or not declared_id:
+            return
+        if declared_id.startswith("bundle:") and is_version_artifact(file_path):
+            return
+        paths = self._paths.setdefault(declared_id, [])
+        if str(file_path) not in paths:
+            paths.append(str(file_path))
+
+    def add_all(self, entries: Iterable[Tuple[str | None, Path | str]]) -> None:
+        """Record many (ID, file path) pairs.
+
+        Args:
+            entries: (declared ID, file path) pairs
+        """
+        for declared_id, file_path in entries:
+            self.add(declared_id, file_path)
+
+    def duplicates(self) -> Dict[str, List[str]]:
+        """Get every ID declared by more than one file.
+
+        Returns:
+            Mapping of ID to the files declaring it, in the order they were seen
+        """
+        return {
+            declared_id: paths
+            for declared_id, paths in self._paths.items()
+            if len(paths) > 1
+        }
+
+    def validate(self, scope: Container[str] | None = None) -> ValidationResult:
+        """Report every collision.
+
+        One error is reported per file declaring a duplicated ID, naming the
+        other files, so each location shows up in the report.
+
+        Args:
+            scope: Only report these IDs (default: every ID)
+
+        Returns:
+            ValidationResult with one error per colliding file
+        """
+        result = ValidationResult("uniqueness")
+        for declared_id, paths in self.duplicates().items():
+            if scope is not None and declared_id not in scope:
+                continue
+            kind = "Bundle" if declared_id.startswith("bundle:") else "SCD"
+            code = CODES["duplicate_bundle_id" if kind == "Bundle" else "duplicate_scd_id"]
+            for file_path in paths:
+                others = ", ".join(p for p in paths if p != file_path)
+                result.add_error(
+                    ValidationError(
+                        f"{kind} ID '{declared_id}' is also declared in {others}",
+                        scd_id=declared_id if kind == "SCD" else None,
+                        file_path=file_path,
+                        code=code,
+                        location=declared_id,
+                    )
+                )
+        result.details["ids_checked"] = len(self._paths)
+        return result
@@ -1,18 +1,35 @@
 """Utility functions for SCS Validator."""
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict
 
+from .codes import fingerprint
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
 
-    def __init__(self, message: str, scd_id: str | None = None, file_path: str | None = None):
+    def __init__(
+        self,
+        message: str,
+        scd_id: str | None = None,
+        file_path: str | None = None,
+        code: str | None = None,
+        location: str | None = None,
+    ):
         self.message = message
         self.scd_id = scd_id
         self.file_path = file_path
+        self.code = code
+        self.location = location
         super().__init__(self.format_message())
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable fingerprint of this finding (see codes.fingerprint), hashed once."""
+        return fingerprint(self.code, self.scd_id, self.file_path, self.location)
+
     def format_message(self) -> str:
         """Format the error message with context."""
         parts = []
@@ -28,12 +45,25 @@ class ValidationWarning:
     """Represents a validation warning."""
 
     def __init__(
-        self, message: str, level: str, scd_id: str | None = None, file_path: str | None = None
+        self,
+        message: str,
+        level: str,
+        scd_id: str | None = None,
+        file_path: str | None = None,
+        code: str | None = None,
+        location: str | None = None,
     ):
         self.message = message
         self.level = level
         self.scd_id = scd_id
         self.file_path = file_path
+        self.code = code
+        self.location = location
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable fingerprint of this finding (see codes.fingerprint), hashed once."""
+        return fingerprint(self.code, self.scd_id, self.file_path, self.location)
 
     def __str__(self) -> str:
         """String representation of warning."""
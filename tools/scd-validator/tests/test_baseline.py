@@ -0,0 +1,107 @@
+"""Tests for --baseline, --new-only and the last run they are compared against."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from scs_validator.commands.validate import validate
+
+SCHEMA_DIR = Path(__file__).resolve().parents[3] / "schema"
+
+# Missing description and provenance: reported as schema errors
+BROKEN_SCD = 'id: scd:project:{name}\ntype: project\nversion: "1.0.0"\ntitle: T\ncontent: {{}}\n'
+
+
+def _project(root: Path) -> Path:
+    (root / ".scs").mkdir(parents=True)
+    (root / "context").mkdir()
+    _write_scd(root, "first")
+    return root
+
+
+def _write_scd(root: Path, name: str) -> Path:
+    path = root / "context" / f"{name}.yaml"
+    path.write_text(BROKEN_SCD.format(name=name))
+    return path
+
+
+def _run(*args: str) -> dict:
+    result = CliRunner().invoke(
+        validate, ["-s", str(SCHEMA_DIR), "--no-color", "--output", "json", *args]
+    )
+    return json.loads(result.output)
+
+
+def _scd_ids(report: dict):
+    return {finding["scd_id"] for finding in report["errors"] + report["warnings"]}
+
+
+def test_only_new_only_and_save_last_run_record_the_last_run(tmp_path):
+    root = _project(tmp_path)
+    context = str(root / "context")
+    last_run = root / ".scs" / "last-validation.json"
+
+    baseline = tmp_path / "report.json"
+    baseline.write_text(json.dumps(_run("--dir", context)))
+    _run("--dir", context, "--baseline", str(baseline))
+    assert not last_run.exists()
+
+    _run("--dir", context, "--new-only")
+    assert last_run.is_file()
+
+    last_run.unlink()
+    _run("--dir", context, "--save-last-run")
+    assert last_run.is_file()
+
+
+def test_new_only_reports_findings_since_the_previous_new_only_run(tmp_path):
+    root = _project(tmp_path)
+    context = str(root / "context")
+
+    assert _scd_ids(_run("--dir", context, "--new-only")) == {"scd:project:first"}
+    assert _scd_ids(_run("--dir", context, "--new-only")) == set()
+
+    _write_scd(root, "second")
+    assert _scd_ids(_run("--dir", context, "--new-only")) == {"scd:project:second"}
+
+
+def test_baseline_hides_known_findings(tmp_path):
+    root = _project(tmp_path)
+    baseline = tmp_path / "report.json"
+    baseline.write_text(json.dumps(_run("--dir", str(root / "context"))))
+    _write_scd(root, "second")
+
+    report = _run("--dir", str(root / "context"), "--baseline", str(baseline))
+
+    assert _scd_ids(report) == {"scd:project:second"}
+
+
+def test_fingerprints_are_relative_to_the_project_root(tmp_path, monkeypatch):
+    root = _project(tmp_path / "project")
+    scd = root / "context" / "first.yaml"
+
+    monkeypatch.chdir(root)
+    from_root = _run("context/first.yaml")
+    monkeypatch.chdir(root / "context")
+    from_context = _run("first.yaml")
+    monkeypatch.chdir(tmp_path)
+    absolute = _run(str(scd))
+
+    fingerprints = [
+        sorted(finding["fingerprint"] for finding in report["errors"])
+        for report in (from_root, from_context, absolute)
+    ]
+    assert fingerprints[0] and fingerprints[0] == fingerprints[1] == fingerprints[2]
+
+
+def test_files_outside_the_project_do_not_touch_its_last_run(tmp_path, monkeypatch):
+    root = _project(tmp_path / "project")
+    outside = tmp_path / "elsewhere"
+    outside.mkdir()
+    (outside / "loose.yaml").write_text(BROKEN_SCD.format(name="loose"))
+    monkeypatch.chdir(root)
+
+    _run(str(outside / "loose.yaml"), "--new-only")
+
+    assert not (root / ".scs" / "last-validation.json").exists()
@@ -0,0 +1,69 @@
+"""Tests for which imported bundles a project bundle validation reaches."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from scs_validator.commands.validate import validate
+
+SCHEMA_DIR = Path(__file__).resolve().parents[3] / "schema"
+
+PROVENANCE = """provenance:
+  created_by: test@example.com
+  created_at: "2025-01-01T00:00:00Z"
+  rationale: test
+"""
+
+
+def _bundle(bundle_id: str, bundle_type: str, imports=(), scds=()) -> str:
+    return (
+        f"id: {bundle_id}\ntype: {bundle_type}\nversion: \"1.0.0\"\n"
+        f"title: {bundle_type.title()}\ndescription: {bundle_type} bundle\n"
+        f"imports: {json.dumps(list(imports))}\nscds: {json.dumps(list(scds))}\n"
+        + PROVENANCE
+    )
+
+
+def _project(root: Path) -> Path:
+    """Project -> domain -> concern, whose only SCD fails the schema"""
+    bundles = root / "bundles"
+    (bundles / "domains").mkdir(parents=True)
+    (bundles / "concerns").mkdir()
+    (root / "context" / "project").mkdir(parents=True)
+    (bundles / "project-bundle.yaml").write_text(
+        _bundle("bundle:proj", "project", imports=["bundle:dom:1.0.0"])
+    )
+    (bundles / "domains" / "dom.yaml").write_text(
+        _bundle("bundle:dom", "domain", imports=["bundle:con:1.0.0"])
+    )
+    (bundles / "concerns" / "con.yaml").write_text(
+        _bundle("bundle:con", "concern", scds=["scd:project:thing"])
+    )
+    (root / "context" / "project" / "thing.yaml").write_text(
+        "id: scd:project:thing\ntype: project\nversion: \"1.0.0\"\ntitle: Thing\n"
+        "description: An SCD whose relationships key is empty\n"
+        "content:\n  summary: thing\nrelationships:\n" + PROVENANCE
+    )
+    return bundles / "project-bundle.yaml"
+
+
+def _run(bundle: Path, *args: str):
+    return CliRunner().invoke(
+        validate,
+        ["-s", str(SCHEMA_DIR), "--no-color", "--output", "json", "--bundle", str(bundle), *args],
+    )
+
+
+def test_default_validates_only_directly_imported_domain_bundles(tmp_path):
+    result = _run(_project(tmp_path))
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["summary"]["total_errors"] == 0
+
+
+def test_follow_imports_reaches_concern_scds(tmp_path):
+    result = _run(_project(tmp_path), "--follow-imports")
+
+    assert result.exit_code == 1
+    assert "relationships" in result.output
@@ -0,0 +1,61 @@
+"""Tests for SCD discovery and the ignore files it honours."""
+
+from pathlib import Path
+
+from scs_validator.discovery import discover_scd_files
+
+
+def _tree(root: Path, files) -> None:
+    for name in files:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("id: scd:project:x\n")
+
+
+def _found(root: Path, **kwargs):
+    return sorted(
+        p.relative_to(root).as_posix()
+        for p in discover_scd_files(root, recursive=True, **kwargs)
+    )
+
+
+def test_walking_a_subdirectory_honours_ignore_files_above_it(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("generated/\n/context/local.yaml\n*.tmp.yaml\n")
+    _tree(tmp_path / "context", [
+        "a.yaml", "local.yaml", "b.tmp.yaml", "generated/c.yaml",
+        "sub/d.yaml", "sub/generated/e.yaml", "sub/local.yaml",
+    ])
+
+    assert _found(tmp_path) == ["context/a.yaml", "context/sub/d.yaml", "context/sub/local.yaml"]
+    assert _found(tmp_path / "context") == ["a.yaml", "sub/d.yaml", "sub/local.yaml"]
+    assert _found(tmp_path / "context" / "sub") == ["d.yaml", "local.yaml"]
+
+
+def test_negations_in_nearer_ignore_files_win(tmp_path):
+    (tmp_path / ".scs").mkdir()
+    (tmp_path / ".gitignore").write_text("*.json\n")
+    (tmp_path / "context").mkdir()
+    (tmp_path / "context" / ".gitignore").write_text("!keep.json\n")
+    _tree(tmp_path / "context" / "nested", ["keep.json", "drop.json", "a.yaml"])
+
+    assert _found(tmp_path / "context" / "nested") == ["a.yaml", "keep.json"]
+
+
+def test_ancestors_beyond_the_repository_root_are_not_read(tmp_path):
+    (tmp_path / ".gitignore").write_text("*.yaml\n")
+    repo = tmp_path / "repo"
+    (repo / ".git").mkdir(parents=True)
+    _tree(repo / "context", ["a.yaml"])
+
+    assert _found(repo / "context") == ["a.yaml"]
+    assert _found(repo / "context", use_ignore_files=False) == ["a.yaml"]
+
+
+def test_the_walk_root_itself_is_not_ignored(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("build/\n")
+    _tree(tmp_path / "build", ["a.yaml"])
+
+    assert _found(tmp_path / "build") == ["a.yaml"]
+    assert _found(tmp_path) == []
@@ -0,0 +1,121 @@
+"""Tests for the parse limits applied while loading files and streams."""
+
+import io
+import json
+import sys
+
+import pytest
+
+from scs_validator.parser import ParseLimits, Parser
+from scs_validator.utils import ValidationError
+
+BILLION_LAUGHS = "a: &a [x, x, x, x, x, x, x, x, x, x]\n" + "".join(
+    f"{chr(98 + i)}: &{chr(98 + i)} [{', '.join(['*' + chr(97 + i)] * 10)}]\n"
+    for i in range(8)
+)
+
+
+def _block(depth: int) -> str:
+    return "".join(f"{'  ' * level}k{level}:\n" for level in range(depth)) + "  " * depth + "v\n"
+
+
+def _flow(depth: int) -> str:
+    return "a: " + "[" * depth + "]" * depth + "\n"
+
+
+def _json(depth: int) -> str:
+    return '{"a": ' + "[" * depth + "]" * depth + "}"
+
+
+def _load(tmp_path, text: str, suffix: str = ".yaml", **limits):
+    path = tmp_path / f"doc{suffix}"
+    path.write_text(text, encoding="utf-8")
+    return Parser(ParseLimits(**limits)).load_scd(path)
+
+
+def _code(tmp_path, text: str, suffix: str = ".yaml", **limits) -> str:
+    with pytest.raises(ValidationError) as excinfo:
+        _load(tmp_path, text, suffix, **limits)
+    return excinfo.value.code
+
+
+@pytest.mark.parametrize("document", [_block(255), _flow(200)])
+def test_nesting_within_the_limit_loads(tmp_path, document):
+    assert _load(tmp_path, document)
+
+
+@pytest.mark.parametrize("document", [_block(300), _flow(300)])
+def test_nesting_past_the_limit_is_rejected(tmp_path, document):
+    assert _code(tmp_path, document) == "SYN008"
+
+
+def test_nesting_deeper_than_libyaml_can_compose_is_rejected(tmp_path):
+    assert _code(tmp_path, _flow(60_000), max_depth=0) == "SYN008"
+
+
+def test_brackets_inside_strings_are_not_nesting(tmp_path):
+    document = "a: " + json.dumps("[" * 1000 + "{" * 1000) + "\nb: x[y{z\n"
+
+    assert _load(tmp_path, document)["b"] == "x[y{z"
+
+
+def test_alias_expansion_limit(tmp_path):
+    assert _code(tmp_path, BILLION_LAUGHS) == "SYN007"
+    assert _load(tmp_path, BILLION_LAUGHS, max_alias_expansion=0)
+
+
+def test_file_size_limit(tmp_path):
+    assert _code(tmp_path, "a: 1\n" * 100, max_file_size=100) == "SYN006"
+
+
+def test_large_files_are_loaded_under_the_same_limits(tmp_path):
+    padding = "".join(f"key{i}: {'x' * 100}\n" for i in range(Parser.STREAM_THRESHOLD // 100))
+
+    assert len(_load(tmp_path, padding + "deep: 1\n")) > 1000
+    assert _code(tmp_path, padding + _flow(300)) == "SYN008"
+    assert _code(tmp_path, padding + BILLION_LAUGHS) == "SYN007"
+
+
+def test_recursion_limit_is_restored(tmp_path):
+    before = sys.getrecursionlimit()
+
+    _load(tmp_path, _block(255))
+    assert _load(tmp_path, _block(5000), max_depth=0)
+
+    assert sys.getrecursionlimit() == before
+
+
+def test_parse_timeout_is_off_by_default():
+    assert ParseLimits().parse_timeout is None
+
+
+@pytest.mark.parametrize(
+    "depth, code", [(200, None), (300, "SYN008"), (5000, "SYN008")]
+)
+def test_json_gets_the_nesting_limit(tmp_path, depth, code):
+    if code is None:
+        assert _load(tmp_path, _json(depth), ".json")
+    else:
+        assert _code(tmp_path, _json(depth), ".json") == code
+
+
+def _stream(text: str, stream_format: str):
+    stream = io.BufferedReader(io.BytesIO(text.encode()))
+    return list(Parser().iter_stream(stream, "stdin", stream_format))
+
+
+def test_yaml_stream_documents_are_limited_one_by_one():
+    documents = _stream(
+        "id: first\n---\n" + BILLION_LAUGHS + "---\nid: third\n---\n" + _flow(300), "yaml"
+    )
+
+    assert [d.data and d.data["id"] for d in documents[::2]] == ["first", "third"]
+    assert documents[1].error.code == "SYN007"
+    assert documents[3].error.code == "SYN008"
+
+
+def test_ndjson_documents_are_limited_one_by_one():
+    documents = _stream('{"id": "first"}\n' + _json(300) + '\n{"id": "third"}\n', "ndjson")
+
+    assert [d.data["id"] for d in (documents[0], documents[2])] == ["first", "third"]
+    assert documents[1].error.code == "SYN008"
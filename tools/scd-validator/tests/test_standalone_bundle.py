@@ -0,0 +1,85 @@
+"""Tests for validating a concern bundle on its own, in and outside a workspace."""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from scs_validator.commands.validate import validate
+
+SCHEMA_DIR = Path(__file__).resolve().parents[3] / "schema"
+
+PROVENANCE = """provenance:
+  created_by: test@example.com
+  created_at: "2025-01-01T00:00:00Z"
+  rationale: test
+"""
+
+
+def _scd(name: str, target: str) -> str:
+    return (
+        f"id: scd:project:{name}\ntype: project\nversion: \"1.0.0\"\ntitle: {name.title()}\n"
+        f"description: An SCD named {name}\ncontent:\n  summary: {name}\n"
+        f"relationships:\n  - type: depends-on\n    target: {target}\n" + PROVENANCE
+    )
+
+
+def _project(root: Path, target: str) -> Path:
+    """A concern bundle whose only SCD depends on ``target``"""
+    (root / "bundles" / "concerns").mkdir(parents=True)
+    (root / "context" / "project").mkdir(parents=True)
+    (root / "context" / "project" / "thing.yaml").write_text(_scd("thing", target))
+    (root / "context" / "project" / "other.yaml").write_text(
+        _scd("other", "scd:project:thing")
+    )
+    bundle = root / "bundles" / "concerns" / "con.yaml"
+    bundle.write_text(
+        'id: bundle:con\ntype: concern\nversion: "1.0.0"\ntitle: Concern\n'
+        'description: concern bundle\nimports: []\nscds: ["scd:project:thing"]\n' + PROVENANCE
+    )
+    return bundle
+
+
+def _findings(bundle: Path):
+    result = CliRunner().invoke(
+        validate, ["-s", str(SCHEMA_DIR), "--no-color", "--output", "json", "--bundle", str(bundle)]
+    )
+    report = json.loads(result.output)
+    assert result.exit_code == 0, report
+    assert report["summary"]["total_errors"] == 0
+    return [warning["code"] for warning in report["warnings"]]
+
+
+def test_outside_a_workspace_missing_targets_stay_warnings(tmp_path):
+    bundle = _project(tmp_path, "scd:project:missing")
+
+    assert "REL002" in _findings(bundle)
+    assert not (tmp_path / ".scs").exists()
+
+
+def test_inside_a_workspace_targets_are_looked_up_in_the_index(tmp_path):
+    for name in ("a", "b"):
+        (tmp_path / name / ".scs").mkdir(parents=True)
+
+    assert "REL009" in _findings(_project(tmp_path / "a", "scd:project:missing"))
+    assert not _findings(_project(tmp_path / "b", "scd:project:other"))
+    assert (tmp_path / "b" / ".scs" / "scd-index.json").exists()
+
+
+def test_only_duplicates_the_bundle_reaches_fail_it(tmp_path):
+    (tmp_path / ".scs").mkdir()
+    bundle = _project(tmp_path, "scd:project:other")
+    stray = tmp_path / "elsewhere"
+    stray.mkdir()
+    for name in ("one", "two"):
+        (stray / f"{name}.yaml").write_text(_scd("stray", "scd:project:thing"))
+
+    assert not _findings(bundle)
+
+    (stray / "three.yaml").write_text(_scd("thing", "scd:project:other"))
+    result = CliRunner().invoke(
+        validate, ["-s", str(SCHEMA_DIR), "--no-color", "--output", "json", "--bundle", str(bundle)]
+    )
+
+    assert result.exit_code == 1
+    assert {e["code"] for e in json.loads(result.output)["errors"]} == {"DUP001"}